@@ -1,6 +1,73 @@
 import json
 import os
-from typing import Dict, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _compile(*patterns: str) -> Tuple[re.Pattern, ...]:
+    """Compiles a field's patterns once at import, in priority order."""
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+# Mock-parser patterns per field, matched against lowercased text.
+# The first pattern that matches wins.
+# "annual base salary" and "starting annual base salary" also match the
+# first pattern, so they need no entries of their own.
+_BASE_SALARY_PATTERNS = _compile(
+    r'base salary[:\s]+\$([0-9,]+)',
+    r'annual salary[:\s]+\$([0-9,]+)',
+    r'salary of[:\s]+\$([0-9,]+)',
+    r'salary will be \$([0-9,]+)',
+)
+
+_SIGN_ON_BONUS_PATTERNS = _compile(
+    r'sign[- ]?on bonus[:\s]+\$([0-9,]+)',
+    r'signing bonus[:\s]+\$([0-9,]+)',
+)
+
+_BONUS_PERCENT_PATTERNS = _compile(
+    r'annual bonus[:\s]+([0-9]+)%',
+    r'target bonus[:\s]+([0-9]+)%',
+    r'bonus target[:\s]+([0-9]+)%',
+    r'incentive target[:\s]+([0-9]+)%',
+    r'performance bonus[:\s]+([0-9]+)%',
+)
+
+_BONUS_AMOUNT_PATTERNS = _compile(
+    r'annual bonus[:\s]+\$([0-9,]+)',
+    r'target bonus[:\s]+\$([0-9,]+)',
+    r'bonus target[:\s]+\$([0-9,]+)',
+    r'performance bonus[:\s]+\$([0-9,]+)',
+    r'incentive bonus[:\s]+\$([0-9,]+)',
+    r'bonus opportunity[:\s]+\$([0-9,]+)',
+)
+
+_EQUITY_GRANT_PATTERNS = _compile(
+    r'equity grant[:\s]+\$?([0-9,]+)',
+    r'rsu grant[:\s]+\$?([0-9,]+)',
+    r'stock grant[:\s]+\$?([0-9,]+)',
+    r'equity package[:\s]+\$?([0-9,]+)',
+)
+
+# Fields read as a plain number from the first matching pattern, in
+# extraction order
+_FIELD_PATTERNS = {
+    "base_salary": _BASE_SALARY_PATTERNS,
+    "sign_on_bonus": _SIGN_ON_BONUS_PATTERNS,
+    "annual_bonus_percent": _BONUS_PERCENT_PATTERNS,
+    "annual_bonus_amount": _BONUS_AMOUNT_PATTERNS,
+    "equity_grant": _EQUITY_GRANT_PATTERNS,
+}
+
+# "equity grant: N rsus" also matches the first pattern.
+# The lookbehind anchors each match to the start of a digit run; without
+# it a long run not followed by "rsus"/"shares" is rescanned from every
+# position, which is quadratic in the run length.
+_EQUITY_SHARES_PATTERNS = _compile(
+    r'(?<![0-9,])([0-9,]+)\s+rsus',
+    r'(?<![0-9,])([0-9,]+)\s+shares',
+)
 
 
 def parse_offer_text(text_block: str, api_key: Optional[str] = None) -> Dict[str, any]:
@@ -23,17 +90,58 @@ def parse_offer_text(text_block: str, api_key: Optional[str] = None) -> Dict[str
             - extracted_fields: list of field names successfully extracted
             - raw_text: str (original offer letter text)
     """
-    # Auto-load API key from environment if not provided
-    if not api_key:
-        api_key = os.getenv('OPENAI_API_KEY')
-    
-    if not api_key or api_key == "" or api_key == "your_openai_api_key_here":
+    api_key = _resolve_api_key(api_key)
+    if api_key is None:
         print("⚠️ No OpenAI API key found - using regex fallback")
         result = _mock_parse(text_block)
         result['raw_text'] = text_block
         return result
     
     print(f"✓ OpenAI API key found - attempting GPT-4 parsing...")
+    return _parse_with_ai(text_block, api_key)
+
+
+def parse_offer_texts(text_blocks: Iterable[str], api_key: Optional[str] = None) -> List[Dict[str, any]]:
+    """
+    Parse many offer letters at once, e.g. a batch job over stored offers.
+    The API key is resolved once for the whole batch. Without one, every
+    letter goes through the memoized regex parser, so repeated letters
+    are only parsed once.
+    
+    Args:
+        text_blocks: Raw offer letter texts
+        api_key: OpenAI API key (optional). If not provided, loads from .env
+        
+    Returns:
+        One result dict per letter, in input order, shaped as in parse_offer_text
+    """
+    api_key = _resolve_api_key(api_key)
+    if api_key is not None:
+        print(f"✓ OpenAI API key found - attempting GPT-4 parsing...")
+        return [_parse_with_ai(text_block, api_key) for text_block in text_blocks]
+    
+    print("⚠️ No OpenAI API key found - using regex fallback")
+    results = []
+    for text_block in text_blocks:
+        result = _mock_parse(text_block)
+        result['raw_text'] = text_block
+        results.append(result)
+    return results
+
+
+def _resolve_api_key(api_key: Optional[str]) -> Optional[str]:
+    """Returns the usable OpenAI API key, loading it from the environment if needed."""
+    # Auto-load API key from environment if not provided
+    if not api_key:
+        api_key = os.getenv('OPENAI_API_KEY')
+    
+    if not api_key or api_key == "your_openai_api_key_here":
+        return None
+    return api_key
+
+
+def _parse_with_ai(text_block: str, api_key: str) -> Dict[str, any]:
+    """AI parse of one letter, falling back to the regex parser on failure."""
     try:
         result = _ai_parse(text_block, api_key)
         result['raw_text'] = text_block
@@ -51,9 +159,15 @@ def _mock_parse(text_block: str) -> Dict[str, any]:
     """
     Mock parser for testing without API key.
     Uses simple keyword matching to extract numbers.
+    Parses are memoized per text; each call gets its own copy to mutate.
     """
-    import re
-    
+    result = _mock_parse_cached(text_block)
+    return {**result, "extracted_fields": list(result["extracted_fields"])}
+
+
+@lru_cache(maxsize=256)
+def _mock_parse_cached(text_block: str) -> Dict[str, any]:
+    """Memoized parse behind _mock_parse; callers must not mutate the result."""
     result = {
         "base_salary": 0,
         "sign_on_bonus": 0,
@@ -69,81 +183,16 @@ def _mock_parse(text_block: str) -> Dict[str, any]:
     
     text_lower = text_block.lower()
     
-    base_patterns = [
-        r'base salary[:\s]+\$([0-9,]+)',
-        r'annual base salary[:\s]+\$([0-9,]+)',
-        r'starting annual base salary[:\s]+\$([0-9,]+)',
-        r'annual salary[:\s]+\$([0-9,]+)',
-        r'salary of[:\s]+\$([0-9,]+)',
-        r'salary will be \$([0-9,]+)',
-    ]
-    for pattern in base_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            result["base_salary"] = float(match.group(1).replace(',', ''))
-            result["extracted_fields"].append("base_salary")
-            break
-    
-    bonus_patterns = [
-        r'sign[- ]?on bonus[:\s]+\$([0-9,]+)',
-        r'signing bonus[:\s]+\$([0-9,]+)',
-    ]
-    for pattern in bonus_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            result["sign_on_bonus"] = float(match.group(1).replace(',', ''))
-            result["extracted_fields"].append("sign_on_bonus")
-            break
-    
-    bonus_pct_patterns = [
-        r'annual bonus[:\s]+([0-9]+)%',
-        r'target bonus[:\s]+([0-9]+)%',
-        r'bonus target[:\s]+([0-9]+)%',
-        r'incentive target[:\s]+([0-9]+)%',
-        r'performance bonus[:\s]+([0-9]+)%',
-    ]
-    for pattern in bonus_pct_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            result["annual_bonus_percent"] = float(match.group(1))
-            result["extracted_fields"].append("annual_bonus_percent")
-            break
-
-    bonus_amt_patterns = [
-        r'annual bonus[:\s]+\$([0-9,]+)',
-        r'target bonus[:\s]+\$([0-9,]+)',
-        r'bonus target[:\s]+\$([0-9,]+)',
-        r'performance bonus[:\s]+\$([0-9,]+)',
-        r'incentive bonus[:\s]+\$([0-9,]+)',
-        r'bonus opportunity[:\s]+\$([0-9,]+)',
-    ]
-    for pattern in bonus_amt_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            result["annual_bonus_amount"] = float(match.group(1).replace(',', ''))
-            result["extracted_fields"].append("annual_bonus_amount")
-            break
-    
-    equity_patterns = [
-        r'equity grant[:\s]+\$?([0-9,]+)',
-        r'rsu grant[:\s]+\$?([0-9,]+)',
-        r'stock grant[:\s]+\$?([0-9,]+)',
-        r'equity package[:\s]+\$?([0-9,]+)',
-    ]
-    for pattern in equity_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            result["equity_grant"] = float(match.group(1).replace(',', ''))
-            result["extracted_fields"].append("equity_grant")
-            break
+    for field, patterns in _FIELD_PATTERNS.items():
+        for pattern in patterns:
+            match = pattern.search(text_lower)
+            if match:
+                result[field] = float(match.group(1).replace(',', ''))
+                result["extracted_fields"].append(field)
+                break
     
-    shares_patterns = [
-        r'([0-9,]+)\s+rsus',
-        r'([0-9,]+)\s+shares',
-        r'equity grant[:\s]+([0-9,]+)\s+rsus',
-    ]
-    for pattern in shares_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _EQUITY_SHARES_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             shares = int(match.group(1).replace(',', ''))
             result["equity_shares"] = shares
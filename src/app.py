@@ -8,40 +8,13 @@ sys.path.append(os.path.dirname(__file__))
 from engines.mil_engine import calculate_rmc
 from engines.civ_engine import calculate_civilian_net
 from engines.equity_engine import calculate_rsu_value, calculate_vesting_schedule, CompanyStage, STAGE_DISCOUNTS
+from engines.totals_engine import calculate_4yr_totals
 from engines.bah_engine import bah_fetcher
 from engines.db_engine import log_scenario
 from ai.parser import parse_offer_text
 from utils.formatters import format_currency, format_delta, annual_to_monthly
 from utils.charts import render_wealth_chart, generate_executive_summary
-from utils.design_system import get_streamlit_css, COLORS, SPACING
-
-
-def calculate_4yr_totals(mil_results: dict, civ_results: dict, equity_calc: dict) -> dict:
-    """
-    Calculate 4-year wealth totals for military and civilian paths.
-
-    Args:
-        mil_results: Military compensation results from calculate_rmc
-        civ_results: Civilian compensation results from calculate_civilian_net
-        equity_calc: Equity calculation results from calculate_rsu_value
-
-    Returns:
-        Dictionary with mil_4yr_total, civ_4yr_total, four_year_delta, tsp_match_annual
-    """
-    # Military: 48 months of compensation + 4 years of TSP match (5% of base pay)
-    tsp_match_annual = mil_results['base_pay_monthly'] * 0.05 * 12
-    mil_4yr_total = mil_results['total_monthly'] * 48 + (tsp_match_annual * 4)
-
-    # Civilian: 48 months of net pay + total risk-adjusted equity value
-    equity_value = equity_calc.get('adjusted_value', 0) if equity_calc else 0
-    civ_4yr_total = civ_results['net_monthly'] * 48 + equity_value
-
-    return {
-        'mil_4yr_total': mil_4yr_total,
-        'civ_4yr_total': civ_4yr_total,
-        'four_year_delta': civ_4yr_total - mil_4yr_total,
-        'tsp_match_annual': tsp_match_annual
-    }
+from utils.design_system import STREAMLIT_CSS, COLORS, SPACING
 
 
 st.set_page_config(
@@ -53,7 +26,7 @@ st.set_page_config(
 
 
 # Apply neumorphic design system
-st.markdown(get_streamlit_css(), unsafe_allow_html=True)
+st.markdown(STREAMLIT_CSS, unsafe_allow_html=True)
 
 
 with st.expander("Enter Offer Letter", expanded=False):
@@ -248,9 +221,9 @@ mil_results = calculate_rmc(
 # Calculate civilian results AFTER state and filing_status_civ are defined
 if total_equity > 0:
     equity_calc = calculate_rsu_value(total_equity, vesting_years, 0, is_public, company_stage)
-    annual_rsu = equity_calc['annualized_value']
+    annual_rsu = equity_calc.annualized_value
 else:
-    equity_calc = {'adjusted_value': 0, 'annualized_value': 0, 'risk_discount': 0, 'liquidity_note': 'No equity'}
+    equity_calc = calculate_rsu_value(0)
     annual_rsu = 0
 
 civ_results = calculate_civilian_net(
@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT support for the calculation engines.
+
+Numba is not a hard dependency. When it is installed, kernels decorated
+with ``njit`` are compiled to native code; otherwise ``njit`` is a no-op
+and the same kernels run as plain Python/NumPy.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
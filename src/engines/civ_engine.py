@@ -1,8 +1,17 @@
 import json
 import os
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional, Sequence
 
+import numpy as np
 
+from engines._jit import njit
+from engines.filing_status import SINGLE, MARRIED
+from engines.results import ResultMapping, result_record
+
+
+@lru_cache(maxsize=1)
 def load_tax_data() -> Dict:
     """
     Loads tax bracket data from JSON file.
@@ -15,7 +24,40 @@ def load_tax_data() -> Dict:
         return json.load(f)
 
 
-def calculate_federal_tax(gross_income: float, filing_status: str = "single") -> float:
+# Federal brackets as read-only (upper limit, rate) pairs per filing status
+_FEDERAL_BRACKETS = MappingProxyType({
+    status: tuple((b['max'], b['rate']) for b in brackets)
+    for status, brackets in load_tax_data()['federal'].items()
+})
+
+# Same brackets as parallel (upper limits, rates) arrays for the kernels
+_FEDERAL_BRACKETS_NP = MappingProxyType({
+    status: (
+        np.array([limit for limit, _ in brackets], dtype=np.float64),
+        np.array([rate for _, rate in brackets], dtype=np.float64),
+    )
+    for status, brackets in _FEDERAL_BRACKETS.items()
+})
+
+
+# 2025 federal standard deduction per filing status
+_STANDARD_DEDUCTIONS = MappingProxyType({SINGLE: 15750.0, MARRIED: 31500.0})
+
+
+@njit(cache=True)
+def _federal_tax_kernel(taxable_income, limits, rates):
+    """Sums tax over the brackets that taxable_income reaches."""
+    tax = 0.0
+    previous_limit = 0.0
+    for i in range(limits.size):
+        if taxable_income <= previous_limit:
+            break
+        tax += (min(taxable_income, limits[i]) - previous_limit) * rates[i]
+        previous_limit = limits[i]
+    return tax
+
+
+def calculate_federal_tax(gross_income: float, filing_status: str = SINGLE) -> float:
     """
     Calculates federal income tax using 2025 progressive tax brackets.
     
@@ -26,35 +68,631 @@ def calculate_federal_tax(gross_income: float, filing_status: str = "single") ->
     Returns:
         Federal tax amount
     """
-    tax_data = load_tax_data()
-    
-    standard_deduction = 15750 if filing_status.lower() == "single" else 31500
+    status = filing_status.lower()
+    standard_deduction = _STANDARD_DEDUCTIONS[status]
     taxable_income = max(0, gross_income - standard_deduction)
-    
-    brackets = tax_data['federal'][filing_status.lower()]
-    
-    fed_tax = 0
-    previous_limit = 0
-    
-    for bracket in brackets:
-        limit = bracket['max']
-        rate = bracket['rate']
-        
-        if taxable_income > previous_limit:
-            bracket_income = min(taxable_income, limit) - previous_limit
-            fed_tax += bracket_income * rate
-            previous_limit = limit
-        else:
+
+    limits, rates = _FEDERAL_BRACKETS_NP[status]
+    return float(_federal_tax_kernel(float(taxable_income), limits, rates))
+
+
+def calculate_federal_tax_batch(incomes: np.ndarray, filing_status: str = SINGLE) -> np.ndarray:
+    """
+    Vectorized calculate_federal_tax over an array of gross incomes.
+
+    Args:
+        incomes: Annual gross incomes
+        filing_status: "single" or "married", applied to every row
+
+    Returns:
+        Array of federal tax amounts
+    """
+    status = filing_status.lower()
+    standard_deduction = _STANDARD_DEDUCTIONS[status]
+    taxable_income = np.maximum(np.asarray(incomes, dtype=np.float64) - standard_deduction, 0.0)
+
+    limits, rates = _FEDERAL_BRACKETS_NP[status]
+    lowers = np.concatenate(([0.0], limits[:-1]))
+    in_bracket = np.minimum(taxable_income[:, None], limits) - lowers
+    return (in_bracket.clip(min=0) * rates).sum(axis=1)
+
+
+# States with no income tax (9 states)
+_NO_INCOME_TAX_STATES = frozenset(('TX', 'FL', 'WA', 'TN', 'NV', 'SD', 'WY', 'AK', 'NH'))
+
+# Flat tax states (2025 rates) - 13 states
+_FLAT_TAX_RATES = MappingProxyType({
+    'AZ': 0.025,   # Arizona
+    'CO': 0.044,   # Colorado
+    'GA': 0.0549,  # Georgia (transitioned to flat in 2024)
+    'ID': 0.058,   # Idaho
+    'IL': 0.0495,  # Illinois
+    'IN': 0.0305,  # Indiana (reduced in 2025)
+    'KY': 0.04,    # Kentucky
+    'MA': 0.05,    # Massachusetts
+    'MI': 0.0425,  # Michigan
+    'MS': 0.05,    # Mississippi
+    'NC': 0.0475,  # North Carolina
+    'ND': 0.0195,  # North Dakota (effectively flat for most)
+    'PA': 0.0307,  # Pennsylvania
+    'UT': 0.0465,  # Utah
+})
+
+
+def _freeze_brackets(tables: Dict) -> MappingProxyType:
+    """Turns {state: {status: [{'limit', 'rate'}, ...]}} into read-only (limit, rate) tuples."""
+    return MappingProxyType({
+        state: MappingProxyType({
+            status: tuple((b['limit'], b['rate']) for b in brackets)
+            for status, brackets in by_status.items()
+        })
+        for state, by_status in tables.items()
+    })
+
+
+# Progressive tax states (2025 brackets)
+_PROGRESSIVE_BRACKETS = _freeze_brackets({
+    'AL': {  # Alabama
+        'single': [
+            {'limit': 500, 'rate': 0.02},
+            {'limit': 3000, 'rate': 0.04},
+            {'limit': float('inf'), 'rate': 0.05}
+        ],
+        'married': [
+            {'limit': 1000, 'rate': 0.02},
+            {'limit': 6000, 'rate': 0.04},
+            {'limit': float('inf'), 'rate': 0.05}
+        ]
+    },
+    'AR': {  # Arkansas
+        'single': [
+            {'limit': 4400, 'rate': 0.02},
+            {'limit': 8800, 'rate': 0.04},
+            {'limit': float('inf'), 'rate': 0.039}
+        ],
+        'married': [
+            {'limit': 4400, 'rate': 0.02},
+            {'limit': 8800, 'rate': 0.04},
+            {'limit': float('inf'), 'rate': 0.039}
+        ]
+    },
+    'CA': {  # California
+        'single': [
+            {'limit': 10412, 'rate': 0.01},
+            {'limit': 24684, 'rate': 0.02},
+            {'limit': 38959, 'rate': 0.04},
+            {'limit': 54081, 'rate': 0.06},
+            {'limit': 68350, 'rate': 0.08},
+            {'limit': 349137, 'rate': 0.093},
+            {'limit': 418961, 'rate': 0.103},
+            {'limit': 698271, 'rate': 0.113},
+            {'limit': float('inf'), 'rate': 0.133}
+        ],
+        'married': [
+            {'limit': 20824, 'rate': 0.01},
+            {'limit': 49368, 'rate': 0.02},
+            {'limit': 77918, 'rate': 0.04},
+            {'limit': 108162, 'rate': 0.06},
+            {'limit': 136700, 'rate': 0.08},
+            {'limit': 698274, 'rate': 0.093},
+            {'limit': 837922, 'rate': 0.103},
+            {'limit': 1396542, 'rate': 0.113},
+            {'limit': float('inf'), 'rate': 0.133}
+        ]
+    },
+    'CT': {  # Connecticut
+        'single': [
+            {'limit': 10000, 'rate': 0.03},
+            {'limit': 50000, 'rate': 0.05},
+            {'limit': 100000, 'rate': 0.055},
+            {'limit': 200000, 'rate': 0.06},
+            {'limit': 250000, 'rate': 0.065},
+            {'limit': 500000, 'rate': 0.069},
+            {'limit': float('inf'), 'rate': 0.0699}
+        ],
+        'married': [
+            {'limit': 20000, 'rate': 0.03},
+            {'limit': 100000, 'rate': 0.05},
+            {'limit': 200000, 'rate': 0.055},
+            {'limit': 400000, 'rate': 0.06},
+            {'limit': 500000, 'rate': 0.065},
+            {'limit': 1000000, 'rate': 0.069},
+            {'limit': float('inf'), 'rate': 0.0699}
+        ]
+    },
+    'DE': {  # Delaware
+        'single': [
+            {'limit': 2000, 'rate': 0.0},
+            {'limit': 5000, 'rate': 0.022},
+            {'limit': 10000, 'rate': 0.039},
+            {'limit': 20000, 'rate': 0.048},
+            {'limit': 25000, 'rate': 0.052},
+            {'limit': 60000, 'rate': 0.0555},
+            {'limit': float('inf'), 'rate': 0.066}
+        ],
+        'married': [
+            {'limit': 2000, 'rate': 0.0},
+            {'limit': 5000, 'rate': 0.022},
+            {'limit': 10000, 'rate': 0.039},
+            {'limit': 20000, 'rate': 0.048},
+            {'limit': 25000, 'rate': 0.052},
+            {'limit': 60000, 'rate': 0.0555},
+            {'limit': float('inf'), 'rate': 0.066}
+        ]
+    },
+    'DC': {  # District of Columbia
+        'single': [
+            {'limit': 10000, 'rate': 0.04},
+            {'limit': 40000, 'rate': 0.06},
+            {'limit': 60000, 'rate': 0.065},
+            {'limit': 250000, 'rate': 0.085},
+            {'limit': 500000, 'rate': 0.0925},
+            {'limit': 1000000, 'rate': 0.0975},
+            {'limit': float('inf'), 'rate': 0.1075}
+        ],
+        'married': [
+            {'limit': 10000, 'rate': 0.04},
+            {'limit': 40000, 'rate': 0.06},
+            {'limit': 60000, 'rate': 0.065},
+            {'limit': 250000, 'rate': 0.085},
+            {'limit': 500000, 'rate': 0.0925},
+            {'limit': 1000000, 'rate': 0.0975},
+            {'limit': float('inf'), 'rate': 0.1075}
+        ]
+    },
+    'HI': {  # Hawaii
+        'single': [
+            {'limit': 2400, 'rate': 0.014},
+            {'limit': 4800, 'rate': 0.032},
+            {'limit': 9600, 'rate': 0.055},
+            {'limit': 14400, 'rate': 0.064},
+            {'limit': 19200, 'rate': 0.068},
+            {'limit': 24000, 'rate': 0.072},
+            {'limit': 36000, 'rate': 0.076},
+            {'limit': 48000, 'rate': 0.079},
+            {'limit': 150000, 'rate': 0.0825},
+            {'limit': 175000, 'rate': 0.09},
+            {'limit': 200000, 'rate': 0.10},
+            {'limit': float('inf'), 'rate': 0.11}
+        ],
+        'married': [
+            {'limit': 4800, 'rate': 0.014},
+            {'limit': 9600, 'rate': 0.032},
+            {'limit': 19200, 'rate': 0.055},
+            {'limit': 28800, 'rate': 0.064},
+            {'limit': 38400, 'rate': 0.068},
+            {'limit': 48000, 'rate': 0.072},
+            {'limit': 72000, 'rate': 0.076},
+            {'limit': 96000, 'rate': 0.079},
+            {'limit': 300000, 'rate': 0.0825},
+            {'limit': 350000, 'rate': 0.09},
+            {'limit': 400000, 'rate': 0.10},
+            {'limit': float('inf'), 'rate': 0.11}
+        ]
+    },
+    'IA': {  # Iowa
+        'single': [
+            {'limit': 6210, 'rate': 0.044},
+            {'limit': 31050, 'rate': 0.0482},
+            {'limit': float('inf'), 'rate': 0.057}
+        ],
+        'married': [
+            {'limit': 12420, 'rate': 0.044},
+            {'limit': 62100, 'rate': 0.0482},
+            {'limit': float('inf'), 'rate': 0.057}
+        ]
+    },
+    'KS': {  # Kansas
+        'single': [
+            {'limit': 15000, 'rate': 0.031},
+            {'limit': 30000, 'rate': 0.0525},
+            {'limit': float('inf'), 'rate': 0.057}
+        ],
+        'married': [
+            {'limit': 30000, 'rate': 0.031},
+            {'limit': 60000, 'rate': 0.0525},
+            {'limit': float('inf'), 'rate': 0.057}
+        ]
+    },
+    'LA': {  # Louisiana
+        'single': [
+            {'limit': 12500, 'rate': 0.0185},
+            {'limit': 50000, 'rate': 0.035},
+            {'limit': float('inf'), 'rate': 0.0425}
+        ],
+        'married': [
+            {'limit': 25000, 'rate': 0.0185},
+            {'limit': 100000, 'rate': 0.035},
+            {'limit': float('inf'), 'rate': 0.0425}
+        ]
+    },
+    'ME': {  # Maine
+        'single': [
+            {'limit': 24500, 'rate': 0.058},
+            {'limit': 58050, 'rate': 0.0675},
+            {'limit': float('inf'), 'rate': 0.0715}
+        ],
+        'married': [
+            {'limit': 49050, 'rate': 0.058},
+            {'limit': 116100, 'rate': 0.0675},
+            {'limit': float('inf'), 'rate': 0.0715}
+        ]
+    },
+    'MD': {  # Maryland
+        'single': [
+            {'limit': 1000, 'rate': 0.02},
+            {'limit': 2000, 'rate': 0.03},
+            {'limit': 3000, 'rate': 0.04},
+            {'limit': 100000, 'rate': 0.0475},
+            {'limit': 125000, 'rate': 0.05},
+            {'limit': 150000, 'rate': 0.0525},
+            {'limit': 250000, 'rate': 0.055},
+            {'limit': float('inf'), 'rate': 0.0575}
+        ],
+        'married': [
+            {'limit': 1000, 'rate': 0.02},
+            {'limit': 2000, 'rate': 0.03},
+            {'limit': 3000, 'rate': 0.04},
+            {'limit': 150000, 'rate': 0.0475},
+            {'limit': 175000, 'rate': 0.05},
+            {'limit': 225000, 'rate': 0.0525},
+            {'limit': 300000, 'rate': 0.055},
+            {'limit': float('inf'), 'rate': 0.0575}
+        ]
+    },
+    'MN': {  # Minnesota
+        'single': [
+            {'limit': 31690, 'rate': 0.0535},
+            {'limit': 104090, 'rate': 0.068},
+            {'limit': 193240, 'rate': 0.0785},
+            {'limit': float('inf'), 'rate': 0.0985}
+        ],
+        'married': [
+            {'limit': 46330, 'rate': 0.0535},
+            {'limit': 184040, 'rate': 0.068},
+            {'limit': 321450, 'rate': 0.0785},
+            {'limit': float('inf'), 'rate': 0.0985}
+        ]
+    },
+    'MO': {  # Missouri
+        'single': [
+            {'limit': 1207, 'rate': 0.02},
+            {'limit': 2414, 'rate': 0.025},
+            {'limit': 3621, 'rate': 0.03},
+            {'limit': 4828, 'rate': 0.035},
+            {'limit': 6035, 'rate': 0.04},
+            {'limit': 7242, 'rate': 0.045},
+            {'limit': 8449, 'rate': 0.05},
+            {'limit': float('inf'), 'rate': 0.0495}
+        ],
+        'married': [
+            {'limit': 1207, 'rate': 0.02},
+            {'limit': 2414, 'rate': 0.025},
+            {'limit': 3621, 'rate': 0.03},
+            {'limit': 4828, 'rate': 0.035},
+            {'limit': 6035, 'rate': 0.04},
+            {'limit': 7242, 'rate': 0.045},
+            {'limit': 8449, 'rate': 0.05},
+            {'limit': float('inf'), 'rate': 0.0495}
+        ]
+    },
+    'MT': {  # Montana
+        'single': [
+            {'limit': 20500, 'rate': 0.047},
+            {'limit': float('inf'), 'rate': 0.059}
+        ],
+        'married': [
+            {'limit': 41000, 'rate': 0.047},
+            {'limit': float('inf'), 'rate': 0.059}
+        ]
+    },
+    'NE': {  # Nebraska
+        'single': [
+            {'limit': 3700, 'rate': 0.0246},
+            {'limit': 22170, 'rate': 0.0351},
+            {'limit': 35730, 'rate': 0.0501},
+            {'limit': float('inf'), 'rate': 0.0584}
+        ],
+        'married': [
+            {'limit': 7390, 'rate': 0.0246},
+            {'limit': 44350, 'rate': 0.0351},
+            {'limit': 71460, 'rate': 0.0501},
+            {'limit': float('inf'), 'rate': 0.0584}
+        ]
+    },
+    'NJ': {  # New Jersey
+        'single': [
+            {'limit': 20000, 'rate': 0.014},
+            {'limit': 35000, 'rate': 0.0175},
+            {'limit': 40000, 'rate': 0.035},
+            {'limit': 75000, 'rate': 0.05525},
+            {'limit': 500000, 'rate': 0.0637},
+            {'limit': 1000000, 'rate': 0.0897},
+            {'limit': float('inf'), 'rate': 0.1075}
+        ],
+        'married': [
+            {'limit': 20000, 'rate': 0.014},
+            {'limit': 50000, 'rate': 0.0175},
+            {'limit': 70000, 'rate': 0.0245},
+            {'limit': 80000, 'rate': 0.035},
+            {'limit': 150000, 'rate': 0.05525},
+            {'limit': 500000, 'rate': 0.0637},
+            {'limit': 1000000, 'rate': 0.0897},
+            {'limit': float('inf'), 'rate': 0.1075}
+        ]
+    },
+    'NM': {  # New Mexico
+        'single': [
+            {'limit': 5500, 'rate': 0.017},
+            {'limit': 11000, 'rate': 0.032},
+            {'limit': 16000, 'rate': 0.047},
+            {'limit': 210000, 'rate': 0.049},
+            {'limit': float('inf'), 'rate': 0.059}
+        ],
+        'married': [
+            {'limit': 8000, 'rate': 0.017},
+            {'limit': 16000, 'rate': 0.032},
+            {'limit': 24000, 'rate': 0.047},
+            {'limit': 315000, 'rate': 0.049},
+            {'limit': float('inf'), 'rate': 0.059}
+        ]
+    },
+    'NY': {  # New York
+        'single': [
+            {'limit': 8500, 'rate': 0.04},
+            {'limit': 11700, 'rate': 0.045},
+            {'limit': 13900, 'rate': 0.0525},
+            {'limit': 80650, 'rate': 0.055},
+            {'limit': 215400, 'rate': 0.06},
+            {'limit': 1077550, 'rate': 0.0685},
+            {'limit': 5000000, 'rate': 0.0965},
+            {'limit': 25000000, 'rate': 0.103},
+            {'limit': float('inf'), 'rate': 0.109}
+        ],
+        'married': [
+            {'limit': 17150, 'rate': 0.04},
+            {'limit': 23600, 'rate': 0.045},
+            {'limit': 27900, 'rate': 0.0525},
+            {'limit': 161550, 'rate': 0.055},
+            {'limit': 323200, 'rate': 0.06},
+            {'limit': 2155350, 'rate': 0.0685},
+            {'limit': 5000000, 'rate': 0.0965},
+            {'limit': 25000000, 'rate': 0.103},
+            {'limit': float('inf'), 'rate': 0.109}
+        ]
+    },
+    'OH': {  # Ohio
+        'single': [
+            {'limit': 26050, 'rate': 0.0},
+            {'limit': 100000, 'rate': 0.02765},
+            {'limit': float('inf'), 'rate': 0.035}
+        ],
+        'married': [
+            {'limit': 26050, 'rate': 0.0},
+            {'limit': 100000, 'rate': 0.02765},
+            {'limit': float('inf'), 'rate': 0.035}
+        ]
+    },
+    'OK': {  # Oklahoma
+        'single': [
+            {'limit': 1000, 'rate': 0.0025},
+            {'limit': 2500, 'rate': 0.0075},
+            {'limit': 3750, 'rate': 0.0175},
+            {'limit': 4900, 'rate': 0.0275},
+            {'limit': 7200, 'rate': 0.0375},
+            {'limit': float('inf'), 'rate': 0.0475}
+        ],
+        'married': [
+            {'limit': 2000, 'rate': 0.0025},
+            {'limit': 5000, 'rate': 0.0075},
+            {'limit': 7500, 'rate': 0.0175},
+            {'limit': 9800, 'rate': 0.0275},
+            {'limit': 12200, 'rate': 0.0375},
+            {'limit': float('inf'), 'rate': 0.0475}
+        ]
+    },
+    'OR': {  # Oregon
+        'single': [
+            {'limit': 4050, 'rate': 0.0475},
+            {'limit': 10200, 'rate': 0.0675},
+            {'limit': 125000, 'rate': 0.0875},
+            {'limit': float('inf'), 'rate': 0.099}
+        ],
+        'married': [
+            {'limit': 8100, 'rate': 0.0475},
+            {'limit': 20400, 'rate': 0.0675},
+            {'limit': 250000, 'rate': 0.0875},
+            {'limit': float('inf'), 'rate': 0.099}
+        ]
+    },
+    'RI': {  # Rhode Island
+        'single': [
+            {'limit': 73450, 'rate': 0.0375},
+            {'limit': 166950, 'rate': 0.0475},
+            {'limit': float('inf'), 'rate': 0.0599}
+        ],
+        'married': [
+            {'limit': 73450, 'rate': 0.0375},
+            {'limit': 166950, 'rate': 0.0475},
+            {'limit': float('inf'), 'rate': 0.0599}
+        ]
+    },
+    'SC': {  # South Carolina
+        'single': [
+            {'limit': 3200, 'rate': 0.0},
+            {'limit': 16040, 'rate': 0.03},
+            {'limit': float('inf'), 'rate': 0.064}
+        ],
+        'married': [
+            {'limit': 3200, 'rate': 0.0},
+            {'limit': 16040, 'rate': 0.03},
+            {'limit': float('inf'), 'rate': 0.064}
+        ]
+    },
+    'VA': {  # Virginia
+        'single': [
+            {'limit': 3000, 'rate': 0.02},
+            {'limit': 5000, 'rate': 0.03},
+            {'limit': 17000, 'rate': 0.05},
+            {'limit': float('inf'), 'rate': 0.0575}
+        ],
+        'married': [
+            {'limit': 3000, 'rate': 0.02},
+            {'limit': 5000, 'rate': 0.03},
+            {'limit': 17000, 'rate': 0.05},
+            {'limit': float('inf'), 'rate': 0.0575}
+        ]
+    },
+    'VT': {  # Vermont
+        'single': [
+            {'limit': 45400, 'rate': 0.0335},
+            {'limit': 110050, 'rate': 0.066},
+            {'limit': 229550, 'rate': 0.076},
+            {'limit': float('inf'), 'rate': 0.0875}
+        ],
+        'married': [
+            {'limit': 75850, 'rate': 0.0335},
+            {'limit': 183400, 'rate': 0.066},
+            {'limit': 279450, 'rate': 0.076},
+            {'limit': float('inf'), 'rate': 0.0875}
+        ]
+    },
+    'WV': {  # West Virginia
+        'single': [
+            {'limit': 10000, 'rate': 0.0236},
+            {'limit': 25000, 'rate': 0.0315},
+            {'limit': 40000, 'rate': 0.0354},
+            {'limit': 60000, 'rate': 0.0472},
+            {'limit': float('inf'), 'rate': 0.0512}
+        ],
+        'married': [
+            {'limit': 10000, 'rate': 0.0236},
+            {'limit': 25000, 'rate': 0.0315},
+            {'limit': 40000, 'rate': 0.0354},
+            {'limit': 60000, 'rate': 0.0472},
+            {'limit': float('inf'), 'rate': 0.0512}
+        ]
+    },
+    'WI': {  # Wisconsin
+        'single': [
+            {'limit': 14320, 'rate': 0.0354},
+            {'limit': 28640, 'rate': 0.0465},
+            {'limit': 315310, 'rate': 0.053},
+            {'limit': float('inf'), 'rate': 0.0765}
+        ],
+        'married': [
+            {'limit': 19090, 'rate': 0.0354},
+            {'limit': 38190, 'rate': 0.0465},
+            {'limit': 420420, 'rate': 0.053},
+            {'limit': float('inf'), 'rate': 0.0765}
+        ]
+    }
+})
+
+
+@njit(cache=True)
+def _state_progressive_kernel(gross_income, limits, rates):
+    """Sums state tax over the brackets that gross_income reaches."""
+    tax = 0.0
+    prev_limit = 0.0
+    for i in range(limits.size):
+        if gross_income <= prev_limit:
             break
-            
-    return fed_tax
+        tax += (min(gross_income, limits[i]) - prev_limit) * rates[i]
+        prev_limit = limits[i]
+        if limits[i] >= gross_income:
+            break
+    return tax
+
 
+# Row index of each state in the state bracket tables
+_STATE_IDX = {
+    state: idx
+    for idx, state in enumerate(
+        sorted(_NO_INCOME_TAX_STATES | _FLAT_TAX_RATES.keys() | _PROGRESSIVE_BRACKETS.keys())
+    )
+}
+_UNKNOWN_STATE_ROW = len(_STATE_IDX)
 
-def calculate_state_tax(gross_income: float, state: str, filing_status: str = "single") -> float:
+# Filing-status and state codes resolved to table indices once, keyed by
+# the spellings callers actually pass, so the hot path skips .lower() and
+# .upper() and goes straight from a dict hit to tuple indexing
+_FILING_IDX = {SINGLE: 0, MARRIED: 1}
+_FILING_TO_IDX = {
+    spelling: idx
+    for status, idx in _FILING_IDX.items()
+    for spelling in (status, status.upper(), status.capitalize())
+}
+_STATE_UPPER_CACHE = {**_STATE_IDX, **{state.lower(): idx for state, idx in _STATE_IDX.items()}}
+
+_OPEN_BRACKET_LIMITS = np.array([np.inf], dtype=np.float64)
+_ZERO_RATE = np.array([0.0], dtype=np.float64)
+
+
+def _state_bracket_arrays(state: str, status: str):
+    """
+    (upper limits, rates) arrays for any state code. Flat-rate and no-tax
+    states are one open-ended bracket; unknown states get a zero rate.
+    """
+    if state in _PROGRESSIVE_BRACKETS:
+        tables = _PROGRESSIVE_BRACKETS[state]
+        brackets = tables.get(status, tables[SINGLE])
+        return (
+            np.array([limit for limit, _ in brackets], dtype=np.float64),
+            np.array([rate for _, rate in brackets], dtype=np.float64),
+        )
+    return _OPEN_BRACKET_LIMITS, np.array([_FLAT_TAX_RATES.get(state, 0.0)], dtype=np.float64)
+
+
+# Every state's brackets per filing index, in _STATE_IDX order plus a
+# trailing zero-rate row for unknown codes. This is the one numeric form
+# of the state tables: the scalar function and the fused civilian kernel
+# walk it with _state_progressive_kernel, and the batch tables are packed
+# from it.
+_STATE_BRACKETS_BY_IDX = tuple(
+    tuple(_state_bracket_arrays(state, status) for state in _STATE_IDX) + ((_OPEN_BRACKET_LIMITS, _ZERO_RATE),)
+    for status in _FILING_IDX
+)
+
+
+def _pack_state_brackets(rows) -> np.ndarray:
+    """
+    Packs one filing status's (limits, rates) rows into a single
+    (states, brackets, 2) array of (lower threshold, rate) pairs.
+    Shorter rows are padded with (inf, 0.0) so every row ends in an open
+    upper bound.
+    """
+    width = max(limits.size for limits, _ in rows) + 1
+    table = np.zeros((len(rows), width, 2), dtype=np.float64)
+    table[:, 1:, 0] = np.inf
+    for i, (limits, rates) in enumerate(rows):
+        table[i, 1:limits.size, 0] = limits[:-1]
+        table[i, :rates.size, 1] = rates
+    return table
+
+
+_STATE_BRACKETS_PACKED = tuple(_pack_state_brackets(rows) for rows in _STATE_BRACKETS_BY_IDX)
+
+
+def _filing_index(filing_status: str) -> int:
+    """Table index for a filing status; KeyError for anything but single/married."""
+    idx = _FILING_TO_IDX.get(filing_status)
+    return _FILING_IDX[filing_status.lower()] if idx is None else idx
+
+
+def _state_index(state: str) -> int:
+    """Table index for a state code in any case; unknown codes map to the zero row."""
+    idx = _STATE_UPPER_CACHE.get(state)
+    return _STATE_IDX.get(state.upper(), _UNKNOWN_STATE_ROW) if idx is None else idx
+
+
+def calculate_state_tax(gross_income: float, state: str, filing_status: str = SINGLE) -> float:
     """
     Calculate state income tax using 2025 progressive tax tables.
 
-    Supports all 50 states + DC with accurate 2025 tax brackets.
+    Supports all 50 states + DC with accurate 2025 tax brackets. Unknown
+    state codes and incomes at or below zero are taxed at zero; unknown
+    filing statuses use the single brackets.
 
     Args:
         gross_income: Annual gross income
@@ -64,521 +702,53 @@ def calculate_state_tax(gross_income: float, state: str, filing_status: str = "s
     Returns:
         Annual state tax amount
     """
-    state = state.upper()
-
-    # States with no income tax (9 states)
-    if state in ['TX', 'FL', 'WA', 'TN', 'NV', 'SD', 'WY', 'AK', 'NH']:
-        return 0
-
-    # Flat tax states (2025 rates) - 13 states
-    flat_tax_states = {
-        'AZ': 0.025,   # Arizona
-        'CO': 0.044,   # Colorado
-        'GA': 0.0549,  # Georgia (transitioned to flat in 2024)
-        'ID': 0.058,   # Idaho
-        'IL': 0.0495,  # Illinois
-        'IN': 0.0305,  # Indiana (reduced in 2025)
-        'KY': 0.04,    # Kentucky
-        'MA': 0.05,    # Massachusetts
-        'MI': 0.0425,  # Michigan
-        'MS': 0.05,    # Mississippi
-        'NC': 0.0475,  # North Carolina
-        'ND': 0.0195,  # North Dakota (effectively flat for most)
-        'PA': 0.0307,  # Pennsylvania
-        'UT': 0.0465,  # Utah
-    }
+    status_idx = _FILING_IDX.get(filing_status.lower(), _FILING_IDX[SINGLE])
+    limits, rates = _STATE_BRACKETS_BY_IDX[status_idx][_state_index(state)]
+    return float(_state_progressive_kernel(float(gross_income), limits, rates))
 
-    if state in flat_tax_states:
-        return gross_income * flat_tax_states[state]
-
-    # Progressive tax states (2025 brackets)
-    progressive_states = {
-        'AL': {  # Alabama
-            'single': [
-                {'limit': 500, 'rate': 0.02},
-                {'limit': 3000, 'rate': 0.04},
-                {'limit': float('inf'), 'rate': 0.05}
-            ],
-            'married': [
-                {'limit': 1000, 'rate': 0.02},
-                {'limit': 6000, 'rate': 0.04},
-                {'limit': float('inf'), 'rate': 0.05}
-            ]
-        },
-        'AR': {  # Arkansas
-            'single': [
-                {'limit': 4400, 'rate': 0.02},
-                {'limit': 8800, 'rate': 0.04},
-                {'limit': float('inf'), 'rate': 0.039}
-            ],
-            'married': [
-                {'limit': 4400, 'rate': 0.02},
-                {'limit': 8800, 'rate': 0.04},
-                {'limit': float('inf'), 'rate': 0.039}
-            ]
-        },
-        'CA': {  # California
-            'single': [
-                {'limit': 10412, 'rate': 0.01},
-                {'limit': 24684, 'rate': 0.02},
-                {'limit': 38959, 'rate': 0.04},
-                {'limit': 54081, 'rate': 0.06},
-                {'limit': 68350, 'rate': 0.08},
-                {'limit': 349137, 'rate': 0.093},
-                {'limit': 418961, 'rate': 0.103},
-                {'limit': 698271, 'rate': 0.113},
-                {'limit': float('inf'), 'rate': 0.133}
-            ],
-            'married': [
-                {'limit': 20824, 'rate': 0.01},
-                {'limit': 49368, 'rate': 0.02},
-                {'limit': 77918, 'rate': 0.04},
-                {'limit': 108162, 'rate': 0.06},
-                {'limit': 136700, 'rate': 0.08},
-                {'limit': 698274, 'rate': 0.093},
-                {'limit': 837922, 'rate': 0.103},
-                {'limit': 1396542, 'rate': 0.113},
-                {'limit': float('inf'), 'rate': 0.133}
-            ]
-        },
-        'CT': {  # Connecticut
-            'single': [
-                {'limit': 10000, 'rate': 0.03},
-                {'limit': 50000, 'rate': 0.05},
-                {'limit': 100000, 'rate': 0.055},
-                {'limit': 200000, 'rate': 0.06},
-                {'limit': 250000, 'rate': 0.065},
-                {'limit': 500000, 'rate': 0.069},
-                {'limit': float('inf'), 'rate': 0.0699}
-            ],
-            'married': [
-                {'limit': 20000, 'rate': 0.03},
-                {'limit': 100000, 'rate': 0.05},
-                {'limit': 200000, 'rate': 0.055},
-                {'limit': 400000, 'rate': 0.06},
-                {'limit': 500000, 'rate': 0.065},
-                {'limit': 1000000, 'rate': 0.069},
-                {'limit': float('inf'), 'rate': 0.0699}
-            ]
-        },
-        'DE': {  # Delaware
-            'single': [
-                {'limit': 2000, 'rate': 0.0},
-                {'limit': 5000, 'rate': 0.022},
-                {'limit': 10000, 'rate': 0.039},
-                {'limit': 20000, 'rate': 0.048},
-                {'limit': 25000, 'rate': 0.052},
-                {'limit': 60000, 'rate': 0.0555},
-                {'limit': float('inf'), 'rate': 0.066}
-            ],
-            'married': [
-                {'limit': 2000, 'rate': 0.0},
-                {'limit': 5000, 'rate': 0.022},
-                {'limit': 10000, 'rate': 0.039},
-                {'limit': 20000, 'rate': 0.048},
-                {'limit': 25000, 'rate': 0.052},
-                {'limit': 60000, 'rate': 0.0555},
-                {'limit': float('inf'), 'rate': 0.066}
-            ]
-        },
-        'DC': {  # District of Columbia
-            'single': [
-                {'limit': 10000, 'rate': 0.04},
-                {'limit': 40000, 'rate': 0.06},
-                {'limit': 60000, 'rate': 0.065},
-                {'limit': 250000, 'rate': 0.085},
-                {'limit': 500000, 'rate': 0.0925},
-                {'limit': 1000000, 'rate': 0.0975},
-                {'limit': float('inf'), 'rate': 0.1075}
-            ],
-            'married': [
-                {'limit': 10000, 'rate': 0.04},
-                {'limit': 40000, 'rate': 0.06},
-                {'limit': 60000, 'rate': 0.065},
-                {'limit': 250000, 'rate': 0.085},
-                {'limit': 500000, 'rate': 0.0925},
-                {'limit': 1000000, 'rate': 0.0975},
-                {'limit': float('inf'), 'rate': 0.1075}
-            ]
-        },
-        'HI': {  # Hawaii
-            'single': [
-                {'limit': 2400, 'rate': 0.014},
-                {'limit': 4800, 'rate': 0.032},
-                {'limit': 9600, 'rate': 0.055},
-                {'limit': 14400, 'rate': 0.064},
-                {'limit': 19200, 'rate': 0.068},
-                {'limit': 24000, 'rate': 0.072},
-                {'limit': 36000, 'rate': 0.076},
-                {'limit': 48000, 'rate': 0.079},
-                {'limit': 150000, 'rate': 0.0825},
-                {'limit': 175000, 'rate': 0.09},
-                {'limit': 200000, 'rate': 0.10},
-                {'limit': float('inf'), 'rate': 0.11}
-            ],
-            'married': [
-                {'limit': 4800, 'rate': 0.014},
-                {'limit': 9600, 'rate': 0.032},
-                {'limit': 19200, 'rate': 0.055},
-                {'limit': 28800, 'rate': 0.064},
-                {'limit': 38400, 'rate': 0.068},
-                {'limit': 48000, 'rate': 0.072},
-                {'limit': 72000, 'rate': 0.076},
-                {'limit': 96000, 'rate': 0.079},
-                {'limit': 300000, 'rate': 0.0825},
-                {'limit': 350000, 'rate': 0.09},
-                {'limit': 400000, 'rate': 0.10},
-                {'limit': float('inf'), 'rate': 0.11}
-            ]
-        },
-        'IA': {  # Iowa
-            'single': [
-                {'limit': 6210, 'rate': 0.044},
-                {'limit': 31050, 'rate': 0.0482},
-                {'limit': float('inf'), 'rate': 0.057}
-            ],
-            'married': [
-                {'limit': 12420, 'rate': 0.044},
-                {'limit': 62100, 'rate': 0.0482},
-                {'limit': float('inf'), 'rate': 0.057}
-            ]
-        },
-        'KS': {  # Kansas
-            'single': [
-                {'limit': 15000, 'rate': 0.031},
-                {'limit': 30000, 'rate': 0.0525},
-                {'limit': float('inf'), 'rate': 0.057}
-            ],
-            'married': [
-                {'limit': 30000, 'rate': 0.031},
-                {'limit': 60000, 'rate': 0.0525},
-                {'limit': float('inf'), 'rate': 0.057}
-            ]
-        },
-        'LA': {  # Louisiana
-            'single': [
-                {'limit': 12500, 'rate': 0.0185},
-                {'limit': 50000, 'rate': 0.035},
-                {'limit': float('inf'), 'rate': 0.0425}
-            ],
-            'married': [
-                {'limit': 25000, 'rate': 0.0185},
-                {'limit': 100000, 'rate': 0.035},
-                {'limit': float('inf'), 'rate': 0.0425}
-            ]
-        },
-        'ME': {  # Maine
-            'single': [
-                {'limit': 24500, 'rate': 0.058},
-                {'limit': 58050, 'rate': 0.0675},
-                {'limit': float('inf'), 'rate': 0.0715}
-            ],
-            'married': [
-                {'limit': 49050, 'rate': 0.058},
-                {'limit': 116100, 'rate': 0.0675},
-                {'limit': float('inf'), 'rate': 0.0715}
-            ]
-        },
-        'MD': {  # Maryland
-            'single': [
-                {'limit': 1000, 'rate': 0.02},
-                {'limit': 2000, 'rate': 0.03},
-                {'limit': 3000, 'rate': 0.04},
-                {'limit': 100000, 'rate': 0.0475},
-                {'limit': 125000, 'rate': 0.05},
-                {'limit': 150000, 'rate': 0.0525},
-                {'limit': 250000, 'rate': 0.055},
-                {'limit': float('inf'), 'rate': 0.0575}
-            ],
-            'married': [
-                {'limit': 1000, 'rate': 0.02},
-                {'limit': 2000, 'rate': 0.03},
-                {'limit': 3000, 'rate': 0.04},
-                {'limit': 150000, 'rate': 0.0475},
-                {'limit': 175000, 'rate': 0.05},
-                {'limit': 225000, 'rate': 0.0525},
-                {'limit': 300000, 'rate': 0.055},
-                {'limit': float('inf'), 'rate': 0.0575}
-            ]
-        },
-        'MN': {  # Minnesota
-            'single': [
-                {'limit': 31690, 'rate': 0.0535},
-                {'limit': 104090, 'rate': 0.068},
-                {'limit': 193240, 'rate': 0.0785},
-                {'limit': float('inf'), 'rate': 0.0985}
-            ],
-            'married': [
-                {'limit': 46330, 'rate': 0.0535},
-                {'limit': 184040, 'rate': 0.068},
-                {'limit': 321450, 'rate': 0.0785},
-                {'limit': float('inf'), 'rate': 0.0985}
-            ]
-        },
-        'MO': {  # Missouri
-            'single': [
-                {'limit': 1207, 'rate': 0.02},
-                {'limit': 2414, 'rate': 0.025},
-                {'limit': 3621, 'rate': 0.03},
-                {'limit': 4828, 'rate': 0.035},
-                {'limit': 6035, 'rate': 0.04},
-                {'limit': 7242, 'rate': 0.045},
-                {'limit': 8449, 'rate': 0.05},
-                {'limit': float('inf'), 'rate': 0.0495}
-            ],
-            'married': [
-                {'limit': 1207, 'rate': 0.02},
-                {'limit': 2414, 'rate': 0.025},
-                {'limit': 3621, 'rate': 0.03},
-                {'limit': 4828, 'rate': 0.035},
-                {'limit': 6035, 'rate': 0.04},
-                {'limit': 7242, 'rate': 0.045},
-                {'limit': 8449, 'rate': 0.05},
-                {'limit': float('inf'), 'rate': 0.0495}
-            ]
-        },
-        'MT': {  # Montana
-            'single': [
-                {'limit': 20500, 'rate': 0.047},
-                {'limit': float('inf'), 'rate': 0.059}
-            ],
-            'married': [
-                {'limit': 41000, 'rate': 0.047},
-                {'limit': float('inf'), 'rate': 0.059}
-            ]
-        },
-        'NE': {  # Nebraska
-            'single': [
-                {'limit': 3700, 'rate': 0.0246},
-                {'limit': 22170, 'rate': 0.0351},
-                {'limit': 35730, 'rate': 0.0501},
-                {'limit': float('inf'), 'rate': 0.0584}
-            ],
-            'married': [
-                {'limit': 7390, 'rate': 0.0246},
-                {'limit': 44350, 'rate': 0.0351},
-                {'limit': 71460, 'rate': 0.0501},
-                {'limit': float('inf'), 'rate': 0.0584}
-            ]
-        },
-        'NJ': {  # New Jersey
-            'single': [
-                {'limit': 20000, 'rate': 0.014},
-                {'limit': 35000, 'rate': 0.0175},
-                {'limit': 40000, 'rate': 0.035},
-                {'limit': 75000, 'rate': 0.05525},
-                {'limit': 500000, 'rate': 0.0637},
-                {'limit': 1000000, 'rate': 0.0897},
-                {'limit': float('inf'), 'rate': 0.1075}
-            ],
-            'married': [
-                {'limit': 20000, 'rate': 0.014},
-                {'limit': 50000, 'rate': 0.0175},
-                {'limit': 70000, 'rate': 0.0245},
-                {'limit': 80000, 'rate': 0.035},
-                {'limit': 150000, 'rate': 0.05525},
-                {'limit': 500000, 'rate': 0.0637},
-                {'limit': 1000000, 'rate': 0.0897},
-                {'limit': float('inf'), 'rate': 0.1075}
-            ]
-        },
-        'NM': {  # New Mexico
-            'single': [
-                {'limit': 5500, 'rate': 0.017},
-                {'limit': 11000, 'rate': 0.032},
-                {'limit': 16000, 'rate': 0.047},
-                {'limit': 210000, 'rate': 0.049},
-                {'limit': float('inf'), 'rate': 0.059}
-            ],
-            'married': [
-                {'limit': 8000, 'rate': 0.017},
-                {'limit': 16000, 'rate': 0.032},
-                {'limit': 24000, 'rate': 0.047},
-                {'limit': 315000, 'rate': 0.049},
-                {'limit': float('inf'), 'rate': 0.059}
-            ]
-        },
-        'NY': {  # New York
-            'single': [
-                {'limit': 8500, 'rate': 0.04},
-                {'limit': 11700, 'rate': 0.045},
-                {'limit': 13900, 'rate': 0.0525},
-                {'limit': 80650, 'rate': 0.055},
-                {'limit': 215400, 'rate': 0.06},
-                {'limit': 1077550, 'rate': 0.0685},
-                {'limit': 5000000, 'rate': 0.0965},
-                {'limit': 25000000, 'rate': 0.103},
-                {'limit': float('inf'), 'rate': 0.109}
-            ],
-            'married': [
-                {'limit': 17150, 'rate': 0.04},
-                {'limit': 23600, 'rate': 0.045},
-                {'limit': 27900, 'rate': 0.0525},
-                {'limit': 161550, 'rate': 0.055},
-                {'limit': 323200, 'rate': 0.06},
-                {'limit': 2155350, 'rate': 0.0685},
-                {'limit': 5000000, 'rate': 0.0965},
-                {'limit': 25000000, 'rate': 0.103},
-                {'limit': float('inf'), 'rate': 0.109}
-            ]
-        },
-        'OH': {  # Ohio
-            'single': [
-                {'limit': 26050, 'rate': 0.0},
-                {'limit': 100000, 'rate': 0.02765},
-                {'limit': float('inf'), 'rate': 0.035}
-            ],
-            'married': [
-                {'limit': 26050, 'rate': 0.0},
-                {'limit': 100000, 'rate': 0.02765},
-                {'limit': float('inf'), 'rate': 0.035}
-            ]
-        },
-        'OK': {  # Oklahoma
-            'single': [
-                {'limit': 1000, 'rate': 0.0025},
-                {'limit': 2500, 'rate': 0.0075},
-                {'limit': 3750, 'rate': 0.0175},
-                {'limit': 4900, 'rate': 0.0275},
-                {'limit': 7200, 'rate': 0.0375},
-                {'limit': float('inf'), 'rate': 0.0475}
-            ],
-            'married': [
-                {'limit': 2000, 'rate': 0.0025},
-                {'limit': 5000, 'rate': 0.0075},
-                {'limit': 7500, 'rate': 0.0175},
-                {'limit': 9800, 'rate': 0.0275},
-                {'limit': 12200, 'rate': 0.0375},
-                {'limit': float('inf'), 'rate': 0.0475}
-            ]
-        },
-        'OR': {  # Oregon
-            'single': [
-                {'limit': 4050, 'rate': 0.0475},
-                {'limit': 10200, 'rate': 0.0675},
-                {'limit': 125000, 'rate': 0.0875},
-                {'limit': float('inf'), 'rate': 0.099}
-            ],
-            'married': [
-                {'limit': 8100, 'rate': 0.0475},
-                {'limit': 20400, 'rate': 0.0675},
-                {'limit': 250000, 'rate': 0.0875},
-                {'limit': float('inf'), 'rate': 0.099}
-            ]
-        },
-        'RI': {  # Rhode Island
-            'single': [
-                {'limit': 73450, 'rate': 0.0375},
-                {'limit': 166950, 'rate': 0.0475},
-                {'limit': float('inf'), 'rate': 0.0599}
-            ],
-            'married': [
-                {'limit': 73450, 'rate': 0.0375},
-                {'limit': 166950, 'rate': 0.0475},
-                {'limit': float('inf'), 'rate': 0.0599}
-            ]
-        },
-        'SC': {  # South Carolina
-            'single': [
-                {'limit': 3200, 'rate': 0.0},
-                {'limit': 16040, 'rate': 0.03},
-                {'limit': float('inf'), 'rate': 0.064}
-            ],
-            'married': [
-                {'limit': 3200, 'rate': 0.0},
-                {'limit': 16040, 'rate': 0.03},
-                {'limit': float('inf'), 'rate': 0.064}
-            ]
-        },
-        'VA': {  # Virginia
-            'single': [
-                {'limit': 3000, 'rate': 0.02},
-                {'limit': 5000, 'rate': 0.03},
-                {'limit': 17000, 'rate': 0.05},
-                {'limit': float('inf'), 'rate': 0.0575}
-            ],
-            'married': [
-                {'limit': 3000, 'rate': 0.02},
-                {'limit': 5000, 'rate': 0.03},
-                {'limit': 17000, 'rate': 0.05},
-                {'limit': float('inf'), 'rate': 0.0575}
-            ]
-        },
-        'VT': {  # Vermont
-            'single': [
-                {'limit': 45400, 'rate': 0.0335},
-                {'limit': 110050, 'rate': 0.066},
-                {'limit': 229550, 'rate': 0.076},
-                {'limit': float('inf'), 'rate': 0.0875}
-            ],
-            'married': [
-                {'limit': 75850, 'rate': 0.0335},
-                {'limit': 183400, 'rate': 0.066},
-                {'limit': 279450, 'rate': 0.076},
-                {'limit': float('inf'), 'rate': 0.0875}
-            ]
-        },
-        'WV': {  # West Virginia
-            'single': [
-                {'limit': 10000, 'rate': 0.0236},
-                {'limit': 25000, 'rate': 0.0315},
-                {'limit': 40000, 'rate': 0.0354},
-                {'limit': 60000, 'rate': 0.0472},
-                {'limit': float('inf'), 'rate': 0.0512}
-            ],
-            'married': [
-                {'limit': 10000, 'rate': 0.0236},
-                {'limit': 25000, 'rate': 0.0315},
-                {'limit': 40000, 'rate': 0.0354},
-                {'limit': 60000, 'rate': 0.0472},
-                {'limit': float('inf'), 'rate': 0.0512}
-            ]
-        },
-        'WI': {  # Wisconsin
-            'single': [
-                {'limit': 14320, 'rate': 0.0354},
-                {'limit': 28640, 'rate': 0.0465},
-                {'limit': 315310, 'rate': 0.053},
-                {'limit': float('inf'), 'rate': 0.0765}
-            ],
-            'married': [
-                {'limit': 19090, 'rate': 0.0354},
-                {'limit': 38190, 'rate': 0.0465},
-                {'limit': 420420, 'rate': 0.053},
-                {'limit': float('inf'), 'rate': 0.0765}
-            ]
-        }
-    }
 
-    # Progressive calculation
-    if state in progressive_states:
-        brackets = progressive_states[state].get(filing_status.lower(), progressive_states[state]['single'])
+def calculate_state_tax_batch(incomes: np.ndarray, states: Sequence[str], filing_status: str = SINGLE) -> np.ndarray:
+    """
+    Vectorized state income tax over paired arrays of incomes and states.
 
-        tax = 0
-        prev_limit = 0
+    Matches calculate_state_tax element-wise (to floating-point rounding),
+    including the zero tax on unknown state codes and incomes at or below
+    zero.
 
-        for bracket in brackets:
-            limit = bracket['limit']
-            rate = bracket['rate']
+    Args:
+        incomes: Annual gross incomes
+        states: State abbreviations, one per income
+        filing_status: "single" or "married", applied to every row
 
-            if gross_income <= prev_limit:
-                break
+    Returns:
+        Array of annual state tax amounts
+    """
+    incomes = np.asarray(incomes, dtype=np.float64)
+    table = _STATE_BRACKETS_PACKED[_FILING_IDX.get(filing_status.lower(), _FILING_IDX[SINGLE])]
+    rows = table[[_state_index(state) for state in states]]
+    thresholds = rows[:, :, 0]
+    rates = rows[:, :-1, 1]
 
-            taxable_in_bracket = min(gross_income, limit) - prev_limit
-            tax += taxable_in_bracket * rate
+    in_bracket = np.minimum(incomes[:, None], thresholds[:, 1:]) - thresholds[:, :-1]
+    return (in_bracket.clip(min=0) * rates).sum(axis=1)
 
-            prev_limit = limit
 
-            if limit >= gross_income:
-                break
+# Child Tax Credit: per-child amount, phase-out thresholds, $50 per $1,000 over
+_CTC_PER_CHILD = 2000.0
+_CTC_THRESHOLD_SINGLE = 200000.0
+_CTC_THRESHOLD_MARRIED = 400000.0
+_CTC_PHASEOUT_STEP = 50.0
 
-        return tax
 
-    # Default: no state tax (should not reach here with comprehensive data)
-    return 0
+@njit(cache=True)
+def _child_tax_credit_kernel(gross_income, num_children, threshold):
+    """Branchless CTC: full credit less $50 per whole $1,000 over threshold."""
+    base_credit = _CTC_PER_CHILD * max(num_children, 0.0)
+    reduction = (max(gross_income - threshold, 0.0) // 1000.0) * _CTC_PHASEOUT_STEP
+    return max(base_credit - reduction, 0.0)
 
 
-def calculate_child_tax_credit(gross_income: float, num_children: int, filing_status: str = "single") -> float:
+def calculate_child_tax_credit(gross_income: float, num_children: int, filing_status: str = SINGLE) -> float:
     """
     Calculates the Child Tax Credit (CTC) with income phase-out.
 
@@ -595,23 +765,27 @@ def calculate_child_tax_credit(gross_income: float, num_children: int, filing_st
     Returns:
         Total child tax credit amount
     """
-    if num_children <= 0:
-        return 0
-
-    credit_per_child = 2000
-    base_credit = credit_per_child * num_children
+    threshold = _CTC_THRESHOLD_MARRIED if filing_status.lower() == MARRIED else _CTC_THRESHOLD_SINGLE
+    return float(_child_tax_credit_kernel(float(gross_income), float(num_children), threshold))
 
-    # Phase-out thresholds
-    threshold = 400000 if filing_status.lower() == "married" else 200000
 
-    if gross_income <= threshold:
-        return base_credit
+def calculate_child_tax_credit_batch(incomes: np.ndarray, num_children: np.ndarray, married: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_child_tax_credit over parallel arrays.
 
-    # Reduce credit by $50 for each $1,000 over threshold
-    excess_income = gross_income - threshold
-    reduction = (excess_income // 1000) * 50
+    Args:
+        incomes: Annual gross incomes (AGI)
+        num_children: Qualifying children per row
+        married: Boolean mask, True where filing jointly
 
-    return max(0, base_credit - reduction)
+    Returns:
+        Array of child tax credit amounts
+    """
+    incomes = np.asarray(incomes, dtype=np.float64)
+    threshold = np.where(married, _CTC_THRESHOLD_MARRIED, _CTC_THRESHOLD_SINGLE)
+    base_credit = _CTC_PER_CHILD * np.maximum(np.asarray(num_children, dtype=np.float64), 0.0)
+    reduction = (np.maximum(incomes - threshold, 0.0) // 1000.0) * _CTC_PHASEOUT_STEP
+    return np.maximum(base_credit - reduction, 0.0)
 
 
 def calculate_fica_tax(gross_income: float) -> Dict[str, float]:
@@ -646,7 +820,52 @@ def calculate_fica_tax(gross_income: float) -> Dict[str, float]:
     }
 
 
-def calculate_bonus_withholding(bonus_amount: float, base_salary: float = 0, federal_rate: float = 0.22) -> Dict[str, float]:
+def calculate_fica_tax_batch(incomes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorized calculate_fica_tax over an array of gross incomes.
+
+    Args:
+        incomes: Annual gross incomes
+
+    Returns:
+        Dictionary of arrays: ss_tax, medicare_tax, total_fica
+    """
+    fica = load_tax_data()['fica']
+    ss_cap = fica['social_security']['wage_base_limit']
+    ss_rate = fica['social_security']['rate']
+    medicare = fica['medicare']
+
+    incomes = np.asarray(incomes, dtype=np.float64)
+    ss_tax = np.minimum(incomes, ss_cap) * ss_rate
+    medicare_tax = (
+        incomes * medicare['rate']
+        + np.maximum(incomes - medicare['additional_threshold_single'], 0.0) * medicare['additional_rate']
+    )
+
+    return {
+        "ss_tax": ss_tax,
+        "medicare_tax": medicare_tax,
+        "total_fica": ss_tax + medicare_tax
+    }
+
+
+# Flat federal withholding rate on supplemental wages under $1M
+_BONUS_FEDERAL_RATE = 0.22
+
+
+@njit(cache=True)
+def _bonus_fica_kernel(bonus_amount, prior_wages, ss_cap, ss_rate, med_rate):
+    """SS + Medicare withheld on a supplemental payment made after prior_wages."""
+    # SS withholding on bonus only applies if prior wages haven't hit the cap,
+    # and then only on the portion of bonus that fits under it
+    if prior_wages >= ss_cap:
+        ss_withholding = 0.0
+    else:
+        ss_withholding = min(bonus_amount, ss_cap - prior_wages) * ss_rate
+    return ss_withholding + bonus_amount * med_rate
+
+
+def calculate_bonus_withholding(bonus_amount: float, base_salary: float = 0, federal_rate: float = _BONUS_FEDERAL_RATE) -> Dict[str, float]:
     """
     Calculates tax withholding on bonuses (supplemental income).
     Uses flat 22% federal withholding rate for bonuses under $1M.
@@ -663,25 +882,10 @@ def calculate_bonus_withholding(bonus_amount: float, base_salary: float = 0, fed
     Returns:
         Dictionary with gross_bonus, federal_withholding, fica_withholding, and net_bonus
     """
-    tax_data = load_tax_data()
-    fica = tax_data['fica']
-    ss_cap = fica['social_security']['wage_base_limit']
-    ss_rate = fica['social_security']['rate']
-    med_rate = fica['medicare']['rate']
+    ss_cap, ss_rate, med_rate = _FICA_KERNEL_ARGS[:3]
 
     federal_withholding = bonus_amount * federal_rate
-
-    # SS withholding on bonus only applies if base salary hasn't hit the cap
-    if base_salary >= ss_cap:
-        ss_withholding = 0
-    else:
-        # Only the portion of bonus that fits under the cap is subject to SS
-        remaining_cap = ss_cap - base_salary
-        ss_taxable = min(bonus_amount, remaining_cap)
-        ss_withholding = ss_taxable * ss_rate
-
-    medicare_withholding = bonus_amount * med_rate
-    fica_withholding = ss_withholding + medicare_withholding
+    fica_withholding = float(_bonus_fica_kernel(float(bonus_amount), float(base_salary), ss_cap, ss_rate, med_rate))
 
     net_bonus = bonus_amount - federal_withholding - fica_withholding
 
@@ -715,9 +919,121 @@ def calculate_equity_vesting(total_equity: float, vesting_years: int = 4, is_pub
     return vesting_schedule
 
 
-def calculate_civilian_net(base_salary: float, bonus_pct: float, total_equity: float, state: str, filing_status: str = "single", annual_rsu_value: float = 0, num_children: int = 0) -> Dict[str, float]:
+# Per-filing-index inputs to the fused civilian kernel
+_FEDERAL_BRACKETS_BY_IDX = tuple(_FEDERAL_BRACKETS_NP[status] for status in _FILING_IDX)
+_FEDERAL_DEDUCTIONS = tuple(_STANDARD_DEDUCTIONS[status] for status in _FILING_IDX)
+_CTC_THRESHOLDS = (_CTC_THRESHOLD_SINGLE, _CTC_THRESHOLD_MARRIED)
+
+
+def _fica_kernel_args():
+    """ss_cap, ss_rate, med_rate and the additional Medicare threshold and rate."""
+    fica = load_tax_data()['fica']
+    return (
+        float(fica['social_security']['wage_base_limit']),
+        fica['social_security']['rate'],
+        fica['medicare']['rate'],
+        float(fica['medicare']['additional_threshold_single']),
+        fica['medicare']['additional_rate'],
+    )
+
+
+_FICA_KERNEL_ARGS = _fica_kernel_args()
+
+
+@njit(cache=True)
+def _bonus_net_kernel(bonus_amount, prior_wages, federal_rate, ss_cap, ss_rate, med_rate):
+    """Federal withholding, FICA withholding and net for one supplemental payment."""
+    federal_withholding = bonus_amount * federal_rate
+    fica_withholding = _bonus_fica_kernel(bonus_amount, prior_wages, ss_cap, ss_rate, med_rate)
+    net_bonus = max(0.0, bonus_amount - federal_withholding - fica_withholding)
+    return federal_withholding, fica_withholding, net_bonus
+
+
+@njit(cache=True)
+def _civilian_net_kernel(base_salary, bonus_pct, annual_rsu_value, num_children,
+                         fed_deduction, fed_limits, fed_rates, state_limits, state_rates,
+                         ctc_threshold, ss_cap, ss_rate, med_rate, add_med_threshold, add_med_rate):
+    """
+    Fused federal, state, FICA and CTC calculation behind calculate_civilian_net.
+    Follows the same operation order as the standalone helpers, so results
+    match them exactly.
+    """
+    bonus_annual = base_salary * (bonus_pct / 100)
+    gross_annual = base_salary + bonus_annual + annual_rsu_value
+
+    fed_tax = _federal_tax_kernel(max(0.0, gross_annual - fed_deduction), fed_limits, fed_rates)
+    state_tax = _state_progressive_kernel(gross_annual, state_limits, state_rates)
+
+    medicare_tax = gross_annual * med_rate
+    if gross_annual > add_med_threshold:
+        medicare_tax += (gross_annual - add_med_threshold) * add_med_rate
+    fica_tax = min(gross_annual, ss_cap) * ss_rate + medicare_tax
+
+    child_credit = _child_tax_credit_kernel(gross_annual, num_children, ctc_threshold)
+    applied_child_credit = min(child_credit, fed_tax)
+
+    total_tax = fed_tax + state_tax + fica_tax - applied_child_credit
+    net_annual = gross_annual - total_tax
+
+    bonus_fed, bonus_fica, bonus_net = _bonus_net_kernel(
+        bonus_annual, base_salary, _BONUS_FEDERAL_RATE, ss_cap, ss_rate, med_rate
+    )
+    rsu_net = 0.0
+    if annual_rsu_value > 0:
+        # RSU vests after bonus, so both base + bonus count toward SS cap
+        rsu_net = _bonus_net_kernel(
+            annual_rsu_value, base_salary + bonus_annual, _BONUS_FEDERAL_RATE, ss_cap, ss_rate, med_rate
+        )[2]
+
+    return (gross_annual, bonus_annual, bonus_fed, bonus_fica, bonus_net, rsu_net,
+            fed_tax, state_tax, fica_tax, applied_child_credit, total_tax, net_annual)
+
+
+@result_record
+class CivilianNetResult(ResultMapping):
+    """Civilian take-home breakdown (annual amounts unless noted)."""
+    gross_annual: float
+    base_salary: float
+    bonus_annual: float
+    bonus_federal_withholding: float
+    bonus_fica_withholding: float
+    bonus_net: float
+    rsu_annual: float
+    rsu_net: float
+    fed_tax: float
+    state_tax: float
+    fica_tax: float
+    child_tax_credit: float
+    total_tax: float
+    net_annual: float
+    net_monthly: float
+    effective_tax_rate: float
+    fed_effective_rate: float
+    state_effective_rate: float
+    fica_effective_rate: float
+
+
+@result_record
+class CivilianNetResultArray(ResultMapping):
+    """Structure-of-arrays take-home breakdown for batched scenarios."""
+    gross_annual: np.ndarray
+    bonus_annual: np.ndarray
+    fed_tax: np.ndarray
+    state_tax: np.ndarray
+    fica_tax: np.ndarray
+    child_tax_credit: np.ndarray
+    total_tax: np.ndarray
+    net_annual: np.ndarray
+    net_monthly: np.ndarray
+    effective_tax_rate: np.ndarray
+
+
+@lru_cache(maxsize=1024)
+def calculate_civilian_net(base_salary: float, bonus_pct: float, total_equity: float, state: str, filing_status: str = SINGLE, annual_rsu_value: float = 0, num_children: int = 0) -> CivilianNetResult:
     """
     Calculates estimated net pay for civilian employment including RSU vesting.
+    Results are memoized; the returned CivilianNetResult is immutable and
+    can be read with attributes or dict-style indexing.
 
     Args:
         base_salary: Annual base salary
@@ -729,7 +1045,7 @@ def calculate_civilian_net(base_salary: float, bonus_pct: float, total_equity: f
         num_children: Number of qualifying children for Child Tax Credit
 
     Returns:
-        Dictionary containing:
+        CivilianNetResult containing:
             - gross_annual: Total gross compensation (base + bonus + RSU)
             - base_salary: Base salary
             - bonus_annual: Gross bonus amount
@@ -745,51 +1061,102 @@ def calculate_civilian_net(base_salary: float, bonus_pct: float, total_equity: f
             - net_monthly: Net monthly take-home (including RSU)
             - effective_tax_rate: Overall tax rate
     """
-    bonus_annual = base_salary * (bonus_pct / 100)
+    filing_idx = _filing_index(filing_status)
+    fed_limits, fed_rates = _FEDERAL_BRACKETS_BY_IDX[filing_idx]
+    state_limits, state_rates = _STATE_BRACKETS_BY_IDX[filing_idx][_state_index(state)]
 
-    gross_annual = base_salary + bonus_annual + annual_rsu_value
+    (gross_annual, bonus_annual, bonus_fed, bonus_fica, bonus_net, rsu_net,
+     fed_tax, state_tax, fica_tax, applied_child_credit, total_tax, net_annual) = _civilian_net_kernel(
+        float(base_salary), float(bonus_pct), float(annual_rsu_value), float(num_children),
+        _FEDERAL_DEDUCTIONS[filing_idx], fed_limits, fed_rates, state_limits, state_rates,
+        _CTC_THRESHOLDS[filing_idx], *_FICA_KERNEL_ARGS
+    )
 
-    fed_tax = calculate_federal_tax(gross_annual, filing_status)
-    state_tax = calculate_state_tax(gross_annual, state, filing_status)
-    fica_data = calculate_fica_tax(gross_annual)
-    fica_tax = fica_data['total_fica']
+    return CivilianNetResult(
+        gross_annual=gross_annual,
+        base_salary=base_salary,
+        bonus_annual=bonus_annual,
+        bonus_federal_withholding=bonus_fed,
+        bonus_fica_withholding=bonus_fica,
+        bonus_net=bonus_net,
+        rsu_annual=annual_rsu_value,
+        rsu_net=rsu_net,
+        fed_tax=fed_tax,
+        state_tax=state_tax,
+        fica_tax=fica_tax,
+        child_tax_credit=applied_child_credit,
+        total_tax=total_tax,
+        net_annual=net_annual,
+        net_monthly=net_annual / 12,
+        effective_tax_rate=(total_tax / gross_annual) if gross_annual > 0 else 0,
+        fed_effective_rate=(fed_tax / gross_annual) if gross_annual > 0 else 0,
+        state_effective_rate=(state_tax / gross_annual) if gross_annual > 0 else 0,
+        fica_effective_rate=(fica_tax / gross_annual) if gross_annual > 0 else 0
+    )
 
-    # Calculate child tax credit (reduces federal tax owed)
-    child_credit = calculate_child_tax_credit(gross_annual, num_children, filing_status)
+
+def calculate_civilian_net_batch(
+    base_salary: Sequence[float],
+    bonus_pct: Sequence[float],
+    annual_rsu_value: Sequence[float],
+    states: Sequence[str],
+    filing_statuses: Sequence[str],
+    num_children: Sequence[int]
+) -> CivilianNetResultArray:
+    """
+    Vectorized take-home pay for a grid of civilian scenarios, one row per
+    scenario. Composes the federal, state, FICA and child tax credit batch
+    functions; matches calculate_civilian_net row-wise to floating-point
+    rounding. Bonus/RSU withholding is display-only and not included.
+
+    Args:
+        base_salary: Annual base salaries
+        bonus_pct: Bonus percentages (e.g., 15 for 15%)
+        annual_rsu_value: Annual vesting values (risk-adjusted)
+        states: State abbreviations
+        filing_statuses: "single" or "married" per scenario
+        num_children: Qualifying children per scenario
+
+    Returns:
+        CivilianNetResultArray of parallel float64 arrays
+    """
+    base_salary = np.asarray(base_salary, dtype=np.float64)
+    bonus_annual = base_salary * (np.asarray(bonus_pct, dtype=np.float64) / 100)
+    gross_annual = base_salary + bonus_annual + np.asarray(annual_rsu_value, dtype=np.float64)
+
+    filing_idx = np.array([_filing_index(status) for status in filing_statuses], dtype=np.intp)
+    fed_tax = np.empty_like(gross_annual)
+    state_tax = np.empty_like(gross_annual)
+    for idx, status in enumerate(_FILING_IDX):
+        rows = np.flatnonzero(filing_idx == idx)
+        fed_tax[rows] = calculate_federal_tax_batch(gross_annual[rows], status)
+        state_tax[rows] = calculate_state_tax_batch(gross_annual[rows], [states[i] for i in rows], status)
+
+    fica_tax = calculate_fica_tax_batch(gross_annual)['total_fica']
     # CTC can only reduce federal tax to $0, not create refund (simplified)
-    applied_child_credit = min(child_credit, fed_tax)
+    child_credit = np.minimum(
+        calculate_child_tax_credit_batch(gross_annual, num_children, filing_idx == _FILING_IDX[MARRIED]),
+        fed_tax
+    )
 
-    total_tax = fed_tax + state_tax + fica_tax - applied_child_credit
+    total_tax = fed_tax + state_tax + fica_tax - child_credit
     net_annual = gross_annual - total_tax
-    
-    # Calculate withholding for display purposes (actual FICA already in fica_tax above)
-    bonus_withholding = calculate_bonus_withholding(bonus_annual, base_salary)
 
-    if annual_rsu_value > 0:
-        # RSU vests after bonus, so both base + bonus count toward SS cap
-        rsu_withholding = calculate_bonus_withholding(annual_rsu_value, base_salary + bonus_annual)
-        rsu_net = rsu_withholding['net_bonus']
-    else:
-        rsu_net = 0
-    
-    return {
-        "gross_annual": gross_annual,
-        "base_salary": base_salary,
-        "bonus_annual": bonus_annual,
-        "bonus_federal_withholding": bonus_withholding['federal_withholding'],
-        "bonus_fica_withholding": bonus_withholding['fica'],
-        "bonus_net": bonus_withholding['net_bonus'],
-        "rsu_annual": annual_rsu_value,
-        "rsu_net": rsu_net,
-        "fed_tax": fed_tax,
-        "state_tax": state_tax,
-        "fica_tax": fica_tax,
-        "child_tax_credit": applied_child_credit,
-        "total_tax": total_tax,
-        "net_annual": net_annual,
-        "net_monthly": net_annual / 12,
-        "effective_tax_rate": (total_tax / gross_annual) if gross_annual > 0 else 0,
-        "fed_effective_rate": (fed_tax / gross_annual) if gross_annual > 0 else 0,
-        "state_effective_rate": (state_tax / gross_annual) if gross_annual > 0 else 0,
-        "fica_effective_rate": (fica_tax / gross_annual) if gross_annual > 0 else 0
-    }
+    return CivilianNetResultArray(
+        gross_annual=gross_annual,
+        bonus_annual=bonus_annual,
+        fed_tax=fed_tax,
+        state_tax=state_tax,
+        fica_tax=fica_tax,
+        child_tax_credit=child_credit,
+        total_tax=total_tax,
+        net_annual=net_annual,
+        net_monthly=net_annual / 12,
+        effective_tax_rate=np.divide(total_tax, gross_annual, out=np.zeros_like(total_tax), where=gross_annual > 0)
+    )
+
+
+def clear_caches() -> None:
+    """Drops memoized civilian results and the cached tax data file."""
+    calculate_civilian_net.cache_clear()
+    load_tax_data.cache_clear()
@@ -1,5 +1,11 @@
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple, Union
 from enum import Enum
+from types import MappingProxyType
+
+import numpy as np
+
+from engines.results import ResultMapping, result_record
 
 
 class CompanyStage(Enum):
@@ -8,31 +14,115 @@ class CompanyStage(Enum):
 
     Risk discounts reflect the probability-weighted value of equity
     based on typical outcomes at each stage.
+
+    Each member carries an integer ``index`` into the module-level
+    ``_DISCOUNTS`` / ``_DESCRIPTIONS`` tables so hot paths avoid hashing
+    the Enum; ``.value`` remains the string tag used in JSON round-trips.
     """
-    PUBLIC = "public"           # 0% discount - liquid, tradeable stock
-    PRE_IPO = "pre_ipo"         # 15% discount - filed S-1, high confidence
-    LATE_STAGE = "late_stage"   # 30% discount - Series D+, Unicorn ($1B+ valuation)
-    GROWTH = "growth"           # 50% discount - Series B-C
-    EARLY = "early"             # 70% discount - Seed to Series A
+    PUBLIC = ("public", 0)           # 0% discount - liquid, tradeable stock
+    PRE_IPO = ("pre_ipo", 1)         # 15% discount - filed S-1, high confidence
+    LATE_STAGE = ("late_stage", 2)   # 30% discount - Series D+, Unicorn ($1B+ valuation)
+    GROWTH = ("growth", 3)           # 50% discount - Series B-C
+    EARLY = ("early", 4)             # 70% discount - Seed to Series A
+
+    def __new__(cls, value: str, index: int):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.index = index
+        return member
+
+
+# Risk discounts and descriptions, indexed by CompanyStage.index
+_DISCOUNTS = (0.0, 0.15, 0.30, 0.50, 0.70)
+_DISCOUNTS_NP = np.array(_DISCOUNTS, dtype=np.float64)
+
+_DESCRIPTIONS = (
+    "Public stock - Can sell immediately upon vesting",
+    "Pre-IPO - Filed S-1, IPO expected within 12 months",
+    "Late-stage private - Series D+ or Unicorn valuation",
+    "Growth stage - Series B-C, product-market fit established",
+    "Early stage - Seed to Series A, high execution risk",
+)
 
+# String tag -> member, so offer dicts skip the Enum.__call__ lookup path
+_STAGE_BY_VALUE = MappingProxyType({stage.value: stage for stage in CompanyStage})
 
 # Risk discounts by company stage
-STAGE_DISCOUNTS = {
-    CompanyStage.PUBLIC: 0.0,
-    CompanyStage.PRE_IPO: 0.15,
-    CompanyStage.LATE_STAGE: 0.30,
-    CompanyStage.GROWTH: 0.50,
-    CompanyStage.EARLY: 0.70,
-}
+STAGE_DISCOUNTS = {stage: _DISCOUNTS[stage.index] for stage in CompanyStage}
 
 # Human-readable descriptions for each stage
-STAGE_DESCRIPTIONS = {
-    CompanyStage.PUBLIC: "Public stock - Can sell immediately upon vesting",
-    CompanyStage.PRE_IPO: "Pre-IPO - Filed S-1, IPO expected within 12 months",
-    CompanyStage.LATE_STAGE: "Late-stage private - Series D+ or Unicorn valuation",
-    CompanyStage.GROWTH: "Growth stage - Series B-C, product-market fit established",
-    CompanyStage.EARLY: "Early stage - Seed to Series A, high execution risk",
-}
+STAGE_DESCRIPTIONS = {stage: _DESCRIPTIONS[stage.index] for stage in CompanyStage}
+
+# Winner label indexed by sign(offer_a - offer_b) + 1
+_OFFER_WINNERS = ("Offer B", "Tie", "Offer A")
+_OFFER_WINNERS_NP = np.array(_OFFER_WINNERS)
+
+
+@result_record
+class RSUValue(ResultMapping):
+    """Risk-adjusted value of an RSU grant."""
+    total_grant_value: float
+    adjusted_value: float
+    annualized_value: float
+    monthly_value: float
+    risk_discount: float
+    liquidity_note: str
+    company_stage: Optional[str]
+
+
+@result_record
+class RSUValueArray(ResultMapping):
+    """Structure-of-arrays counterpart to RSUValue for batched grants."""
+    total_grant_value: np.ndarray
+    adjusted_value: np.ndarray
+    annualized_value: np.ndarray
+    monthly_value: np.ndarray
+    risk_discount: np.ndarray
+
+
+@result_record
+class VestingScheduleArray(ResultMapping):
+    """Per-year vesting amounts as arrays; index 0 is year 1."""
+    vested_this_year: np.ndarray
+    cumulative_vested: np.ndarray
+    remaining_unvested: np.ndarray
+
+
+@result_record
+class EquityComparisonArray(ResultMapping):
+    """Structure-of-arrays counterpart to compare_equity_offers for offer pairs."""
+    offer_a_monthly: np.ndarray
+    offer_b_monthly: np.ndarray
+    monthly_difference: np.ndarray
+    winner: np.ndarray
+
+
+def _resolve_stage(company_stage: Optional[CompanyStage], is_public_company: bool) -> CompanyStage:
+    """Explicit stage wins; otherwise infer from the legacy is_public flag."""
+    if company_stage is not None:
+        return company_stage
+    if is_public_company:
+        return CompanyStage.PUBLIC
+    # Default private to GROWTH for backward compatibility (was 50%)
+    return CompanyStage.GROWTH
+
+
+def _rsu_for_stage(
+    total_grant: float,
+    vesting_years: int,
+    stage: CompanyStage
+) -> Tuple[float, float, float, float, float]:
+    """
+    Straight-line RSU valuation for an already-resolved stage.
+
+    Returns:
+        (total_grant, adjusted_value, annualized_value, monthly_value, risk_discount)
+        with risk_discount as a fraction
+    """
+    discount = _DISCOUNTS[stage.index]
+    adjusted = total_grant * (1 - discount)
+    annual = adjusted / vesting_years
+    return total_grant, adjusted, annual, annual / 12, discount
 
 
 def calculate_rsu_value(
@@ -41,7 +131,7 @@ def calculate_rsu_value(
     current_stock_price: float = 0,
     is_public_company: bool = True,
     company_stage: CompanyStage = None
-) -> Dict[str, float]:
+) -> RSUValue:
     """
     Calculates the value of RSU (Restricted Stock Unit) grants with risk adjustments.
 
@@ -60,7 +150,7 @@ def calculate_rsu_value(
         company_stage: CompanyStage enum for precise risk adjustment
 
     Returns:
-        Dictionary containing:
+        RSUValue containing:
             - total_grant_value: Total equity value
             - adjusted_value: Risk-adjusted value
             - annualized_value: Yearly vesting amount (adjusted)
@@ -70,45 +160,72 @@ def calculate_rsu_value(
             - company_stage: The stage used for calculation
     """
     if total_grant <= 0:
-        return {
-            "total_grant_value": 0,
-            "adjusted_value": 0,
-            "annualized_value": 0,
-            "monthly_value": 0,
-            "risk_discount": 0,
-            "liquidity_note": "No equity grant",
-            "company_stage": None
-        }
+        return RSUValue(
+            total_grant_value=0,
+            adjusted_value=0,
+            annualized_value=0,
+            monthly_value=0,
+            risk_discount=0,
+            liquidity_note="No equity grant",
+            company_stage=None
+        )
 
-    # Determine company stage (use explicit stage, or infer from legacy boolean)
-    if company_stage is not None:
-        stage = company_stage
-    elif is_public_company:
-        stage = CompanyStage.PUBLIC
-    else:
-        # Default private to GROWTH for backward compatibility (was 50%)
-        stage = CompanyStage.GROWTH
+    stage = _resolve_stage(company_stage, is_public_company)
+    _, adjusted_value, annualized_value, monthly_value, risk_discount = _rsu_for_stage(
+        total_grant, vesting_years, stage
+    )
 
-    risk_discount = STAGE_DISCOUNTS[stage]
-    adjusted_value = total_grant * (1 - risk_discount)
-    liquidity_note = STAGE_DESCRIPTIONS[stage]
+    liquidity_note = _DESCRIPTIONS[stage.index]
 
     # Add discount info to note for non-public
     if risk_discount > 0:
         liquidity_note += f" - {int(risk_discount * 100)}% risk discount applied"
 
-    annualized_value = adjusted_value / vesting_years
-    monthly_value = annualized_value / 12
+    return RSUValue(
+        total_grant_value=total_grant,
+        adjusted_value=adjusted_value,
+        annualized_value=annualized_value,
+        monthly_value=monthly_value,
+        risk_discount=risk_discount * 100,
+        liquidity_note=liquidity_note,
+        company_stage=stage.value
+    )
 
-    return {
-        "total_grant_value": total_grant,
-        "adjusted_value": adjusted_value,
-        "annualized_value": annualized_value,
-        "monthly_value": monthly_value,
-        "risk_discount": risk_discount * 100,
-        "liquidity_note": liquidity_note,
-        "company_stage": stage.value if stage else None
-    }
+
+def calculate_rsu_value_batch(
+    total_grants: Sequence[float],
+    vesting_years: Sequence[int],
+    stage_indices: Sequence[int]
+) -> RSUValueArray:
+    """
+    Vectorized calculate_rsu_value for many grants at once. Stages are
+    passed as CompanyStage.index values and gathered from the discount
+    table in one step; grants of zero or less value to zero, as in the
+    scalar function.
+
+    Args:
+        total_grants: Total dollar value of each grant
+        vesting_years: Vesting years per grant
+        stage_indices: CompanyStage.index per grant
+
+    Returns:
+        RSUValueArray of parallel float64 arrays (risk_discount in percent)
+    """
+    total_grants = np.asarray(total_grants, dtype=np.float64)
+    # Not "> 0": a NaN grant propagates, as it does in the scalar function
+    has_grant = ~(total_grants <= 0)
+    discount = np.where(has_grant, _DISCOUNTS_NP[np.asarray(stage_indices, dtype=np.intp)], 0.0)
+
+    adjusted = np.where(has_grant, total_grants * (1 - discount), 0.0)
+    annual = adjusted / np.asarray(vesting_years, dtype=np.float64)
+
+    return RSUValueArray(
+        total_grant_value=np.where(has_grant, total_grants, 0.0),
+        adjusted_value=adjusted,
+        annualized_value=annual,
+        monthly_value=annual / 12,
+        risk_discount=discount * 100
+    )
 
 
 def calculate_vesting_schedule(
@@ -134,19 +251,14 @@ def calculate_vesting_schedule(
             - cumulative_vested: Total vested through this year
             - remaining_unvested: Amount still unvested
     """
-    # Determine company stage
-    if company_stage is not None:
-        stage = company_stage
-    elif is_public_company:
-        stage = CompanyStage.PUBLIC
-    else:
-        stage = CompanyStage.GROWTH
+    stage = _resolve_stage(company_stage, is_public_company)
 
-    risk_discount = STAGE_DISCOUNTS[stage]
+    risk_discount = _DISCOUNTS[stage.index]
     adjusted_total = total_grant * (1 - risk_discount)
     
     schedule = {}
     annual_vest = adjusted_total / vesting_years
+    cumulative = 0.0
     
     for year in range(1, vesting_years + 1):
         if year == 1:
@@ -157,7 +269,7 @@ def calculate_vesting_schedule(
         else:
             vested_this_year = annual_vest
         
-        cumulative = sum(schedule[y]["vested_this_year"] for y in range(1, year)) + vested_this_year if year > 1 else vested_this_year
+        cumulative += vested_this_year
         
         schedule[year] = {
             "vested_this_year": vested_this_year,
@@ -168,53 +280,165 @@ def calculate_vesting_schedule(
     return schedule
 
 
+def calculate_vesting_schedule_array(
+    total_grant: float,
+    vesting_years: int = 4,
+    cliff_months: int = 12,
+    is_public_company: bool = True,
+    company_stage: CompanyStage = None
+) -> VestingScheduleArray:
+    """
+    Array form of calculate_vesting_schedule for charts and batch callers.
+    Element i of each array is year i + 1 of the dict schedule.
+
+    Args:
+        total_grant: Total dollar value of equity grant
+        vesting_years: Number of years for full vesting
+        cliff_months: Months before first vesting (typically 12)
+        is_public_company: Whether company is publicly traded (legacy param)
+        company_stage: CompanyStage enum for precise risk adjustment
+
+    Returns:
+        VestingScheduleArray of float64 arrays of length vesting_years
+    """
+    stage = _resolve_stage(company_stage, is_public_company)
+
+    adjusted_total = total_grant * (1 - _DISCOUNTS[stage.index])
+    annual_vest = adjusted_total / vesting_years
+
+    vested = np.full(vesting_years, annual_vest, dtype=np.float64)
+    if vesting_years and cliff_months < 12:
+        vested[0] = annual_vest * (cliff_months / 12)
+
+    cumulative = np.cumsum(vested)
+
+    return VestingScheduleArray(
+        vested_this_year=vested,
+        cumulative_vested=cumulative,
+        remaining_unvested=adjusted_total - cumulative
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Offer:
+    """
+    Equity offer for compare_equity_offers. The comparison functions also
+    take plain dicts with these keys; missing keys get the same defaults.
+    company_stage may be a CompanyStage or its string tag; tags are
+    converted to members and unknown tags raise ValueError. Only a missing
+    stage falls back to is_public.
+    """
+    total_grant: float = 0
+    vesting_years: int = 4
+    is_public: bool = True
+    company_stage: Union[CompanyStage, str, None] = None
+
+    def __post_init__(self):
+        stage = self.company_stage
+        if isinstance(stage, str):
+            member = _STAGE_BY_VALUE.get(stage)
+            if member is None:
+                raise ValueError(f"{stage!r} is not a valid CompanyStage")
+            object.__setattr__(self, "company_stage", member)
+
+    @classmethod
+    def from_dict(cls, offer: Dict[str, float]) -> "Offer":
+        """Builds an Offer from a legacy offer dict."""
+        return cls(
+            total_grant=offer.get("total_grant", 0),
+            vesting_years=offer.get("vesting_years", 4),
+            is_public=offer.get("is_public", True),
+            company_stage=offer.get("company_stage")
+        )
+
+    @property
+    def stage(self) -> CompanyStage:
+        """Stage used for the risk discount."""
+        return _resolve_stage(self.company_stage, self.is_public)
+
+
+def _as_offer(offer: Union[Offer, Dict[str, float]]) -> Offer:
+    """Passes Offers through and converts legacy offer dicts."""
+    return offer if isinstance(offer, Offer) else Offer.from_dict(offer)
+
+
+def _offer_monthly_value(offer: Offer) -> float:
+    """Risk-adjusted monthly value of an offer, without building an RSUValue."""
+    if offer.total_grant <= 0:
+        return 0
+
+    return _rsu_for_stage(offer.total_grant, offer.vesting_years, offer.stage)[3]
+
+
 def compare_equity_offers(
-    offer_a: Dict[str, float],
-    offer_b: Dict[str, float]
+    offer_a: Union[Offer, Dict[str, float]],
+    offer_b: Union[Offer, Dict[str, float]]
 ) -> Dict[str, any]:
     """
     Compares two equity offers side-by-side.
 
     Args:
-        offer_a: First offer dict with total_grant, vesting_years, is_public/company_stage
-        offer_b: Second offer dict with total_grant, vesting_years, is_public/company_stage
+        offer_a: First Offer, or dict with total_grant, vesting_years, is_public/company_stage
+        offer_b: Second Offer, or dict with total_grant, vesting_years, is_public/company_stage
 
     Returns:
         Comparison dict with analysis and recommendation
     """
-    # Parse company stage from offer dict
-    stage_a = offer_a.get("company_stage")
-    if isinstance(stage_a, str):
-        stage_a = CompanyStage(stage_a)
-
-    stage_b = offer_b.get("company_stage")
-    if isinstance(stage_b, str):
-        stage_b = CompanyStage(stage_b)
-
-    rsu_a = calculate_rsu_value(
-        offer_a.get("total_grant", 0),
-        offer_a.get("vesting_years", 4),
-        0,
-        offer_a.get("is_public", True),
-        stage_a
-    )
+    monthly_a = _offer_monthly_value(_as_offer(offer_a))
+    monthly_b = _offer_monthly_value(_as_offer(offer_b))
+
+    monthly_diff = monthly_a - monthly_b
+    sign = (monthly_diff > 0) - (monthly_diff < 0)
+
+    winner = _OFFER_WINNERS[sign + 1]
+    abs_diff = monthly_diff * sign
 
-    rsu_b = calculate_rsu_value(
-        offer_b.get("total_grant", 0),
-        offer_b.get("vesting_years", 4),
-        0,
-        offer_b.get("is_public", True),
-        stage_b
-    )
-    
-    monthly_diff = rsu_a["monthly_value"] - rsu_b["monthly_value"]
-    
-    winner = "Offer A" if monthly_diff > 0 else "Offer B" if monthly_diff < 0 else "Tie"
-    
     return {
-        "offer_a_monthly": rsu_a["monthly_value"],
-        "offer_b_monthly": rsu_b["monthly_value"],
-        "monthly_difference": abs(monthly_diff),
+        "offer_a_monthly": monthly_a,
+        "offer_b_monthly": monthly_b,
+        "monthly_difference": abs_diff,
         "winner": winner,
-        "note": f"{winner} provides ${abs(monthly_diff):,.0f} more per month in adjusted equity value"
+        "note": f"{winner} provides ${abs_diff:,.0f} more per month in adjusted equity value"
     }
+
+
+def _offers_monthly_values(offers: Sequence[Union[Offer, Dict[str, float]]]) -> np.ndarray:
+    """Risk-adjusted monthly values of many offers via calculate_rsu_value_batch."""
+    offers = [_as_offer(offer) for offer in offers]
+    return calculate_rsu_value_batch(
+        [offer.total_grant for offer in offers],
+        [offer.vesting_years for offer in offers],
+        [offer.stage.index for offer in offers]
+    ).monthly_value
+
+
+def compare_equity_offers_batch(
+    offers_a: Sequence[Union[Offer, Dict[str, float]]],
+    offers_b: Sequence[Union[Offer, Dict[str, float]]]
+) -> EquityComparisonArray:
+    """
+    Vectorized compare_equity_offers over pairs of offers, e.g. one
+    candidate offer against many alternatives.
+
+    Args:
+        offers_a: First offer of each pair (Offers or offer dicts)
+        offers_b: Second offer of each pair
+
+    Returns:
+        EquityComparisonArray of parallel arrays; winner holds the
+        "Offer A" / "Offer B" / "Tie" labels
+    """
+    monthly_a = _offers_monthly_values(offers_a)
+    monthly_b = _offers_monthly_values(offers_b)
+
+    monthly_diff = monthly_a - monthly_b
+    # Same comparisons as the scalar path, so a NaN difference is a tie
+    # rather than an out-of-range index from casting np.sign(nan)
+    sign = (monthly_diff > 0).astype(np.intp) - (monthly_diff < 0)
+
+    return EquityComparisonArray(
+        offer_a_monthly=monthly_a,
+        offer_b_monthly=monthly_b,
+        monthly_difference=monthly_diff * sign,
+        winner=_OFFER_WINNERS_NP[sign + 1]
+    )
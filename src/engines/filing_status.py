@@ -0,0 +1,6 @@
+"""
+Filing status keys shared by the tax tables in the calculation engines.
+"""
+
+SINGLE = "single"
+MARRIED = "married"
@@ -1,12 +1,22 @@
 import json
 import os
-from typing import Dict, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engines._jit import njit
 from engines.bah_engine import bah_fetcher
+from engines.filing_status import SINGLE, MARRIED
+from engines.results import ResultMapping, result_record
 
 
 # 2025 Federal Tax Brackets
-FEDERAL_TAX_BRACKETS = {
-    'single': [
+FEDERAL_TAX_BRACKETS = MappingProxyType({
+    SINGLE: (
         {'min': 0, 'max': 11925, 'rate': 0.10},
         {'min': 11925, 'max': 48475, 'rate': 0.12},
         {'min': 48475, 'max': 103350, 'rate': 0.22},
@@ -14,8 +24,8 @@ FEDERAL_TAX_BRACKETS = {
         {'min': 197300, 'max': 250525, 'rate': 0.32},
         {'min': 250525, 'max': 626350, 'rate': 0.35},
         {'min': 626350, 'max': float('inf'), 'rate': 0.37},
-    ],
-    'married': [
+    ),
+    MARRIED: (
         {'min': 0, 'max': 23850, 'rate': 0.10},
         {'min': 23850, 'max': 96950, 'rate': 0.12},
         {'min': 96950, 'max': 206700, 'rate': 0.22},
@@ -23,9 +33,38 @@ FEDERAL_TAX_BRACKETS = {
         {'min': 394600, 'max': 501050, 'rate': 0.32},
         {'min': 501050, 'max': 751600, 'rate': 0.35},
         {'min': 751600, 'max': float('inf'), 'rate': 0.37},
-    ]
+    )
+})
+
+# 2025 standard deductions
+STANDARD_DEDUCTION_SINGLE = 15000.0
+STANDARD_DEDUCTION_MARRIED = 30000.0
+
+
+# Bracket tables as parallel (upper limits, rates) arrays per filing status
+FEDERAL_BRACKETS_NP = {
+    status: (
+        np.array([b['max'] for b in brackets], dtype=np.float64),
+        np.array([b['rate'] for b in brackets], dtype=np.float64),
+    )
+    for status, brackets in FEDERAL_TAX_BRACKETS.items()
 }
 
+# Module globals so the batch RMC kernel can read them as constants
+_SINGLE_MAX, _SINGLE_RATES = FEDERAL_BRACKETS_NP[SINGLE]
+_MARRIED_MAX, _MARRIED_RATES = FEDERAL_BRACKETS_NP[MARRIED]
+
+
+@njit(cache=True)
+def _marginal_rate_lookup(taxable_income, maxes, rates):
+    """
+    Rate of the first bracket whose upper limit covers taxable_income.
+    A left-sided search keeps income exactly at a limit in the lower
+    bracket; NaN sorts past the open top bracket and is clamped into it.
+    """
+    idx = np.searchsorted(maxes, taxable_income)
+    return rates[min(idx, len(rates) - 1)]
+
 
 def get_marginal_tax_rate(taxable_income: float, filing_status: str) -> float:
     """
@@ -38,18 +77,15 @@ def get_marginal_tax_rate(taxable_income: float, filing_status: str) -> float:
     Returns:
         Marginal tax rate as a decimal (e.g., 0.22 for 22%)
     """
-    brackets = FEDERAL_TAX_BRACKETS.get(filing_status.lower(), FEDERAL_TAX_BRACKETS['single'])
-
-    for bracket in brackets:
-        if taxable_income <= bracket['max']:
-            return bracket['rate']
-
-    return brackets[-1]['rate']
+    maxes, rates = FEDERAL_BRACKETS_NP.get(filing_status.lower(), FEDERAL_BRACKETS_NP[SINGLE])
+    return float(_marginal_rate_lookup(taxable_income, maxes, rates))
 
 
+@lru_cache(maxsize=16)
 def load_data(filename: str) -> Dict:
     """
     Utility to load JSON data from the data directory.
+    Parsed results are cached per filename; callers must not mutate them.
     
     Args:
         filename: Name of the JSON file to load
@@ -66,10 +102,26 @@ def load_data(filename: str) -> Dict:
         return {}
 
 
+@lru_cache(maxsize=None)
+def _pay_scale(rank: str) -> Tuple[array, array]:
+    """
+    Returns the pay table for a rank as parallel (years_thresholds, monthly_pays)
+    arrays sorted by threshold. Both are empty if the rank is not in the table.
+    """
+    scale = load_data('base_pay_2025.json').get(rank)
+    if not isinstance(scale, dict):
+        return array('i'), array('d')
+
+    pairs = sorted((0 if k == "<2" else int(k), float(v)) for k, v in scale.items())
+    return array('i', [t for t, _ in pairs]), array('d', [p for _, p in pairs])
+
+
+@lru_cache(maxsize=512)
 def get_base_pay(rank: str, years_of_service: int) -> float:
     """
     Fetches monthly base pay from 2025 military pay tables.
     Falls back to closest year if exact match not found.
+    Results are memoized per (rank, years_of_service).
     
     Args:
         rank: Military rank (e.g., "E-6", "O-3")
@@ -78,23 +130,18 @@ def get_base_pay(rank: str, years_of_service: int) -> float:
     Returns:
         Monthly base pay amount
     """
-    data = load_data('base_pay_2025.json')
-    if rank not in data:
+    thresholds, pays = _pay_scale(rank)
+    if not pays:
         return 0.0
-    
-    pay_scale = data[rank]
-    
-    sorted_years = sorted(pay_scale.keys(), key=lambda x: 0 if x == "<2" else int(x))
-    
-    best_match = "<2"
-    for y_key in sorted_years:
-        y_val = 0 if y_key == "<2" else int(y_key)
-        if years_of_service >= y_val:
-            best_match = y_key
-        else:
-            break
-            
-    return float(pay_scale.get(best_match, 0))
+
+    idx = bisect_right(thresholds, years_of_service) - 1
+    return pays[max(0, idx)]
+
+
+@lru_cache(maxsize=1024)
+def _cached_bah(location: str, rank: str, has_dependents: bool) -> Tuple[float, str]:
+    """Memoized BAH lookup; location is expected pre-normalized to upper case."""
+    return bah_fetcher.get_rate(location, rank, has_dependents)
 
 
 def get_bah_rate(location: str, rank: str, has_dependents: bool) -> Tuple[float, str]:
@@ -111,8 +158,7 @@ def get_bah_rate(location: str, rank: str, has_dependents: bool) -> Tuple[float,
         Tuple of (monthly BAH amount, source)
         Source is: "official_2026", "manual", or "not_found"
     """
-    rate, source = bah_fetcher.get_rate(location, rank, has_dependents)
-    return rate, source
+    return _cached_bah(location.strip().upper(), rank, has_dependents)
 
 
 def get_bas_rate(rank: str) -> float:
@@ -125,10 +171,20 @@ def get_bas_rate(rank: str) -> float:
     Returns:
         Monthly BAS amount (Officers: $320.78, Enlisted: $465.77)
     """
-    is_officer = rank.upper().startswith('O')
+    is_officer = bool(rank) and rank[0] in ('O', 'o')
     return 320.78 if is_officer else 465.77
 
 
+@njit(cache=True)
+def _allowance_tax_advantage(nontaxable, marginal_rate):
+    """
+    The tax that would be owed if the allowances were taxable. Shared by
+    calculate_tax_advantage and the batch kernel; works on scalars and
+    arrays, in whatever period nontaxable is given.
+    """
+    return nontaxable * marginal_rate
+
+
 def calculate_tax_advantage(base_pay: float, bah: float, bas: float, filing_status: str) -> float:
     """
     Calculates the tax advantage value of non-taxable military allowances.
@@ -148,26 +204,49 @@ def calculate_tax_advantage(base_pay: float, bah: float, bas: float, filing_stat
         Tax advantage value in dollars (monthly)
     """
     annual_base = base_pay * 12
-    annual_allowances = (bah + bas) * 12
 
-    # 2025 standard deductions
-    standard_deduction = 15000 if filing_status.lower() == "single" else 30000
+    if filing_status.lower() == SINGLE:
+        standard_deduction = STANDARD_DEDUCTION_SINGLE
+    else:
+        standard_deduction = STANDARD_DEDUCTION_MARRIED
 
     taxable_income = max(0, annual_base - standard_deduction)
 
     # Get actual marginal rate based on taxable income
     marginal_rate = get_marginal_tax_rate(taxable_income, filing_status)
 
-    # The tax advantage is the tax that would be owed if allowances were taxable
-    tax_advantage_annual = annual_allowances * marginal_rate
+    return _allowance_tax_advantage(float(bah + bas), marginal_rate)
+
+
+@result_record
+class RMCResult(ResultMapping):
+    """Regular Military Compensation breakdown (monthly amounts)."""
+    base_pay_monthly: float
+    bah_monthly: float
+    bas_monthly: float
+    tax_advantage_monthly: float
+    total_monthly: float
+    taxable_monthly: float
+    nontaxable_monthly: float
+    bah_source: str
 
-    return tax_advantage_annual / 12
 
+@result_record
+class RMCResultArray(ResultMapping):
+    """Structure-of-arrays counterpart to RMCResult for batched scenarios."""
+    tax_advantage_monthly: np.ndarray
+    total_monthly: np.ndarray
+    taxable_monthly: np.ndarray
+    nontaxable_monthly: np.ndarray
 
-def calculate_rmc(rank: str, years_of_service: int, location: str, has_dependents: bool, filing_status: str = "single", manual_bah: Optional[float] = None) -> Dict[str, float]:
+
+@lru_cache(maxsize=1024)
+def calculate_rmc(rank: str, years_of_service: int, location: str, has_dependents: bool, filing_status: str = SINGLE, manual_bah: Optional[float] = None) -> RMCResult:
     """
     Calculates Regular Military Compensation (RMC).
-    Returns dictionary with breakdown of taxable vs non-taxable components.
+    Returns an RMCResult with breakdown of taxable vs non-taxable components;
+    fields can be read as attributes or with dict-style indexing. Results
+    are memoized, which is safe because RMCResult is immutable.
     
     Args:
         rank: Military rank (e.g., "E-6", "O-3")
@@ -178,7 +257,7 @@ def calculate_rmc(rank: str, years_of_service: int, location: str, has_dependent
         manual_bah: Optional manual BAH override
         
     Returns:
-        Dictionary containing:
+        RMCResult containing:
             - base_pay_monthly: Monthly base pay (taxable)
             - bah_monthly: Monthly BAH (non-taxable)
             - bas_monthly: Monthly BAS (non-taxable)
@@ -203,13 +282,87 @@ def calculate_rmc(rank: str, years_of_service: int, location: str, has_dependent
     
     total_monthly = base_pay_monthly + bah_monthly + bas_monthly
     
-    return {
-        "base_pay_monthly": base_pay_monthly,
-        "bah_monthly": bah_monthly,
-        "bas_monthly": bas_monthly,
-        "tax_advantage_monthly": tax_advantage,
-        "total_monthly": total_monthly,
-        "taxable_monthly": base_pay_monthly,
-        "nontaxable_monthly": bah_monthly + bas_monthly,
-        "bah_source": bah_source
-    }
+    return RMCResult(
+        base_pay_monthly=base_pay_monthly,
+        bah_monthly=bah_monthly,
+        bas_monthly=bas_monthly,
+        tax_advantage_monthly=tax_advantage,
+        total_monthly=total_monthly,
+        taxable_monthly=base_pay_monthly,
+        nontaxable_monthly=bah_monthly + bas_monthly,
+        bah_source=bah_source
+    )
+
+
+@njit(cache=True)
+def _rmc_kernel(base_pay, bah, bas, filing_codes):
+    """
+    Array kernel behind calculate_rmc_batch.
+
+    filing_codes is 0 for single and 1 for married. Returns monthly
+    (tax_advantage, total, taxable, nontaxable) arrays.
+    """
+    married = filing_codes == 1
+
+    annual_base = base_pay * 12.0
+    nontaxable = bah + bas
+
+    standard_deduction = np.where(married, STANDARD_DEDUCTION_MARRIED, STANDARD_DEDUCTION_SINGLE)
+    taxable_income = np.maximum(0.0, annual_base - standard_deduction)
+
+    single_rate = _SINGLE_RATES[np.minimum(np.searchsorted(_SINGLE_MAX, taxable_income), len(_SINGLE_RATES) - 1)]
+    married_rate = _MARRIED_RATES[np.minimum(np.searchsorted(_MARRIED_MAX, taxable_income), len(_MARRIED_RATES) - 1)]
+    marginal_rate = np.where(married, married_rate, single_rate)
+
+    tax_advantage = _allowance_tax_advantage(nontaxable, marginal_rate)
+
+    return tax_advantage, base_pay + nontaxable, base_pay, nontaxable
+
+
+def calculate_rmc_batch(
+    base_pay_monthly: Sequence[float],
+    bah_monthly: Sequence[float],
+    bas_monthly: Sequence[float],
+    filing_statuses: Sequence[str]
+) -> RMCResultArray:
+    """
+    Vectorized RMC for many scenarios at once (sensitivity tables,
+    breakeven grids). Pay inputs are already resolved; use get_base_pay,
+    get_bah_rate and get_bas_rate to build them.
+
+    Args:
+        base_pay_monthly: Monthly base pay per scenario
+        bah_monthly: Monthly BAH per scenario
+        bas_monthly: Monthly BAS per scenario
+        filing_statuses: "single" or "married" per scenario
+
+    Returns:
+        RMCResultArray of parallel float64 arrays: tax_advantage_monthly,
+        total_monthly, taxable_monthly, nontaxable_monthly
+    """
+    filing_codes = np.array(
+        [1 if status.lower() == MARRIED else 0 for status in filing_statuses],
+        dtype=np.int64
+    )
+    tax_advantage, total, taxable, nontaxable = _rmc_kernel(
+        np.asarray(base_pay_monthly, dtype=np.float64),
+        np.asarray(bah_monthly, dtype=np.float64),
+        np.asarray(bas_monthly, dtype=np.float64),
+        filing_codes
+    )
+
+    return RMCResultArray(
+        tax_advantage_monthly=tax_advantage,
+        total_monthly=total,
+        taxable_monthly=taxable,
+        nontaxable_monthly=nontaxable
+    )
+
+
+def clear_caches() -> None:
+    """Drops memoized RMC results, pay and BAH lookups and loaded pay tables."""
+    calculate_rmc.cache_clear()
+    get_base_pay.cache_clear()
+    _cached_bah.cache_clear()
+    _pay_scale.cache_clear()
+    load_data.cache_clear()
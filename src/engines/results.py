@@ -0,0 +1,53 @@
+"""
+Result records returned by the calculation engines.
+
+Records are frozen, slotted dataclasses. They also implement the
+read-only Mapping protocol, so callers written against the dicts these
+functions used to return (``result["total_monthly"]``, ``.get()``,
+``in``, ``==`` against a dict) keep working alongside attribute access.
+
+Records are not dicts, though: ``json.dumps`` rejects them, so callers
+that serialize a result must convert it with ``as_dict()`` first.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, Tuple
+
+
+class ResultMapping(Mapping):
+    """Mapping view over the fields of a result record."""
+
+    __slots__ = ()
+
+    _keys: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._keys:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.items()))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns a plain dict copy of the record."""
+        return {key: getattr(self, key) for key in self._keys}
+
+
+def result_record(cls):
+    """
+    Class decorator turning a ResultMapping subclass into a frozen,
+    slotted dataclass with its field names registered as mapping keys.
+    The dataclass __eq__ is not generated, so Mapping.__eq__ compares a
+    record equal to any mapping with the same items, dicts included.
+    """
+    cls = dataclass(frozen=True, slots=True, eq=False)(cls)
+    cls._keys = tuple(f.name for f in fields(cls))
+    return cls
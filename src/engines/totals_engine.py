@@ -0,0 +1,87 @@
+"""4-year wealth totals for the military and civilian paths, moved out of app.py."""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from engines.civ_engine import CivilianNetResult
+from engines.equity_engine import RSUValue
+from engines.mil_engine import RMCResult
+from engines.results import ResultMapping, result_record
+
+
+@result_record
+class FourYearTotals(ResultMapping):
+    """4-year wealth totals for the military and civilian paths."""
+    mil_4yr_total: float
+    civ_4yr_total: float
+    four_year_delta: float
+    tsp_match_annual: float
+
+
+@result_record
+class FourYearTotalsArray(ResultMapping):
+    """Structure-of-arrays counterpart to FourYearTotals for batched scenarios."""
+    mil_4yr_total: np.ndarray
+    civ_4yr_total: np.ndarray
+    four_year_delta: np.ndarray
+    tsp_match_annual: np.ndarray
+
+
+def calculate_4yr_totals(mil_results: RMCResult, civ_results: CivilianNetResult, equity_calc: Optional[RSUValue]) -> FourYearTotals:
+    """
+    Calculate 4-year wealth totals for military and civilian paths.
+
+    Args:
+        mil_results: Military compensation results from calculate_rmc
+        civ_results: Civilian compensation results from calculate_civilian_net
+        equity_calc: Equity calculation results from calculate_rsu_value, or None
+
+    Returns:
+        FourYearTotals with mil_4yr_total, civ_4yr_total, four_year_delta, tsp_match_annual
+    """
+    # Military: 48 months of compensation + 4 years of TSP match (5% of base pay)
+    tsp_match_annual = mil_results.base_pay_monthly * 0.05 * 12
+    mil_4yr_total = mil_results.total_monthly * 48 + (tsp_match_annual * 4)
+
+    # Civilian: 48 months of net pay + total risk-adjusted equity value
+    equity_value = equity_calc.adjusted_value if equity_calc else 0
+    civ_4yr_total = civ_results.net_monthly * 48 + equity_value
+
+    return FourYearTotals(
+        mil_4yr_total=mil_4yr_total,
+        civ_4yr_total=civ_4yr_total,
+        four_year_delta=civ_4yr_total - mil_4yr_total,
+        tsp_match_annual=tsp_match_annual
+    )
+
+
+def calculate_4yr_totals_batch(
+    base_pay_monthly: Sequence[float],
+    total_monthly: Sequence[float],
+    net_monthly: Sequence[float],
+    adjusted_value: Sequence[float]
+) -> FourYearTotalsArray:
+    """
+    Vectorized calculate_4yr_totals for many scenarios at once. Inputs are
+    the four result fields the totals depend on, one entry per scenario.
+
+    Args:
+        base_pay_monthly: Monthly military base pay
+        total_monthly: Monthly military RMC total
+        net_monthly: Monthly civilian take-home
+        adjusted_value: Risk-adjusted equity value (0 for no equity)
+
+    Returns:
+        FourYearTotalsArray of parallel float64 arrays
+    """
+    tsp_match_annual = np.asarray(base_pay_monthly, dtype=np.float64) * 0.05 * 12
+    mil_4yr_total = np.asarray(total_monthly, dtype=np.float64) * 48 + (tsp_match_annual * 4)
+    civ_4yr_total = np.asarray(net_monthly, dtype=np.float64) * 48 + np.asarray(adjusted_value, dtype=np.float64)
+
+    return FourYearTotalsArray(
+        mil_4yr_total=mil_4yr_total,
+        civ_4yr_total=civ_4yr_total,
+        four_year_delta=civ_4yr_total - mil_4yr_total,
+        tsp_match_annual=tsp_match_annual
+    )
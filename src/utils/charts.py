@@ -1,6 +1,102 @@
+import numpy as np
 import plotly.graph_objects as go
 from typing import Dict, List
-from utils.design_system import get_chart_colors, get_chart_layout_defaults, COLORS
+from utils.design_system import (
+    get_chart_colors,
+    get_chart_layout_defaults,
+    COLORS,
+    LEGEND_BG_RGBA,
+    MILITARY_FILL_RGBA,
+    CIVILIAN_FILL_RGBA,
+)
+
+
+# Design tokens are constant for the process; build them once at import
+_CHART_COLORS = get_chart_colors()
+_LAYOUT_DEFAULTS = get_chart_layout_defaults()
+
+# Winner labels indexed by sign(military - civilian) + 1; ties go to the
+# civilian side for the monthly verdict and to military for the 4-year one
+_MONTHLY_WINNERS = ("Civilian Offer", "Civilian Offer", "Military")
+_SUMMARY_WINNERS = ("Civilian", "Civilian", "Military")
+_FOUR_YEAR_WINNERS = ("Civilian", "Military", "Military")
+
+# Summary skeletons, filled per call with str.format_map
+_EXEC_SUMMARY_TEMPLATE = """
+**CompMe Analysis: Executive Summary**
+
+A ${base_salary:,.0f} civilian offer {comparison_verb} an {rank} military salary by **${delta_abs:,.0f}/month**, {tax_clause} a **${tax_burden:,.0f} annual tax burden**.
+
+**Monthly Comparison:**
+- Military ({rank}): ${mil_monthly:,.0f}/month
+- Civilian Offer: ${civ_monthly:,.0f}/month (after tax)
+- **Winner: {winner}** (+${delta_abs:,.0f}/month)
+
+**4-Year Wealth Projection:**
+- Military Path: ${four_year_mil:,.0f} (includes 5% TSP match)
+- Civilian Path: ${four_year_civ:,.0f} (includes equity vesting)
+- **{four_year_winner} advantage:** ${four_year_delta:,.0f} over 4 years
+
+**Key Financial Metrics:**
+- Tax Efficiency: {retention_pct:.1f}% (civilian after-tax retention)
+- Equity Value (4-Year): ${equity_value:,.0f} (risk-adjusted)
+- Tax Advantage (Military): ${tax_advantage_monthly:,.0f}/month from BAH/BAS
+
+**Recommendation:**
+{recommendation}
+
+*Analysis generated by CompMe v3.0 | Verified 2025 data*
+""".strip()
+
+_RULE = "═══════════════════════════════════════════════════════"
+_SECTION_RULE = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+_SUBTOTAL_RULE = "   ─────────────────────────────────────"
+
+_SUMMARY_TEXT_TEMPLATE = "\n".join([
+    _RULE,
+    "COMPENSATION COMPARISON SUMMARY",
+    _RULE,
+    "",
+    "MONTHLY BREAKDOWN",
+    _SECTION_RULE,
+    "",
+    "Military ({rank})",
+    "   Base Pay:        ${base_pay_monthly:,.0f}",
+    "   BAH (Tax-Free):  ${bah_monthly:,.0f}",
+    "   BAS (Tax-Free):  ${bas_monthly:,.0f}",
+    "   Tax Advantage:   ${tax_advantage_monthly:,.0f}",
+    _SUBTOTAL_RULE,
+    "   Total Monthly:   ${mil_monthly:,.0f}",
+    "",
+    "Civilian Offer",
+    "   Base Salary:     ${base_salary:,.0f}/year",
+    "   Monthly Net:     ${civ_monthly:,.0f}",
+    "   Annual Equity:   ${annualized_equity:,.0f}",
+    _SUBTOTAL_RULE,
+    "   Total Monthly:   ${civ_monthly:,.0f}",
+    "",
+    "VERDICT",
+    _SECTION_RULE,
+    "",
+    "Monthly Winner:  {winner} (+${delta_abs:,.0f}/month)",
+    "",
+    "4-Year Outlook:",
+    "   Military Path:   ${four_year_mil:,.0f}",
+    "   Civilian Path:   ${four_year_civ:,.0f}",
+    _SUBTOTAL_RULE,
+    "   Net Difference:  ${four_year_prefix}{four_year_delta:,.0f}",
+    "",
+    "{equity_warning}KEY INSIGHTS",
+    _SECTION_RULE,
+    "",
+    "• Tax Advantage: ${tax_advantage_monthly:,.0f}/month saved by tax-free allowances",
+    "• Effective Tax Rate (Civilian): {effective_tax_pct:.1f}%",
+    "• Equity Risk Discount: {risk_discount:.0f}% applied",
+    "",
+    _RULE,
+    "Generated by CompMe v2.0 | compme-tool.com",
+    _RULE,
+])
 
 
 def render_wealth_chart(
@@ -22,54 +118,51 @@ def render_wealth_chart(
     Returns:
         Plotly figure object showing 4-year wealth comparison
     """
-    chart_colors = get_chart_colors()
-    layout_defaults = get_chart_layout_defaults()
-
-    years = [0, 1, 2, 3, 4]
-
-    mil_cumulative = []
-    civ_cumulative = []
-
-    for year in years:
-        mil_wealth = (mil_annual_net * year) + (tsp_match_annual * year)
-        mil_cumulative.append(mil_wealth)
-
-        civ_base_wealth = civ_annual_net * year
-
-        equity_vested = equity_vesting_schedule.get(year, 0)
-
-        civ_total_wealth = civ_base_wealth + equity_vested
-        civ_cumulative.append(civ_total_wealth)
-
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=mil_cumulative,
-        mode='lines+markers',
-        name='Military Path',
-        line=dict(color=chart_colors['military'], width=3),
-        marker=dict(size=10, symbol='circle'),
-        hovertemplate='<b>Year %{x}</b><br>Cumulative: $%{y:,.0f}<extra></extra>'
-    ))
-
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=civ_cumulative,
-        mode='lines+markers',
-        name='Civilian Path',
-        line=dict(color=chart_colors['civilian'], width=3),
-        marker=dict(size=10, symbol='square'),
-        hovertemplate='<b>Year %{x}</b><br>Cumulative: $%{y:,.0f}<extra></extra>'
-    ))
-
-    for year in [1, 2, 3, 4]:
-        if year in equity_vesting_schedule and equity_vesting_schedule[year] > equity_vesting_schedule.get(year - 1, 0):
-            vested_this_year = equity_vesting_schedule[year] - equity_vesting_schedule.get(year - 1, 0)
-            fig.add_annotation(
-                x=year,
-                y=civ_cumulative[year],
-                text=f"${vested_this_year:,.0f}<br>vests",
+    chart_colors = _CHART_COLORS
+    layout_defaults = _LAYOUT_DEFAULTS
+
+    years = np.arange(5)
+
+    equity_arr = np.array([equity_vesting_schedule.get(year, 0) for year in range(5)], dtype=float)
+    equity_deltas = np.diff(equity_arr)
+
+    mil_cumulative = (mil_annual_net + tsp_match_annual) * years
+    civ_cumulative = civ_annual_net * years + equity_arr
+
+    traces = [
+        dict(
+            type='scatter',
+            x=years.tolist(),
+            y=mil_cumulative.tolist(),
+            mode='lines+markers',
+            name='Military Path',
+            line=dict(width=3),
+            marker=dict(size=10, symbol='circle'),
+            hovertemplate='<b>Year %{x}</b><br>Cumulative: $%{y:,.0f}<extra></extra>'
+        ),
+        dict(
+            type='scatter',
+            x=years.tolist(),
+            y=civ_cumulative.tolist(),
+            mode='lines+markers',
+            name='Civilian Path',
+            line=dict(width=3),
+            marker=dict(size=10, symbol='square'),
+            hovertemplate='<b>Year %{x}</b><br>Cumulative: $%{y:,.0f}<extra></extra>'
+        ),
+    ]
+
+    # With no equity there is nothing vesting and no cliff to warn about
+    has_equity = bool((equity_arr > 0).any())
+
+    annotations = []
+    if has_equity:
+        # Only years where new equity vests get an annotation
+        for year in np.flatnonzero(equity_deltas > 0) + 1:
+            annotations.append(dict(
+                x=int(year),
+                y=float(civ_cumulative[year]),
+                text=f"${equity_deltas[year - 1]:,.0f}<br>vests",
                 showarrow=True,
                 arrowhead=2,
                 arrowsize=1,
@@ -78,17 +171,31 @@ def render_wealth_chart(
                 ax=30,
                 ay=-40,
                 font=dict(size=10, color=chart_colors['equity'])
-            )
+            ))
 
-    fig.update_layout(
+        if civ_cumulative[1] == civ_cumulative[0] + (civ_annual_net * 1):
+            annotations.append(dict(
+                x=1,
+                y=float(civ_cumulative[1]),
+                text="1-Year Cliff<br>No equity yet!",
+                showarrow=True,
+                arrowhead=2,
+                arrowsize=1,
+                arrowwidth=2,
+                arrowcolor=COLORS['error'],
+                ax=-50,
+                ay=-50,
+                font=dict(size=12, color=COLORS['error'], family="Arial Black")
+            ))
+
+    layout = dict(
+        colorway=layout_defaults['colorway'],
         title={
             'text': "4-Year Wealth Accumulation: Military vs. Civilian",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 18, 'color': chart_colors['text']}
         },
-        xaxis_title="Year",
-        yaxis_title="Cumulative Wealth ($)",
         hovermode='x unified',
         height=500,
         showlegend=True,
@@ -97,11 +204,12 @@ def render_wealth_chart(
             y=0.99,
             xanchor="left",
             x=0.01,
-            bgcolor=f"rgba(224, 229, 236, 0.9)"
+            bgcolor=LEGEND_BG_RGBA
         ),
         plot_bgcolor=chart_colors['background'],
         paper_bgcolor=chart_colors['background'],
         xaxis=dict(
+            title=dict(text="Year"),
             tickmode='linear',
             tick0=0,
             dtick=1,
@@ -109,6 +217,7 @@ def render_wealth_chart(
             linecolor=COLORS['shadow_dark']
         ),
         yaxis=dict(
+            title=dict(text="Cumulative Wealth ($)"),
             gridcolor=chart_colors['grid'],
             tickformat='$,.0f',
             linecolor=COLORS['shadow_dark']
@@ -116,25 +225,11 @@ def render_wealth_chart(
         font=dict(
             family=layout_defaults['font']['family'],
             color=chart_colors['text']
-        )
+        ),
+        annotations=annotations
     )
 
-    if civ_cumulative[1] == civ_cumulative[0] + (civ_annual_net * 1):
-        fig.add_annotation(
-            x=1,
-            y=civ_cumulative[1],
-            text="1-Year Cliff<br>No equity yet!",
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1,
-            arrowwidth=2,
-            arrowcolor=COLORS['error'],
-            ax=-50,
-            ay=-50,
-            font=dict(size=12, color=COLORS['error'], family="Arial Black")
-        )
-
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 
 def render_breakeven_analysis(
@@ -153,7 +248,7 @@ def render_breakeven_analysis(
     Returns:
         Plotly figure showing monthly comparison over 48 months
     """
-    chart_colors = get_chart_colors()
+    chart_colors = _CHART_COLORS
 
     months = list(range(0, 49))
 
@@ -166,27 +261,46 @@ def render_breakeven_analysis(
         equity_vested = equity_annual * year
         civ_cumulative.append(civ_base + equity_vested)
 
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatter(
-        x=months,
-        y=mil_cumulative,
-        mode='lines',
-        name='Military',
-        line=dict(color=chart_colors['military'], width=2),
-        fill='tozeroy',
-        fillcolor='rgba(16, 185, 129, 0.1)'
-    ))
-
-    fig.add_trace(go.Scatter(
-        x=months,
-        y=civ_cumulative,
-        mode='lines',
-        name='Civilian',
-        line=dict(color=chart_colors['civilian'], width=2),
-        fill='tozeroy',
-        fillcolor='rgba(59, 130, 246, 0.1)'
-    ))
+    traces = [
+        dict(
+            type='scatter',
+            x=months,
+            y=mil_cumulative,
+            mode='lines',
+            name='Military',
+            line=dict(width=2),
+            fill='tozeroy',
+            fillcolor=MILITARY_FILL_RGBA
+        ),
+        dict(
+            type='scatter',
+            x=months,
+            y=civ_cumulative,
+            mode='lines',
+            name='Civilian',
+            line=dict(width=2),
+            fill='tozeroy',
+            fillcolor=CIVILIAN_FILL_RGBA
+        ),
+    ]
+
+    layout = dict(
+        colorway=_LAYOUT_DEFAULTS['colorway'],
+        title=dict(text="Break-Even Analysis: When Does Civilian Overtake Military?"),
+        hovermode='x unified',
+        height=400,
+        plot_bgcolor=chart_colors['background'],
+        paper_bgcolor=chart_colors['background'],
+        yaxis=dict(
+            title=dict(text="Cumulative Wealth ($)"),
+            tickformat='$,.0f',
+            gridcolor=chart_colors['grid']
+        ),
+        xaxis=dict(title=dict(text="Month"), gridcolor=chart_colors['grid']),
+        showlegend=True
+    )
+
+    fig = go.Figure(data=traces, layout=layout)
 
     breakeven_month = None
     for month in months:
@@ -203,19 +317,6 @@ def render_breakeven_analysis(
             annotation_position="top"
         )
 
-    fig.update_layout(
-        title="Break-Even Analysis: When Does Civilian Overtake Military?",
-        xaxis_title="Month",
-        yaxis_title="Cumulative Wealth ($)",
-        hovermode='x unified',
-        height=400,
-        plot_bgcolor=chart_colors['background'],
-        paper_bgcolor=chart_colors['background'],
-        yaxis=dict(tickformat='$,.0f', gridcolor=chart_colors['grid']),
-        xaxis=dict(gridcolor=chart_colors['grid']),
-        showlegend=True
-    )
-
     return fig
 
 
@@ -246,46 +347,46 @@ def generate_executive_summary(
     mil_monthly = mil_results['total_monthly']
     civ_monthly = civ_results['net_monthly']
     delta = mil_monthly - civ_monthly
+    sign = (delta > 0) - (delta < 0)
     
-    winner = "Military" if delta > 0 else "Civilian Offer"
-    delta_abs = abs(delta)
+    winner = _MONTHLY_WINNERS[sign + 1]
+    delta_abs = delta * sign
     
     tsp_match = mil_results['base_pay_monthly'] * 0.05 * 12 * 4
     four_year_mil = mil_monthly * 48 + tsp_match
     four_year_civ = civ_monthly * 48 + equity_calc.get('adjusted_value', 0)
-    four_year_delta = abs(four_year_civ - four_year_mil)
-    four_year_winner = "Civilian" if four_year_civ > four_year_mil else "Military"
+    four_year_diff = four_year_mil - four_year_civ
+    four_year_sign = (four_year_diff > 0) - (four_year_diff < 0)
+    four_year_delta = four_year_diff * four_year_sign
+    four_year_winner = _FOUR_YEAR_WINNERS[four_year_sign + 1]
     
     tax_burden = civ_results['total_tax']
     equity_value = equity_calc.get('adjusted_value', 0)
     
-    summary = f"""
-**CompMe Analysis: Executive Summary**
-
-A ${base_salary:,.0f} civilian offer {"beats" if delta < 0 else "falls short of"} an {rank} military salary by **${delta_abs:,.0f}/month**, {"but requires" if delta < 0 else "while avoiding"} a **${tax_burden:,.0f} annual tax burden**.
-
-**Monthly Comparison:**
-- Military ({rank}): ${mil_monthly:,.0f}/month
-- Civilian Offer: ${civ_monthly:,.0f}/month (after tax)
-- **Winner: {winner}** (+${delta_abs:,.0f}/month)
-
-**4-Year Wealth Projection:**
-- Military Path: ${four_year_mil:,.0f} (includes 5% TSP match)
-- Civilian Path: ${four_year_civ:,.0f} (includes equity vesting)
-- **{four_year_winner} advantage:** ${four_year_delta:,.0f} over 4 years
-
-**Key Financial Metrics:**
-- Tax Efficiency: {(1 - civ_results['effective_tax_rate']) * 100:.1f}% (civilian after-tax retention)
-- Equity Value (4-Year): ${equity_value:,.0f} (risk-adjusted)
-- Tax Advantage (Military): ${mil_results['tax_advantage_monthly']:,.0f}/month from BAH/BAS
-
-**Recommendation:**
-{"The civilian offer provides significantly higher total compensation, but relies on equity performance." if delta < 0 and equity_value > 0 else "Consider long-term career goals, lifestyle preferences, and risk tolerance when making this decision."}
-
-*Analysis generated by CompMe v3.0 | Verified 2025 data*
-"""
+    if delta < 0 and equity_value > 0:
+        recommendation = "The civilian offer provides significantly higher total compensation, but relies on equity performance."
+    else:
+        recommendation = "Consider long-term career goals, lifestyle preferences, and risk tolerance when making this decision."
     
-    return summary.strip()
+    return _EXEC_SUMMARY_TEMPLATE.format_map({
+        'base_salary': base_salary,
+        'comparison_verb': "beats" if delta < 0 else "falls short of",
+        'rank': rank,
+        'delta_abs': delta_abs,
+        'tax_clause': "but requires" if delta < 0 else "while avoiding",
+        'tax_burden': tax_burden,
+        'mil_monthly': mil_monthly,
+        'civ_monthly': civ_monthly,
+        'winner': winner,
+        'four_year_mil': four_year_mil,
+        'four_year_civ': four_year_civ,
+        'four_year_winner': four_year_winner,
+        'four_year_delta': four_year_delta,
+        'retention_pct': (1 - civ_results['effective_tax_rate']) * 100,
+        'equity_value': equity_value,
+        'tax_advantage_monthly': mil_results['tax_advantage_monthly'],
+        'recommendation': recommendation,
+    })
 
 
 def generate_summary_text(
@@ -314,60 +415,37 @@ def generate_summary_text(
     mil_monthly = mil_results['total_monthly']
     civ_monthly = civ_results['net_monthly']
     delta = mil_monthly - civ_monthly
+    sign = (delta > 0) - (delta < 0)
     
-    winner = "Military" if delta > 0 else "Civilian"
-    delta_abs = abs(delta)
+    winner = _SUMMARY_WINNERS[sign + 1]
+    delta_abs = delta * sign
     
     four_year_mil = mil_monthly * 48
     four_year_civ = civ_monthly * 48 + equity_calc.get('adjusted_value', 0)
     four_year_delta = four_year_civ - four_year_mil
     
-    summary = f"""
-═══════════════════════════════════════════════════════
-COMPENSATION COMPARISON SUMMARY
-═══════════════════════════════════════════════════════
-
-MONTHLY BREAKDOWN
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Military ({rank})
-   Base Pay:        ${mil_results['base_pay_monthly']:,.0f}
-   BAH (Tax-Free):  ${mil_results['bah_monthly']:,.0f}
-   BAS (Tax-Free):  ${mil_results['bas_monthly']:,.0f}
-   Tax Advantage:   ${mil_results['tax_advantage_monthly']:,.0f}
-   ─────────────────────────────────────
-   Total Monthly:   ${mil_monthly:,.0f}
-
-Civilian Offer
-   Base Salary:     ${base_salary:,.0f}/year
-   Monthly Net:     ${civ_monthly:,.0f}
-   Annual Equity:   ${equity_calc.get('annualized_value', 0):,.0f}
-   ─────────────────────────────────────
-   Total Monthly:   ${civ_monthly:,.0f}
-
-VERDICT
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Monthly Winner:  {winner} (+${delta_abs:,.0f}/month)
-
-4-Year Outlook:
-   Military Path:   ${four_year_mil:,.0f}
-   Civilian Path:   ${four_year_civ:,.0f}
-   ─────────────────────────────────────
-   Net Difference:  ${'+' if four_year_delta > 0 else ''}{four_year_delta:,.0f}
-
-{'Private Equity Warning: ' + equity_calc['liquidity_note'] if equity_calc.get('risk_discount', 0) > 0 else ''}
-
-KEY INSIGHTS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-• Tax Advantage: ${mil_results['tax_advantage_monthly']:,.0f}/month saved by tax-free allowances
-• Effective Tax Rate (Civilian): {civ_results['effective_tax_rate']*100:.1f}%
-• Equity Risk Discount: {equity_calc.get('risk_discount', 0):.0f}% applied
-
-═══════════════════════════════════════════════════════
-Generated by CompMe v2.0 | compme-tool.com
-═══════════════════════════════════════════════════════
-"""
+    if equity_calc.get('risk_discount', 0) > 0:
+        equity_warning = f"Private Equity Warning: {equity_calc['liquidity_note']}\n\n"
+    else:
+        equity_warning = ""
     
-    return summary.strip()
+    return _SUMMARY_TEXT_TEMPLATE.format_map({
+        'rank': rank,
+        'base_pay_monthly': mil_results['base_pay_monthly'],
+        'bah_monthly': mil_results['bah_monthly'],
+        'bas_monthly': mil_results['bas_monthly'],
+        'tax_advantage_monthly': mil_results['tax_advantage_monthly'],
+        'mil_monthly': mil_monthly,
+        'base_salary': base_salary,
+        'civ_monthly': civ_monthly,
+        'annualized_equity': equity_calc.get('annualized_value', 0),
+        'winner': winner,
+        'delta_abs': delta_abs,
+        'four_year_mil': four_year_mil,
+        'four_year_civ': four_year_civ,
+        'four_year_prefix': '+' if four_year_delta > 0 else '',
+        'four_year_delta': four_year_delta,
+        'equity_warning': equity_warning,
+        'effective_tax_pct': civ_results['effective_tax_rate'] * 100,
+        'risk_discount': equity_calc.get('risk_discount', 0),
+    })
@@ -5,11 +5,16 @@ A soft, modern design system with neumorphic shadows and carefully
 crafted color palette for the military-to-civilian compensation analyzer.
 """
 
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
 # =============================================================================
 # COLOR PALETTE
 # =============================================================================
 
-COLORS = {
+COLORS = MappingProxyType({
     # Background colors
     'background': '#e0e5ec',
     'background_dark': '#d1d9e6',
@@ -48,14 +53,14 @@ COLORS = {
     'chart_civilian': '#3b82f6',
     'chart_equity': '#ec4899',
     'chart_bonus': '#8b5cf6',
-}
+})
 
 
 # =============================================================================
 # SHADOW SYSTEM
 # =============================================================================
 
-SHADOWS = {
+SHADOWS = MappingProxyType({
     # Outset shadows (raised elements like cards, buttons)
     'outset_sm': '4px 4px 8px #a3b1c6, -4px -4px 8px #ffffff',
     'outset_md': '8px 8px 16px #a3b1c6, -8px -8px 16px #ffffff',
@@ -68,14 +73,14 @@ SHADOWS = {
 
     # Flat (no shadow - for transitions)
     'flat': 'none',
-}
+})
 
 
 # =============================================================================
 # TYPOGRAPHY
 # =============================================================================
 
-TYPOGRAPHY = {
+TYPOGRAPHY = MappingProxyType({
     'font_family': "'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif",
 
     # Font sizes
@@ -100,320 +105,419 @@ TYPOGRAPHY = {
     'line_height_tight': '1.25',
     'line_height_normal': '1.5',
     'line_height_relaxed': '1.75',
-}
+})
 
 
 # =============================================================================
 # SPACING SCALE (4px base)
 # =============================================================================
 
-SPACING = {
+SPACING = MappingProxyType({
     'xs': '4px',
     'sm': '8px',
     'md': '16px',
     'lg': '24px',
     'xl': '32px',
     'xxl': '48px',
-}
+})
 
 
 # =============================================================================
 # BORDER RADIUS
 # =============================================================================
 
-RADIUS = {
+RADIUS = MappingProxyType({
     'sm': '8px',
     'md': '12px',
     'lg': '16px',
     'xl': '24px',
     'full': '9999px',
-}
+})
 
 
 # =============================================================================
-# CSS GENERATORS
+# CHART RGBA FRAGMENTS
 # =============================================================================
 
-def get_streamlit_css() -> str:
-    """
-    Generate the complete Streamlit CSS for the neumorphic design system.
+GRID_RGBA = 'rgba(163, 177, 198, 0.3)'
+LEGEND_BG_RGBA = 'rgba(224, 229, 236, 0.9)'
+MILITARY_FILL_RGBA = 'rgba(16, 185, 129, 0.1)'   # success at 10%
+CIVILIAN_FILL_RGBA = 'rgba(59, 130, 246, 0.1)'   # primary at 10%
 
-    Returns:
-        Complete CSS string to inject via st.markdown
-    """
-    return f"""
+
+# =============================================================================
+# CSS GENERATORS
+# =============================================================================
+
+# Stylesheet sections as string.Template source; ${group_token} placeholders
+# are filled from _CSS_VARS (e.g. ${color_background} -> COLORS['background'])
+_PREAMBLE_CSS = """
     <style>
     /* =================================================================
        COMPME NEUMORPHIC DESIGN SYSTEM
        ================================================================= */
 
     /* Hide Streamlit branding */
-    #MainMenu {{visibility: hidden;}}
-    footer {{visibility: hidden;}}
-    header {{visibility: hidden;}}
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+"""
 
+_ROOT_VARS_CSS = """
     /* Root variables */
-    :root {{
-        --bg-main: {COLORS['background']};
-        --bg-dark: {COLORS['background_dark']};
-        --shadow-dark: {COLORS['shadow_dark']};
-        --shadow-light: {COLORS['shadow_light']};
-        --primary: {COLORS['primary']};
-        --success: {COLORS['success']};
-        --accent: {COLORS['accent']};
-        --text-primary: {COLORS['text_primary']};
-        --text-secondary: {COLORS['text_secondary']};
-    }}
+    :root {
+        --bg-main: ${color_background};
+        --bg-dark: ${color_background_dark};
+        --shadow-dark: ${color_shadow_dark};
+        --shadow-light: ${color_shadow_light};
+        --primary: ${color_primary};
+        --success: ${color_success};
+        --accent: ${color_accent};
+        --text-primary: ${color_text_primary};
+        --text-secondary: ${color_text_secondary};
+    }
+"""
 
+_CONTAINER_CSS = """
     /* Main background */
-    .main, .stApp {{
-        background-color: {COLORS['background']} !important;
-    }}
+    .main, .stApp {
+        background-color: ${color_background} !important;
+    }
 
     /* Neumorphic containers */
-    div[data-testid="stVerticalBlockBorderWrapper"] {{
-        background: {COLORS['background']};
-        border-radius: {RADIUS['lg']};
-        box-shadow: {SHADOWS['outset_md']};
+    div[data-testid="stVerticalBlockBorderWrapper"] {
+        background: ${color_background};
+        border-radius: ${radius_lg};
+        box-shadow: ${shadow_outset_md};
         border: none !important;
-        padding: {SPACING['md']};
-    }}
+        padding: ${space_md};
+    }
+"""
 
+_INPUT_CSS = """
     /* Inset inputs */
     .stTextInput > div > div > input,
     .stNumberInput > div > div > input,
     .stTextArea > div > div > textarea,
-    .stSelectbox > div > div {{
-        background: {COLORS['background']} !important;
+    .stSelectbox > div > div {
+        background: ${color_background} !important;
         border: none !important;
-        border-radius: {RADIUS['md']};
-        box-shadow: {SHADOWS['inset_md']};
-        padding: {SPACING['sm']} {SPACING['md']};
-        color: {COLORS['text_primary']};
-    }}
+        border-radius: ${radius_md};
+        box-shadow: ${shadow_inset_md};
+        padding: ${space_sm} ${space_md};
+        color: ${color_text_primary};
+    }
 
     .stTextInput > div > div > input:focus,
     .stNumberInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus {{
-        box-shadow: {SHADOWS['inset_lg']};
+    .stTextArea > div > div > textarea:focus {
+        box-shadow: ${shadow_inset_lg};
         outline: none;
-    }}
+    }
+"""
 
+_BUTTON_CSS = """
     /* Neumorphic buttons */
-    .stButton > button {{
-        background: {COLORS['background']};
+    .stButton > button {
+        background: ${color_background};
         border: none !important;
-        border-radius: {RADIUS['md']};
-        box-shadow: {SHADOWS['outset_sm']};
-        color: {COLORS['text_primary']};
-        font-weight: {TYPOGRAPHY['weight_semibold']};
-        padding: {SPACING['sm']} {SPACING['lg']};
+        border-radius: ${radius_md};
+        box-shadow: ${shadow_outset_sm};
+        color: ${color_text_primary};
+        font-weight: ${type_weight_semibold};
+        padding: ${space_sm} ${space_lg};
         transition: all 0.2s ease;
-    }}
+    }
 
-    .stButton > button:hover {{
-        box-shadow: {SHADOWS['outset_md']};
-    }}
+    .stButton > button:hover {
+        box-shadow: ${shadow_outset_md};
+    }
 
-    .stButton > button:active {{
-        box-shadow: {SHADOWS['inset_sm']};
-    }}
+    .stButton > button:active {
+        box-shadow: ${shadow_inset_sm};
+    }
 
     /* Primary button variant */
-    .stButton > button[kind="primary"] {{
-        background: linear-gradient(145deg, {COLORS['primary']}, {COLORS['primary_dark']});
-        color: {COLORS['text_light']};
-        box-shadow: 4px 4px 8px {COLORS['shadow_dark']}, -2px -2px 6px {COLORS['primary_light']};
-    }}
+    .stButton > button[kind="primary"] {
+        background: linear-gradient(145deg, ${color_primary}, ${color_primary_dark});
+        color: ${color_text_light};
+        box-shadow: 4px 4px 8px ${color_shadow_dark}, -2px -2px 6px ${color_primary_light};
+    }
 
-    .stButton > button[kind="primary"]:hover {{
-        box-shadow: 6px 6px 12px {COLORS['shadow_dark']}, -3px -3px 8px {COLORS['primary_light']};
-    }}
+    .stButton > button[kind="primary"]:hover {
+        box-shadow: 6px 6px 12px ${color_shadow_dark}, -3px -3px 8px ${color_primary_light};
+    }
+"""
 
+_TAB_CSS = """
     /* Tabs - neumorphic style */
-    .stTabs [data-baseweb="tab-list"] {{
-        background: {COLORS['background']};
-        border-radius: {RADIUS['md']};
-        box-shadow: {SHADOWS['inset_sm']};
-        padding: {SPACING['xs']};
-        gap: {SPACING['xs']};
-    }}
-
-    .stTabs [data-baseweb="tab"] {{
+    .stTabs [data-baseweb="tab-list"] {
+        background: ${color_background};
+        border-radius: ${radius_md};
+        box-shadow: ${shadow_inset_sm};
+        padding: ${space_xs};
+        gap: ${space_xs};
+    }
+
+    .stTabs [data-baseweb="tab"] {
         background: transparent;
-        border-radius: {RADIUS['sm']};
-        color: {COLORS['text_secondary']};
-        font-weight: {TYPOGRAPHY['weight_medium']};
-        padding: {SPACING['sm']} {SPACING['md']};
-    }}
-
-    .stTabs [aria-selected="true"] {{
-        background: {COLORS['background']};
-        box-shadow: {SHADOWS['outset_sm']};
-        color: {COLORS['primary']};
-    }}
+        border-radius: ${radius_sm};
+        color: ${color_text_secondary};
+        font-weight: ${type_weight_medium};
+        padding: ${space_sm} ${space_md};
+    }
+
+    .stTabs [aria-selected="true"] {
+        background: ${color_background};
+        box-shadow: ${shadow_outset_sm};
+        color: ${color_primary};
+    }
+"""
 
+_METRIC_CSS = """
     /* Metrics */
-    [data-testid="stMetricValue"] {{
-        font-size: {TYPOGRAPHY['metric_value']} !important;
-        font-weight: {TYPOGRAPHY['weight_bold']};
-        color: {COLORS['text_primary']};
-    }}
-
-    [data-testid="stMetricLabel"] {{
-        font-size: {TYPOGRAPHY['metric_label']} !important;
-        font-weight: {TYPOGRAPHY['weight_medium']};
-        color: {COLORS['text_secondary']};
+    [data-testid="stMetricValue"] {
+        font-size: ${type_metric_value} !important;
+        font-weight: ${type_weight_bold};
+        color: ${color_text_primary};
+    }
+
+    [data-testid="stMetricLabel"] {
+        font-size: ${type_metric_label} !important;
+        font-weight: ${type_weight_medium};
+        color: ${color_text_secondary};
         text-transform: uppercase;
         letter-spacing: 0.5px;
-    }}
+    }
 
     /* Positive/negative delta colors */
-    .positive {{
-        color: {COLORS['success']};
-    }}
+    .positive {
+        color: ${color_success};
+    }
 
-    .negative {{
-        color: {COLORS['error']};
-    }}
+    .negative {
+        color: ${color_error};
+    }
+"""
 
+_EXPANDER_CSS = """
     /* Expanders */
-    .streamlit-expanderHeader {{
-        background: {COLORS['background']};
-        border-radius: {RADIUS['md']};
-        box-shadow: {SHADOWS['outset_sm']};
+    .streamlit-expanderHeader {
+        background: ${color_background};
+        border-radius: ${radius_md};
+        box-shadow: ${shadow_outset_sm};
         border: none !important;
-    }}
+    }
 
-    .streamlit-expanderContent {{
-        background: {COLORS['background']};
-        border-radius: 0 0 {RADIUS['md']} {RADIUS['md']};
-        box-shadow: {SHADOWS['inset_sm']};
-    }}
+    .streamlit-expanderContent {
+        background: ${color_background};
+        border-radius: 0 0 ${radius_md} ${radius_md};
+        box-shadow: ${shadow_inset_sm};
+    }
+"""
 
+_CONTROL_CSS = """
     /* Slider */
-    .stSlider > div > div > div {{
-        background: {COLORS['background']};
-        box-shadow: {SHADOWS['inset_sm']};
-        border-radius: {RADIUS['full']};
-    }}
+    .stSlider > div > div > div {
+        background: ${color_background};
+        box-shadow: ${shadow_inset_sm};
+        border-radius: ${radius_full};
+    }
 
-    .stSlider > div > div > div > div {{
-        background: {COLORS['primary']};
-        box-shadow: {SHADOWS['outset_sm']};
-    }}
+    .stSlider > div > div > div > div {
+        background: ${color_primary};
+        box-shadow: ${shadow_outset_sm};
+    }
 
     /* Checkbox */
-    .stCheckbox > label > div {{
-        background: {COLORS['background']};
-        box-shadow: {SHADOWS['inset_sm']};
-        border-radius: {RADIUS['sm']};
-    }}
+    .stCheckbox > label > div {
+        background: ${color_background};
+        box-shadow: ${shadow_inset_sm};
+        border-radius: ${radius_sm};
+    }
 
     /* Radio buttons */
-    .stRadio > div {{
-        background: {COLORS['background']};
-        border-radius: {RADIUS['md']};
-        padding: {SPACING['sm']};
-    }}
+    .stRadio > div {
+        background: ${color_background};
+        border-radius: ${radius_md};
+        padding: ${space_sm};
+    }
+"""
 
+_SIDEBAR_CSS = """
     /* Sidebar */
-    section[data-testid="stSidebar"] {{
-        background: {COLORS['background_dark']};
-    }}
+    section[data-testid="stSidebar"] {
+        background: ${color_background_dark};
+    }
 
-    section[data-testid="stSidebar"] > div {{
-        background: {COLORS['background_dark']};
-    }}
+    section[data-testid="stSidebar"] > div {
+        background: ${color_background_dark};
+    }
+"""
 
+_CONTENT_CSS = """
     /* Info/Warning/Error boxes */
-    .stAlert {{
-        background: {COLORS['background']};
-        border-radius: {RADIUS['md']};
-        box-shadow: {SHADOWS['inset_sm']};
+    .stAlert {
+        background: ${color_background};
+        border-radius: ${radius_md};
+        box-shadow: ${shadow_inset_sm};
         border-left: 4px solid;
-    }}
+    }
 
     /* Remove default borders */
-    hr {{
+    hr {
         border: none;
         height: 2px;
-        background: linear-gradient(90deg, transparent, {COLORS['shadow_dark']}, transparent);
-        margin: {SPACING['lg']} 0;
-    }}
+        background: linear-gradient(90deg, transparent, ${color_shadow_dark}, transparent);
+        margin: ${space_lg} 0;
+    }
 
     /* Subheaders */
-    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {{
-        color: {COLORS['text_primary']};
-    }}
+    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
+        color: ${color_text_primary};
+    }
 
     /* Equal height containers */
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {{
+    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
         min-height: 100%;
         height: 100%;
-    }}
+    }
 
     /* Chart container styling */
-    .js-plotly-plot {{
-        border-radius: {RADIUS['md']};
-    }}
+    .js-plotly-plot {
+        border-radius: ${radius_md};
+    }
 
     </style>
     """
 
 
-def get_chart_colors() -> dict:
+_CSS_PARTS = (
+    _PREAMBLE_CSS,
+    _ROOT_VARS_CSS,
+    _CONTAINER_CSS,
+    _INPUT_CSS,
+    _BUTTON_CSS,
+    _TAB_CSS,
+    _METRIC_CSS,
+    _EXPANDER_CSS,
+    _CONTROL_CSS,
+    _SIDEBAR_CSS,
+    _CONTENT_CSS,
+)
+
+# Flat token mapping for the template, built once
+_CSS_VARS = {
+    **{f'color_{key}': value for key, value in COLORS.items()},
+    **{f'shadow_{key}': value for key, value in SHADOWS.items()},
+    **{f'type_{key}': value for key, value in TYPOGRAPHY.items()},
+    **{f'space_{key}': value for key, value in SPACING.items()},
+    **{f'radius_{key}': value for key, value in RADIUS.items()},
+}
+
+_CSS_TEMPLATE = Template("".join(_CSS_PARTS))
+
+
+def _build_streamlit_css() -> str:
+    """
+    Generate the complete Streamlit CSS for the neumorphic design system.
+
+    Returns:
+        Complete CSS string to inject via st.markdown
+    """
+    return _CSS_TEMPLATE.substitute(_CSS_VARS)
+
+
+# The design tokens are constant, so the stylesheet is built once at import
+STREAMLIT_CSS: str = _build_streamlit_css()
+
+
+def get_streamlit_css() -> str:
+    """
+    Get the Streamlit CSS for the neumorphic design system.
+
+    Returns:
+        Complete CSS string to inject via st.markdown
+    """
+    return STREAMLIT_CSS
+
+
+@lru_cache(maxsize=1)
+def get_chart_colors() -> Mapping[str, str]:
     """
     Get the color palette for Plotly charts.
 
     Returns:
-        Dictionary of chart-specific colors
+        Read-only mapping of chart-specific colors (shared between calls)
     """
-    return {
+    return MappingProxyType({
         'military': COLORS['chart_military'],
         'civilian': COLORS['chart_civilian'],
         'equity': COLORS['chart_equity'],
         'bonus': COLORS['chart_bonus'],
         'background': COLORS['background'],
-        'grid': 'rgba(163, 177, 198, 0.3)',
+        'grid': GRID_RGBA,
         'text': COLORS['text_primary'],
         'text_secondary': COLORS['text_secondary'],
-    }
-
-
-def get_chart_layout_defaults() -> dict:
+    })
+
+
+# Plotly layout defaults, built once and frozen all the way down: sections
+# are read-only mappings and lists are tuples. get_chart_layout_defaults
+# hands out mutable copies.
+_CHART_LAYOUT_DEFAULTS = MappingProxyType({
+    # Trace palette in series order: military, civilian, equity, bonus
+    'colorway': (
+        COLORS['chart_military'],
+        COLORS['chart_civilian'],
+        COLORS['chart_equity'],
+        COLORS['chart_bonus'],
+    ),
+    'paper_bgcolor': COLORS['background'],
+    'plot_bgcolor': COLORS['background'],
+    'font': MappingProxyType({
+        'family': TYPOGRAPHY['font_family'],
+        'color': COLORS['text_primary'],
+        'size': 14,
+    }),
+    'title': MappingProxyType({
+        'font': MappingProxyType({
+            'size': 18,
+            'color': COLORS['text_primary'],
+        }),
+        'x': 0.5,
+        'xanchor': 'center',
+    }),
+    'xaxis': MappingProxyType({
+        'gridcolor': GRID_RGBA,
+        'linecolor': COLORS['shadow_dark'],
+    }),
+    'yaxis': MappingProxyType({
+        'gridcolor': GRID_RGBA,
+        'linecolor': COLORS['shadow_dark'],
+    }),
+    'legend': MappingProxyType({
+        'bgcolor': 'rgba(224, 229, 236, 0.8)',
+        'bordercolor': 'transparent',
+    }),
+})
+
+
+def _thaw(value: Any) -> Any:
+    """Mutable copy of a frozen layout value: mappings to dicts, tuples to lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def get_chart_layout_defaults() -> Dict[str, Any]:
     """
     Get default Plotly layout settings matching the design system.
 
     Returns:
-        Dictionary of layout settings for Plotly figures
+        Fresh dictionary of layout settings for Plotly figures; nested
+        sections are fresh too, so callers may update them freely
     """
-    return {
-        'paper_bgcolor': COLORS['background'],
-        'plot_bgcolor': COLORS['background'],
-        'font': {
-            'family': TYPOGRAPHY['font_family'],
-            'color': COLORS['text_primary'],
-            'size': 14,
-        },
-        'title': {
-            'font': {
-                'size': 18,
-                'color': COLORS['text_primary'],
-            },
-            'x': 0.5,
-            'xanchor': 'center',
-        },
-        'xaxis': {
-            'gridcolor': 'rgba(163, 177, 198, 0.3)',
-            'linecolor': COLORS['shadow_dark'],
-        },
-        'yaxis': {
-            'gridcolor': 'rgba(163, 177, 198, 0.3)',
-            'linecolor': COLORS['shadow_dark'],
-        },
-        'legend': {
-            'bgcolor': 'rgba(224, 229, 236, 0.8)',
-            'bordercolor': 'transparent',
-        },
-    }
+    return _thaw(_CHART_LAYOUT_DEFAULTS)
@@ -1,7 +1,10 @@
+# Currency format specs and delta sign prefixes, indexed by bool(flag)
+_CURRENCY_SPECS = (",.0f", ",.2f")
+_DELTA_PREFIXES = ("", "+")
+
+
 def format_currency(value: float, show_cents: bool = False) -> str:
-    if show_cents:
-        return f"${value:,.2f}"
-    return f"${value:,.0f}"
+    return f"${value:{_CURRENCY_SPECS[bool(show_cents)]}}"
 
 
 def format_percentage(value: float, decimals: int = 1) -> str:
@@ -9,8 +12,7 @@ def format_percentage(value: float, decimals: int = 1) -> str:
 
 
 def format_delta(value: float, show_cents: bool = False) -> str:
-    prefix = "+" if value > 0 else ""
-    return f"{prefix}{format_currency(value, show_cents)}"
+    return f"{_DELTA_PREFIXES[bool(value > 0)]}${value:{_CURRENCY_SPECS[bool(show_cents)]}}"
 
 
 def annual_to_monthly(annual_value: float) -> float:
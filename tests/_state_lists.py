@@ -0,0 +1,25 @@
+"""
+State codes by income-tax category, shared by the tests.
+
+Kept as tuples in a plain module, so parametrize tables can import them at
+collection time and the ids keep a stable order.
+"""
+
+
+ALL_STATES = (
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL",
+    "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME",
+    "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH",
+    "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI",
+    "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
+)
+
+NO_INCOME_TAX_STATES = ("TX", "FL", "WA", "TN", "NV", "SD", "WY", "AK", "NH")
+
+FLAT_TAX_STATES = ("AZ", "CO", "GA", "ID", "IL", "IN", "KY", "MA", "MI", "MS", "NC", "ND", "PA", "UT")
+
+PROGRESSIVE_TAX_STATES = (
+    "AL", "AR", "CA", "CT", "DE", "DC", "HI", "IA", "KS", "LA", "ME", "MD",
+    "MN", "MO", "MT", "NE", "NJ", "NM", "NY", "OH", "OK", "OR", "RI", "SC",
+    "VA", "VT", "WV", "WI"
+)
@@ -1,12 +1,48 @@
 """
 Shared pytest fixtures for CompMe test suite.
 """
-import sys
-import os
+from functools import lru_cache
+
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from engines._jit import HAS_NUMBA
+from engines.civ_engine import (
+    calculate_civilian_net,
+    calculate_civilian_net_batch,
+    calculate_state_tax,
+    SINGLE,
+    MARRIED
+)
+from engines.mil_engine import calculate_rmc_batch, calculate_tax_advantage, get_marginal_tax_rate
+from tests._state_lists import (
+    ALL_STATES,
+    NO_INCOME_TAX_STATES,
+    FLAT_TAX_STATES,
+    PROGRESSIVE_TAX_STATES
+)
+
+
+# =============================================================================
+# JIT Warm-up
+# =============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_jit_kernels():
+    """
+    Compiles (or loads from numba's on-disk cache) the engine kernels at
+    session start, so the cost is not billed to whichever test first
+    reaches each one. Each xdist worker warms its own process. No-op
+    without numba.
+    """
+    if HAS_NUMBA:
+        get_marginal_tax_rate(50000, SINGLE)
+        get_marginal_tax_rate(50000.0, SINGLE)
+        calculate_tax_advantage(4000.0, 2000.0, 465.77, SINGLE)
+        calculate_rmc_batch([4000.0], [2000.0], [465.77], [SINGLE])
+        # Unwrapped so the warm-up leaves the memo cache empty
+        calculate_civilian_net.__wrapped__(100000, 15, 50000, "CA", SINGLE, 12500, 1)
+        calculate_civilian_net_batch([100000.0], [15.0], [12500.0], ["CA"], [SINGLE], [1])
+    yield
 
 
 # =============================================================================
@@ -30,7 +66,7 @@ def e6_norfolk():
         "years_of_service": 6,
         "location": "NORFOLK/PORTSMOUTH, VA",
         "has_dependents": False,
-        "filing_status": "single"
+        "filing_status": SINGLE
     }
 
 
@@ -42,7 +78,7 @@ def o3_sandiego():
         "years_of_service": 4,
         "location": "SAN DIEGO, CA",
         "has_dependents": True,
-        "filing_status": "married"
+        "filing_status": MARRIED
     }
 
 
@@ -58,7 +94,7 @@ def civilian_offer_100k():
         "bonus_pct": 15,
         "total_equity": 50000,
         "state": "VA",
-        "filing_status": "single",
+        "filing_status": SINGLE,
         "annual_rsu_value": 12500,
         "num_children": 0
     }
@@ -72,7 +108,7 @@ def civilian_offer_150k_equity():
         "bonus_pct": 20,
         "total_equity": 200000,
         "state": "CA",
-        "filing_status": "single",
+        "filing_status": SINGLE,
         "annual_rsu_value": 50000,
         "num_children": 0
     }
@@ -86,7 +122,7 @@ def civilian_offer_with_kids():
         "bonus_pct": 15,
         "total_equity": 0,
         "state": "TX",
-        "filing_status": "married",
+        "filing_status": MARRIED,
         "annual_rsu_value": 0,
         "num_children": 2
     }
@@ -96,36 +132,38 @@ def civilian_offer_with_kids():
 # State Lists
 # =============================================================================
 
-@pytest.fixture
+# The tuples in tests/_state_lists.py keep a stable order for parametrize
+# ids; the category fixtures below hand out frozensets for membership checks.
+
+
+@pytest.fixture(scope="session")
 def all_states():
-    """List of all 50 states + DC."""
-    return [
-        "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL",
-        "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME",
-        "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH",
-        "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI",
-        "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
-    ]
+    """All 50 states + DC."""
+    return ALL_STATES
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def no_income_tax_states():
     """States with no income tax."""
-    return ["TX", "FL", "WA", "TN", "NV", "SD", "WY", "AK", "NH"]
+    return frozenset(NO_INCOME_TAX_STATES)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def flat_tax_states():
     """States with flat income tax."""
-    return ["AZ", "CO", "GA", "ID", "IL", "IN", "KY", "MA", "MI", "MS", "NC", "ND", "PA", "UT"]
+    return frozenset(FLAT_TAX_STATES)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def progressive_tax_states():
     """States with progressive income tax."""
-    return ["AL", "AR", "CA", "CT", "DE", "DC", "HI", "IA", "KS", "LA", "ME", "MD",
-            "MN", "MO", "MT", "NE", "NJ", "NM", "NY", "OH", "OK", "OR", "RI", "SC",
-            "VA", "VT", "WV", "WI"]
+    return frozenset(PROGRESSIVE_TAX_STATES)
+
+
+@pytest.fixture(scope="session")
+def state_tax():
+    """calculate_state_tax memoized for the session; data tests repeat inputs."""
+    return lru_cache(maxsize=None)(calculate_state_tax)
 
 
 # =============================================================================
@@ -1,14 +1,24 @@
 """
 Data validation tests for tax brackets and rates.
 """
+import math
+import numpy as np
 import pytest
-import sys
-import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from engines.mil_engine import FEDERAL_TAX_BRACKETS, FEDERAL_BRACKETS_NP, SINGLE, MARRIED
+from tests._state_lists import ALL_STATES, NO_INCOME_TAX_STATES
 
-from engines.mil_engine import FEDERAL_TAX_BRACKETS
-from engines.civ_engine import calculate_state_tax
+
+# 2025 single-filer brackets as (rate, upper limit)
+EXPECTED_SINGLE_2025 = (
+    (0.10, 11925),
+    (0.12, 48475),
+    (0.22, 103350),
+    (0.24, 197300),
+    (0.32, 250525),
+    (0.35, 626350),
+    (0.37, float('inf')),
+)
 
 
 class TestFederalTaxBrackets:
@@ -16,59 +26,49 @@ class TestFederalTaxBrackets:
 
     def test_single_brackets_count(self):
         """Single filers should have 7 brackets."""
-        assert len(FEDERAL_TAX_BRACKETS['single']) == 7
+        assert len(FEDERAL_TAX_BRACKETS[SINGLE]) == 7
 
     def test_married_brackets_count(self):
         """Married filers should have 7 brackets."""
-        assert len(FEDERAL_TAX_BRACKETS['married']) == 7
+        assert len(FEDERAL_TAX_BRACKETS[MARRIED]) == 7
 
-    def test_brackets_ascending_limits(self):
+    @pytest.mark.parametrize("status", [SINGLE, MARRIED])
+    def test_brackets_ascending_limits(self, status):
         """Bracket limits should be in ascending order."""
-        for status in ['single', 'married']:
-            brackets = FEDERAL_TAX_BRACKETS[status]
-            prev_max = 0
-            for bracket in brackets:
-                assert bracket['max'] > prev_max
-                prev_max = bracket['max']
-
-    def test_brackets_ascending_rates(self):
+        limits, _ = FEDERAL_BRACKETS_NP[status]
+        assert np.all(np.diff(limits, prepend=0) > 0)
+
+    @pytest.mark.parametrize("status", [SINGLE, MARRIED])
+    def test_brackets_ascending_rates(self, status):
         """Bracket rates should be in ascending order."""
-        for status in ['single', 'married']:
-            brackets = FEDERAL_TAX_BRACKETS[status]
-            prev_rate = 0
-            for bracket in brackets:
-                assert bracket['rate'] >= prev_rate
-                prev_rate = bracket['rate']
+        _, rates = FEDERAL_BRACKETS_NP[status]
+        assert np.all(np.diff(rates, prepend=0) >= 0)
 
     def test_rate_bounds(self):
         """All rates should be between 0 and 0.40."""
-        for status in ['single', 'married']:
+        for status in [SINGLE, MARRIED]:
             for bracket in FEDERAL_TAX_BRACKETS[status]:
                 assert 0 <= bracket['rate'] <= 0.40
 
     def test_2025_single_brackets_values(self):
         """Verify 2025 single bracket values."""
-        single = FEDERAL_TAX_BRACKETS['single']
-
-        # 10% bracket
-        assert single[0]['rate'] == 0.10
-        assert single[0]['max'] == 11925
+        single = FEDERAL_TAX_BRACKETS[SINGLE]
 
-        # 12% bracket
-        assert single[1]['rate'] == 0.12
-        assert single[1]['max'] == 48475
+        assert tuple((b['rate'], b['max']) for b in single) == EXPECTED_SINGLE_2025
 
-        # 22% bracket
-        assert single[2]['rate'] == 0.22
-        assert single[2]['max'] == 103350
+    @pytest.mark.parametrize("status", [SINGLE, MARRIED])
+    def test_numpy_brackets_match_table(self, status):
+        """Array form of the brackets should mirror the dict table."""
+        limits, rates = FEDERAL_BRACKETS_NP[status]
+        brackets = FEDERAL_TAX_BRACKETS[status]
 
-        # 37% top bracket
-        assert single[6]['rate'] == 0.37
+        assert np.array_equal(limits, [b['max'] for b in brackets])
+        assert np.allclose(rates, [b['rate'] for b in brackets])
 
     def test_married_brackets_higher_than_single(self):
         """Married brackets should be roughly 2x single."""
-        single = FEDERAL_TAX_BRACKETS['single']
-        married = FEDERAL_TAX_BRACKETS['married']
+        single = FEDERAL_TAX_BRACKETS[SINGLE]
+        married = FEDERAL_TAX_BRACKETS[MARRIED]
 
         # Compare first few brackets
         for i in range(3):
@@ -79,58 +79,51 @@ class TestFederalTaxBrackets:
 class TestStateTaxCoverage:
     """Validate state tax data coverage."""
 
-    @pytest.fixture
-    def all_states(self):
-        """All 50 states + DC."""
-        return [
-            "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL",
-            "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME",
-            "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH",
-            "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI",
-            "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"
-        ]
-
-    def test_all_states_have_tax_calculation(self, all_states):
+    @pytest.mark.parametrize("state", ALL_STATES)
+    def test_all_states_have_tax_calculation(self, state, state_tax):
         """Every state should return a tax value without error."""
-        for state in all_states:
-            try:
-                tax = calculate_state_tax(100000, state, "single")
-                assert isinstance(tax, (int, float))
-                assert tax >= 0
-            except Exception as e:
-                pytest.fail(f"State {state} failed: {e}")
-
-    def test_no_income_tax_states_return_zero(self):
+        tax = state_tax(100000, state, SINGLE)
+        assert isinstance(tax, (int, float))
+        assert tax >= 0
+
+    def test_state_categories_partition_all_states(
+        self, all_states, no_income_tax_states, flat_tax_states, progressive_tax_states
+    ):
+        """Each state should fall in exactly one tax category."""
+        assert no_income_tax_states | flat_tax_states | progressive_tax_states == set(all_states)
+        assert not no_income_tax_states & flat_tax_states
+        assert not no_income_tax_states & progressive_tax_states
+        assert not flat_tax_states & progressive_tax_states
+
+    @pytest.mark.parametrize("state", NO_INCOME_TAX_STATES)
+    def test_no_income_tax_states_return_zero(self, state, state_tax):
         """States with no income tax should return $0."""
-        no_tax_states = ["TX", "FL", "WA", "TN", "NV", "SD", "WY", "AK", "NH"]
+        tax = state_tax(100000, state, SINGLE)
+        assert tax == 0, f"{state} should have no income tax"
 
-        for state in no_tax_states:
-            tax = calculate_state_tax(100000, state, "single")
-            assert tax == 0, f"{state} should have no income tax"
-
-    def test_high_tax_states_return_substantial(self):
+    def test_high_tax_states_return_substantial(self, state_tax):
         """High-tax states should return significant amounts."""
         high_tax_states = ["CA", "NY", "NJ", "OR", "HI"]
 
         for state in high_tax_states:
-            tax = calculate_state_tax(100000, state, "single")
+            tax = state_tax(100000, state, SINGLE)
             assert tax > 3000, f"{state} should have substantial tax"
 
-    def test_state_tax_scales_with_income(self, all_states):
+    @pytest.mark.parametrize("state", ALL_STATES)
+    def test_state_tax_scales_with_income(self, state, state_tax):
         """Tax should generally increase with income for all states."""
-        for state in all_states:
-            tax_50k = calculate_state_tax(50000, state, "single")
-            tax_200k = calculate_state_tax(200000, state, "single")
+        tax_50k = state_tax(50000, state, SINGLE)
+        tax_200k = state_tax(200000, state, SINGLE)
 
-            assert tax_200k >= tax_50k, f"{state} tax should increase with income"
+        assert tax_200k >= tax_50k, f"{state} tax should increase with income"
 
-    def test_married_vs_single_varies_by_state(self):
+    def test_married_vs_single_varies_by_state(self, state_tax):
         """Some states have different married brackets."""
         states_to_check = ["CA", "NY", "VA", "MD"]
 
         for state in states_to_check:
-            single = calculate_state_tax(100000, state, "single")
-            married = calculate_state_tax(100000, state, "married")
+            single = state_tax(100000, state, SINGLE)
+            married = state_tax(100000, state, MARRIED)
 
             # Both should be valid numbers
             assert single >= 0
@@ -140,33 +133,28 @@ class TestStateTaxCoverage:
 class TestStateTaxRates:
     """Validate specific state tax rates."""
 
-    def test_california_top_rate(self):
+    def test_california_top_rate(self, state_tax):
         """California has 13.3% top rate."""
         # At $1M income, should be paying close to top rate
-        tax = calculate_state_tax(1000000, "CA", "single")
+        tax = state_tax(1000000, "CA", SINGLE)
         effective_rate = tax / 1000000
         assert effective_rate > 0.10  # Should be over 10% effective
 
-    def test_new_york_top_rate(self):
+    def test_new_york_top_rate(self, state_tax):
         """New York has progressive tax rates."""
-        tax = calculate_state_tax(1000000, "NY", "single")
+        tax = state_tax(1000000, "NY", SINGLE)
         effective_rate = tax / 1000000
         assert effective_rate > 0.05  # Should have substantial tax
 
-    def test_north_carolina_flat_rate(self):
-        """North Carolina has flat 4.75%."""
-        tax = calculate_state_tax(100000, "NC", "single")
-        assert tax == pytest.approx(4750, rel=0.01)
-
-    def test_colorado_flat_rate(self):
-        """Colorado has flat 4.4%."""
-        tax = calculate_state_tax(100000, "CO", "single")
-        assert tax == pytest.approx(4400, rel=0.01)
-
-    def test_pennsylvania_flat_rate(self):
-        """Pennsylvania has flat 3.07%."""
-        tax = calculate_state_tax(100000, "PA", "single")
-        assert tax == pytest.approx(3070, rel=0.01)
+    @pytest.mark.parametrize("state,expected", [
+        ("NC", 4750),   # 4.75%
+        ("CO", 4400),   # 4.4%
+        ("PA", 3070),   # 3.07%
+    ])
+    def test_flat_rate(self, state, expected, state_tax):
+        """Flat-tax states apply a single rate to $100k."""
+        tax = state_tax(100000, state, SINGLE)
+        assert tax == pytest.approx(expected, abs=0.5)
 
 
 class TestFICALimits:
@@ -185,7 +173,7 @@ class TestFICALimits:
         ss_above_cap = result['ss_tax']
 
         # SS tax should be same at and above cap
-        assert ss_at_cap == pytest.approx(ss_above_cap, rel=0.01)
+        assert math.isclose(ss_at_cap, ss_above_cap, rel_tol=1e-9)
 
     def test_medicare_additional_threshold(self):
         """Additional Medicare kicks in at $200k."""
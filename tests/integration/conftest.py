@@ -0,0 +1,70 @@
+"""
+Session-scoped engine results shared by the integration tests.
+
+The engines are pure functions returning immutable records, so each
+scenario is computed once per session and handed to every test that
+uses it.
+"""
+import pytest
+
+from engines.mil_engine import calculate_rmc
+from engines.civ_engine import calculate_civilian_net, SINGLE
+
+
+# =============================================================================
+# Military Results
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def mil_e6_norfolk():
+    """E-6 at 6 years in Norfolk, single, with a fixed $2,000 BAH."""
+    return calculate_rmc(
+        rank="E-6",
+        years_of_service=6,
+        location="NORFOLK/PORTSMOUTH, VA",
+        has_dependents=False,
+        filing_status=SINGLE,
+        manual_bah=2000
+    )
+
+
+@pytest.fixture(scope="session")
+def mil_e5_norfolk():
+    """E-5 at 6 years in Norfolk, single, with a fixed $1,800 BAH."""
+    return calculate_rmc(
+        rank="E-5",
+        years_of_service=6,
+        location="NORFOLK/PORTSMOUTH, VA",
+        has_dependents=False,
+        filing_status=SINGLE,
+        manual_bah=1800
+    )
+
+
+@pytest.fixture(scope="session")
+def mil_o3_sandiego():
+    """O-3 at 4 years in San Diego, single, with a fixed $3,000 BAH."""
+    return calculate_rmc(
+        rank="O-3",
+        years_of_service=4,
+        location="SAN DIEGO, CA",
+        has_dependents=False,
+        filing_status=SINGLE,
+        manual_bah=3000
+    )
+
+
+# =============================================================================
+# Civilian Results
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def civ_80k_va():
+    """$80k salary in Virginia, single, no bonus or equity."""
+    return calculate_civilian_net(
+        base_salary=80000,
+        bonus_pct=0,
+        total_equity=0,
+        state="VA",
+        filing_status=SINGLE
+    )
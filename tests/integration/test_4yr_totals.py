@@ -1,49 +1,21 @@
 """
 Integration tests for 4-year total calculations.
 """
+import math
+import numpy as np
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from engines.mil_engine import calculate_rmc
 from engines.civ_engine import calculate_civilian_net
 from engines.equity_engine import calculate_rsu_value, CompanyStage
-
-
-def calculate_4yr_totals(mil_results: dict, civ_results: dict, equity_calc: dict) -> dict:
-    """
-    Replicate the 4-year calculation logic from app.py for testing.
-    """
-    tsp_match_annual = mil_results['base_pay_monthly'] * 0.05 * 12
-    mil_4yr_total = mil_results['total_monthly'] * 48 + (tsp_match_annual * 4)
-
-    equity_value = equity_calc.get('adjusted_value', 0) if equity_calc else 0
-    civ_4yr_total = civ_results['net_monthly'] * 48 + equity_value
-
-    return {
-        'mil_4yr_total': mil_4yr_total,
-        'civ_4yr_total': civ_4yr_total,
-        'four_year_delta': civ_4yr_total - mil_4yr_total,
-        'tsp_match_annual': tsp_match_annual
-    }
+from engines.totals_engine import calculate_4yr_totals, calculate_4yr_totals_batch
 
 
 class TestFourYearTotals:
     """Integration tests for 4-year wealth projections."""
 
-    def test_4yr_totals_basic(self):
+    def test_4yr_totals_basic(self, mil_e6_norfolk):
         """Basic 4-year total calculation."""
-        mil_results = calculate_rmc(
-            rank="E-6",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single",
-            manual_bah=2000  # Use manual for consistent testing
-        )
-
         civ_results = calculate_civilian_net(
             base_salary=80000,
             bonus_pct=10,
@@ -54,26 +26,17 @@ class TestFourYearTotals:
             num_children=0
         )
 
-        equity_calc = {'adjusted_value': 0}
+        equity_calc = calculate_rsu_value(0)
 
-        totals = calculate_4yr_totals(mil_results, civ_results, equity_calc)
+        totals = calculate_4yr_totals(mil_e6_norfolk, civ_results, equity_calc)
 
         assert totals['mil_4yr_total'] > 0
         assert totals['civ_4yr_total'] > 0
         assert 'four_year_delta' in totals
         assert 'tsp_match_annual' in totals
 
-    def test_4yr_totals_with_equity(self):
+    def test_4yr_totals_with_equity(self, mil_o3_sandiego):
         """4-year totals including equity vesting."""
-        mil_results = calculate_rmc(
-            rank="O-3",
-            years_of_service=4,
-            location="SAN DIEGO, CA",
-            has_dependents=False,
-            filing_status="single",
-            manual_bah=3000
-        )
-
         equity_calc = calculate_rsu_value(
             total_grant=200000,
             vesting_years=4,
@@ -90,23 +53,14 @@ class TestFourYearTotals:
             num_children=0
         )
 
-        totals = calculate_4yr_totals(mil_results, civ_results, equity_calc)
+        totals = calculate_4yr_totals(mil_o3_sandiego, civ_results, equity_calc)
 
         # With $200k equity, civilian should have significant advantage
         assert totals['civ_4yr_total'] > totals['mil_4yr_total']
         assert totals['four_year_delta'] > 0
 
-    def test_4yr_totals_no_equity(self):
+    def test_4yr_totals_no_equity(self, mil_e5_norfolk):
         """4-year totals without any equity."""
-        mil_results = calculate_rmc(
-            rank="E-5",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single",
-            manual_bah=1800
-        )
-
         civ_results = calculate_civilian_net(
             base_salary=60000,
             bonus_pct=0,
@@ -117,76 +71,33 @@ class TestFourYearTotals:
             num_children=0
         )
 
-        totals = calculate_4yr_totals(mil_results, civ_results, None)
+        totals = calculate_4yr_totals(mil_e5_norfolk, civ_results, None)
 
         # Both should be positive
         assert totals['mil_4yr_total'] > 0
         assert totals['civ_4yr_total'] > 0
 
-    def test_4yr_tsp_match_calculation(self):
+    def test_4yr_tsp_match_calculation(self, mil_e6_norfolk, civ_80k_va):
         """TSP match should be 5% of base pay."""
-        mil_results = calculate_rmc(
-            rank="E-6",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single",
-            manual_bah=2000
-        )
-
-        civ_results = calculate_civilian_net(
-            base_salary=80000,
-            bonus_pct=0,
-            total_equity=0,
-            state="VA",
-            filing_status="single"
-        )
-
-        totals = calculate_4yr_totals(mil_results, civ_results, None)
+        totals = calculate_4yr_totals(mil_e6_norfolk, civ_80k_va, None)
 
-        expected_tsp = mil_results['base_pay_monthly'] * 0.05 * 12
-        assert totals['tsp_match_annual'] == pytest.approx(expected_tsp, rel=0.01)
+        expected_tsp = mil_e6_norfolk['base_pay_monthly'] * 0.05 * 12
+        assert math.isclose(totals['tsp_match_annual'], expected_tsp, rel_tol=1e-9)
 
-    def test_4yr_military_includes_tsp(self):
+    def test_4yr_military_includes_tsp(self, mil_e6_norfolk, civ_80k_va):
         """Military 4-year should include TSP match."""
-        mil_results = calculate_rmc(
-            rank="E-6",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single",
-            manual_bah=2000
-        )
-
-        civ_results = calculate_civilian_net(
-            base_salary=80000,
-            bonus_pct=0,
-            total_equity=0,
-            state="VA",
-            filing_status="single"
-        )
-
-        totals = calculate_4yr_totals(mil_results, civ_results, None)
+        totals = calculate_4yr_totals(mil_e6_norfolk, civ_80k_va, None)
 
         # 4-year should be more than just 48 * monthly
-        base_4yr = mil_results['total_monthly'] * 48
+        base_4yr = mil_e6_norfolk['total_monthly'] * 48
         assert totals['mil_4yr_total'] > base_4yr
 
 
 class TestScenarioComparisons:
     """Real-world scenario comparison tests."""
 
-    def test_scenario_e5_vs_80k_texas(self):
+    def test_scenario_e5_vs_80k_texas(self, mil_e5_norfolk):
         """E-5 vs $80k offer in Texas (no state tax)."""
-        mil_results = calculate_rmc(
-            rank="E-5",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single",
-            manual_bah=1800
-        )
-
         civ_results = calculate_civilian_net(
             base_salary=80000,
             bonus_pct=10,
@@ -197,7 +108,7 @@ class TestScenarioComparisons:
             num_children=0
         )
 
-        totals = calculate_4yr_totals(mil_results, civ_results, None)
+        totals = calculate_4yr_totals(mil_e5_norfolk, civ_results, None)
 
         # Both paths should yield substantial wealth over 4 years
         assert totals['mil_4yr_total'] > 200000
@@ -277,7 +188,6 @@ class TestScenarioComparisons:
             state="VA", filing_status="single",
             annual_rsu_value=equity_public['annualized_value']
         )
-        totals_public = calculate_4yr_totals(mil_results, civ_public, equity_public)
 
         # Private equity (50% discount)
         equity_private = calculate_rsu_value(100000, 4, 0, False)
@@ -286,7 +196,37 @@ class TestScenarioComparisons:
             state="VA", filing_status="single",
             annual_rsu_value=equity_private['annualized_value']
         )
-        totals_private = calculate_4yr_totals(mil_results, civ_private, equity_private)
+
+        totals = calculate_4yr_totals_batch(
+            base_pay_monthly=np.full(2, mil_results.base_pay_monthly),
+            total_monthly=np.full(2, mil_results.total_monthly),
+            net_monthly=np.array([civ_public.net_monthly, civ_private.net_monthly]),
+            adjusted_value=np.array([equity_public.adjusted_value, equity_private.adjusted_value])
+        )
 
         # Public offer should be worth more
-        assert totals_public['civ_4yr_total'] > totals_private['civ_4yr_total']
+        public_total, private_total = totals.civ_4yr_total
+        assert public_total > private_total
+
+    def test_batch_matches_scalar(self, mil_e5_norfolk):
+        """Batched 4-year totals should equal the per-scenario calculation."""
+        scenarios = [
+            (mil_e5_norfolk,
+             calculate_civilian_net(80000, 10, 0, "TX", "single"),
+             None),
+            (calculate_rmc("O-3", 4, "SAN DIEGO, CA", False, "single", 3200),
+             calculate_civilian_net(150000, 15, 200000, "CA", "single", 50000),
+             calculate_rsu_value(200000, 4, 0, True)),
+        ]
+
+        totals = calculate_4yr_totals_batch(
+            base_pay_monthly=[mil.base_pay_monthly for mil, _, _ in scenarios],
+            total_monthly=[mil.total_monthly for mil, _, _ in scenarios],
+            net_monthly=[civ.net_monthly for _, civ, _ in scenarios],
+            adjusted_value=[equity.adjusted_value if equity else 0 for _, _, equity in scenarios]
+        )
+
+        for i, (mil, civ, equity) in enumerate(scenarios):
+            expected = calculate_4yr_totals(mil, civ, equity)
+            for field in expected:
+                assert totals[field][i] == expected[field]
@@ -0,0 +1,21 @@
+"""
+Shared equity offers for the equity engine tests.
+
+Offers are frozen, so one instance per shape is safely shared across
+tests and usable in parametrize tables at collection time.
+"""
+from engines.equity_engine import CompanyStage, Offer
+
+
+OFFER_100K_4YR_PUBLIC = Offer(total_grant=100000, vesting_years=4, is_public=True)
+OFFER_80K_4YR_PUBLIC = Offer(total_grant=80000, vesting_years=4, is_public=True)
+OFFER_50K_4YR_PUBLIC = Offer(total_grant=50000, vesting_years=4, is_public=True)
+OFFER_90K_3YR_PUBLIC = Offer(total_grant=90000, vesting_years=3, is_public=True)
+OFFER_NO_GRANT = Offer(total_grant=0, vesting_years=4, is_public=True)
+
+OFFER_100K_4YR_PRIVATE = Offer(total_grant=100000, vesting_years=4, is_public=False)
+OFFER_150K_4YR_PRIVATE = Offer(total_grant=150000, vesting_years=4, is_public=False)
+OFFER_10K_4YR_GROWTH = Offer(total_grant=10000, vesting_years=4, company_stage=CompanyStage.GROWTH)
+
+OFFER_100K_4YR_PRE_IPO = Offer(total_grant=100000, vesting_years=4, company_stage="pre_ipo")
+OFFER_100K_4YR_EARLY = Offer(total_grant=100000, vesting_years=4, company_stage="early")
@@ -0,0 +1,54 @@
+"""
+Session-scoped engine results shared by the unit tests.
+
+The engines are pure functions, so results that several tests inspect
+are computed once per session and handed to every test that uses them.
+"""
+import math
+
+import pytest
+
+from engines.mil_engine import FEDERAL_TAX_BRACKETS, calculate_rmc
+from engines.equity_engine import calculate_vesting_schedule
+
+
+# =============================================================================
+# Tax Tables
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def federal_brackets():
+    """
+    FEDERAL_TAX_BRACKETS as (upper limit, rate) tuples per filing status,
+    checked once per session for ascending limits and rates in [0, 1].
+    """
+    brackets = {
+        status: tuple((b['max'], b['rate']) for b in rows)
+        for status, rows in FEDERAL_TAX_BRACKETS.items()
+    }
+    for status, rows in brackets.items():
+        limits = [limit for limit, _ in rows]
+        assert limits == sorted(set(limits)), f"{status} limits not ascending"
+        assert math.isinf(limits[-1]), f"{status} top bracket is not open"
+        assert all(0 <= rate <= 1 for _, rate in rows), f"{status} rate out of range"
+    return brackets
+
+
+# =============================================================================
+# Military Results
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def e6_norfolk_rmc():
+    """E-6 at 6 years in Norfolk, single, with the looked-up BAH."""
+    return calculate_rmc("E-6", 6, "NORFOLK/PORTSMOUTH, VA", False, "single")
+
+
+# =============================================================================
+# Equity Results
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def vesting_100k_4yr():
+    """$100k public grant on a standard 4-year schedule with a 1-year cliff."""
+    return calculate_vesting_schedule(100000, 4, 12, True)
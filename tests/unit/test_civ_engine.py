@@ -1,50 +1,62 @@
 """
 Unit tests for Civilian Compensation Engine (civ_engine.py)
 """
+import math
+import numpy as np
 import pytest
 from engines.civ_engine import (
     calculate_federal_tax,
+    calculate_federal_tax_batch,
     calculate_state_tax,
+    calculate_state_tax_batch,
     calculate_fica_tax,
+    calculate_fica_tax_batch,
     calculate_child_tax_credit,
+    calculate_child_tax_credit_batch,
     calculate_bonus_withholding,
-    calculate_civilian_net
+    calculate_civilian_net,
+    calculate_civilian_net_batch,
+    clear_caches
 )
 
 
-class TestFederalTax:
-    """Tests for calculate_federal_tax function."""
+CIVILIAN_NET_FIELDS = frozenset({
+    "gross_annual", "base_salary", "bonus_annual", "bonus_net",
+    "rsu_annual", "rsu_net", "fed_tax", "state_tax", "fica_tax",
+    "child_tax_credit", "total_tax", "net_annual", "net_monthly",
+    "effective_tax_rate"
+})
 
-    def test_federal_tax_zero_income(self):
-        """Zero income = zero tax."""
-        tax = calculate_federal_tax(0, "single")
-        assert tax == 0
 
-    def test_federal_tax_below_standard_deduction(self):
-        """Income below standard deduction = zero tax."""
-        tax = calculate_federal_tax(10000, "single")
-        assert tax == 0
+class TestFederalTax:
+    """Tests for calculate_federal_tax function."""
 
-    def test_federal_tax_single_50k(self):
-        """$50k single income tax calculation."""
-        tax = calculate_federal_tax(50000, "single")
-        # Taxable = 50000 - 15750 = 34250
-        # 10% on first 11925 = 1192.50
-        # 12% on remaining 22325 = 2679
-        # Total ~ 3871.50
-        assert 3500 < tax < 4500
-
-    def test_federal_tax_single_100k(self):
-        """$100k single income tax calculation."""
-        tax = calculate_federal_tax(100000, "single")
-        # Should be in 22% bracket
-        assert 10000 < tax < 15000
-
-    def test_federal_tax_single_200k(self):
-        """$200k single income tax calculation."""
-        tax = calculate_federal_tax(200000, "single")
-        # Should be in 32% bracket
-        assert 35000 < tax < 45000
+    @pytest.mark.parametrize("income,filing_status", [
+        (0, "single"),          # Zero income
+        (10000, "single"),      # Below standard deduction
+    ])
+    def test_federal_tax_zero(self, income, filing_status):
+        """No taxable income = zero tax."""
+        assert calculate_federal_tax(income, filing_status) == 0
+
+    @pytest.mark.parametrize("income,filing_status,lo,hi", [
+        # Taxable = 50000 - 15750 = 34250; 10% of 11925 + 12% of 22325 ~ 3871.50
+        (50000, "single", 3500, 4500),
+        (100000, "single", 10000, 15000),   # 22% bracket
+        (200000, "single", 35000, 45000),   # 32% bracket
+        (200000, "married", 20000, 35000),  # 22% bracket for married
+    ])
+    def test_federal_tax_brackets(self, income, filing_status, lo, hi):
+        """Federal tax should land in the expected range for its bracket."""
+        tax = calculate_federal_tax(income, filing_status)
+        assert lo < tax < hi
+
+    @pytest.mark.parametrize("filing_status", ["single", "married"])
+    def test_federal_tax_batch(self, filing_status):
+        """Batch federal tax should agree with the scalar calculation."""
+        incomes = np.array([0, 10000, 50000, 100000, 200000, 1000000])
+        expected = [calculate_federal_tax(income, filing_status) for income in incomes]
+        assert calculate_federal_tax_batch(incomes, filing_status) == pytest.approx(expected)
 
     def test_federal_tax_married_100k(self):
         """$100k married filing jointly."""
@@ -91,7 +103,7 @@ class TestStateTax:
         income = 100000
         tax = calculate_state_tax(income, state, "single")
         expected = income * expected_rate
-        assert tax == pytest.approx(expected, rel=0.01)
+        assert tax == pytest.approx(expected, abs=0.5)
 
     def test_california_progressive(self):
         """California has progressive brackets up to 13.3%."""
@@ -122,53 +134,64 @@ class TestStateTax:
             assert isinstance(tax, (int, float))
             assert tax >= 0
 
+    @pytest.mark.parametrize("filing_status", ["single", "married"])
+    def test_batch_matches_scalar(self, all_states, filing_status):
+        """Batch state tax should agree with the scalar calculation for every state."""
+        levels = [-5000, 0, 2500, 50000, 100000, 750000]
+        states = [state for state in (*all_states, "ZZ") for _ in levels]
+        incomes = np.array(levels * (len(all_states) + 1), dtype=float)
+        expected = [calculate_state_tax(i, s, filing_status) for i, s in zip(incomes, states)]
+        assert calculate_state_tax_batch(incomes, states, filing_status) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("state", ["TX", "IL", "CA", "ZZ"])
+    @pytest.mark.parametrize("income", [-5000, 0])
+    def test_no_tax_at_or_below_zero_income(self, state, income):
+        """Non-positive income owes no state tax on any path, flat-rate states included."""
+        assert calculate_state_tax(income, state, "single") == 0
+        assert calculate_state_tax_batch([income], [state], "single")[0] == 0
+        net = calculate_civilian_net(income, 0, 0, state, "single")
+        assert net.state_tax == 0
+
 
 class TestFICATax:
     """Tests for calculate_fica_tax function."""
 
-    def test_fica_basic(self):
-        """Basic FICA calculation."""
-        result = calculate_fica_tax(100000)
-
-        assert "ss_tax" in result
-        assert "medicare_tax" in result
-        assert "total_fica" in result
-
+    @pytest.mark.parametrize("income,ss_expected,medicare_expected", [
         # SS = 6.2% up to cap, Medicare = 1.45%
-        assert result["ss_tax"] == pytest.approx(6200, rel=0.01)
-        assert result["medicare_tax"] == pytest.approx(1450, rel=0.01)
+        (100000, 100000 * 0.062, 100000 * 0.0145),
+        # At the $168,600 SS wage cap
+        (168600, 168600 * 0.062, 168600 * 0.0145),
+        # Over the cap: SS maxes at $10,453.20, Medicare still on full income
+        (200000, 168600 * 0.062, 200000 * 0.0145),
+        # Additional 0.9% Medicare on income over $200k
+        (250000, 168600 * 0.062, 250000 * 0.0145 + 50000 * 0.009),
+    ])
+    def test_fica(self, income, ss_expected, medicare_expected):
+        """SS and Medicare should match the statutory rates and thresholds."""
+        result = calculate_fica_tax(income)
 
-    def test_fica_under_ss_cap(self):
-        """Income under SS wage cap - full SS tax."""
-        result = calculate_fica_tax(100000)
-        # 6.2% of $100k = $6,200
-        assert result["ss_tax"] == pytest.approx(6200, rel=0.01)
-
-    def test_fica_over_ss_cap(self):
-        """Income over SS wage cap ($168,600) - SS capped."""
-        result = calculate_fica_tax(200000)
-        # SS maxes at 6.2% of $168,600 = $10,453.20
-        assert result["ss_tax"] == pytest.approx(10453, rel=0.02)
-        # Medicare still applies to full income: 200000 * 1.45% = $2,900
-        assert result["medicare_tax"] >= 2900
-
-    def test_fica_additional_medicare(self):
-        """Income over $200k triggers additional Medicare."""
-        result = calculate_fica_tax(250000)
-        # Additional 0.9% on income over $200k
-        # Base Medicare: 250000 * 1.45% = 3625
-        # Additional: 50000 * 0.9% = 450
-        # Total Medicare ~ 4075
-        assert result["medicare_tax"] > 4000
+        assert math.isclose(result["ss_tax"], ss_expected, rel_tol=1e-9)
+        assert math.isclose(result["medicare_tax"], medicare_expected, rel_tol=1e-9)
 
     def test_fica_total_equals_sum(self):
         """Total FICA should equal SS + Medicare."""
         result = calculate_fica_tax(100000)
-        assert result["total_fica"] == pytest.approx(
+        assert math.isclose(
+            result["total_fica"],
             result["ss_tax"] + result["medicare_tax"],
-            rel=0.01
+            rel_tol=1e-9
         )
 
+    def test_fica_batch_matches_scalar(self):
+        """Batch FICA should equal the scalar calculation element-wise."""
+        incomes = np.array([0, 50000, 168600, 199999, 200000, 350000, 1000000], dtype=float)
+        batch = calculate_fica_tax_batch(incomes)
+
+        for i, income in enumerate(incomes):
+            expected = calculate_fica_tax(income)
+            for key in ("ss_tax", "medicare_tax", "total_fica"):
+                assert batch[key][i] == expected[key]
+
 
 class TestChildTaxCredit:
     """Tests for calculate_child_tax_credit function."""
@@ -212,6 +235,17 @@ class TestChildTaxCredit:
         # $300k over threshold = $15,000 reduction, but max credit is $2,000
         assert credit == 0
 
+    def test_ctc_batch_matches_scalar(self):
+        """Batch CTC should equal the scalar calculation element-wise."""
+        incomes = np.array([50000, 210000, 210999, 250000, 410000, 500000, 450000])
+        children = np.array([0, 2, 2, 1, 3, 1, 2])
+        married = np.array([False, False, False, False, True, False, True])
+        batch = calculate_child_tax_credit_batch(incomes, children, married)
+
+        for i in range(len(incomes)):
+            status = "married" if married[i] else "single"
+            assert batch[i] == calculate_child_tax_credit(incomes[i], children[i], status)
+
 
 class TestBonusWithholding:
     """Tests for calculate_bonus_withholding function."""
@@ -275,15 +309,8 @@ class TestCivilianNet:
             num_children=0
         )
 
-        expected_fields = [
-            "gross_annual", "base_salary", "bonus_annual", "bonus_net",
-            "rsu_annual", "rsu_net", "fed_tax", "state_tax", "fica_tax",
-            "child_tax_credit", "total_tax", "net_annual", "net_monthly",
-            "effective_tax_rate"
-        ]
-
-        for field in expected_fields:
-            assert field in result, f"Missing field: {field}"
+        missing = CIVILIAN_NET_FIELDS - result.keys()
+        assert not missing, f"Missing fields: {missing}"
 
     def test_civilian_net_gross_calculation(self):
         """Gross should equal base + bonus + RSU."""
@@ -298,7 +325,7 @@ class TestCivilianNet:
         )
 
         expected_gross = 100000 + 15000 + 12500
-        assert result["gross_annual"] == pytest.approx(expected_gross, rel=0.01)
+        assert math.isclose(result["gross_annual"], expected_gross, rel_tol=1e-9)
 
     def test_civilian_net_with_children(self):
         """Child tax credit should reduce total tax."""
@@ -340,7 +367,36 @@ class TestCivilianNet:
             state="VA", filing_status="single"
         )
 
-        assert result["net_monthly"] == pytest.approx(
+        assert math.isclose(
+            result["net_monthly"],
             result["net_annual"] / 12,
-            rel=0.01
+            rel_tol=1e-9
         )
+
+    def test_civilian_net_is_memoized(self):
+        """Repeated calls should share one immutable result until caches are cleared."""
+        args = (100000, 15, 0, "VA", "single")
+        first = calculate_civilian_net(*args)
+        assert calculate_civilian_net(*args) is first
+        with pytest.raises(AttributeError):
+            first.net_annual = 0
+
+        clear_caches()
+        assert calculate_civilian_net(*args) == first
+
+    def test_civilian_net_batch_matches_scalar(self):
+        """Batch take-home should agree with the scalar calculation per scenario."""
+        scenarios = [
+            (100000, 15, 12500, "VA", "single", 0),
+            (150000, 20, 50000, "CA", "single", 0),
+            (120000, 15, 0, "TX", "married", 2),
+            (250000, 25, 125000, "ny", "Married", 3),
+            (60000, 0, 0, "IL", "single", 1),
+            (0, 0, 0, "VA", "single", 0),
+        ]
+        batch = calculate_civilian_net_batch(*zip(*scenarios))
+
+        for i, (base, bonus, rsu, state, status, kids) in enumerate(scenarios):
+            expected = calculate_civilian_net(base, bonus, 0, state, status, rsu, kids)
+            for field in batch:
+                assert batch[field][i] == pytest.approx(expected[field])
@@ -1,81 +1,81 @@
 """
 Unit tests for Equity Calculation Engine (equity_engine.py)
 """
+import math
+import numpy as np
 import pytest
 from engines.equity_engine import (
     CompanyStage,
     STAGE_DISCOUNTS,
     STAGE_DESCRIPTIONS,
     calculate_rsu_value,
+    calculate_rsu_value_batch,
     calculate_vesting_schedule,
-    compare_equity_offers
+    calculate_vesting_schedule_array,
+    compare_equity_offers,
+    compare_equity_offers_batch,
+    Offer
+)
+from tests.unit._equity_fixtures import (
+    OFFER_100K_4YR_PUBLIC,
+    OFFER_80K_4YR_PUBLIC,
+    OFFER_50K_4YR_PUBLIC,
+    OFFER_90K_3YR_PUBLIC,
+    OFFER_NO_GRANT,
+    OFFER_100K_4YR_PRIVATE,
+    OFFER_150K_4YR_PRIVATE,
+    OFFER_10K_4YR_GROWTH,
+    OFFER_100K_4YR_PRE_IPO,
+    OFFER_100K_4YR_EARLY
 )
 
 
 class TestCompanyStage:
     """Tests for CompanyStage enum and discounts."""
 
-    def test_stage_values(self):
-        """Verify enum values."""
-        assert CompanyStage.PUBLIC.value == "public"
-        assert CompanyStage.PRE_IPO.value == "pre_ipo"
-        assert CompanyStage.LATE_STAGE.value == "late_stage"
-        assert CompanyStage.GROWTH.value == "growth"
-        assert CompanyStage.EARLY.value == "early"
-
-    def test_stage_discounts(self):
-        """Verify discount percentages."""
-        assert STAGE_DISCOUNTS[CompanyStage.PUBLIC] == 0.0
-        assert STAGE_DISCOUNTS[CompanyStage.PRE_IPO] == 0.15
-        assert STAGE_DISCOUNTS[CompanyStage.LATE_STAGE] == 0.30
-        assert STAGE_DISCOUNTS[CompanyStage.GROWTH] == 0.50
-        assert STAGE_DISCOUNTS[CompanyStage.EARLY] == 0.70
-
-    def test_all_stages_have_descriptions(self):
-        """All stages should have descriptions."""
-        for stage in CompanyStage:
-            assert stage in STAGE_DESCRIPTIONS
-            assert len(STAGE_DESCRIPTIONS[stage]) > 0
+    @pytest.mark.parametrize("stage,value,discount", [
+        (CompanyStage.PUBLIC, "public", 0.0),
+        (CompanyStage.PRE_IPO, "pre_ipo", 0.15),
+        (CompanyStage.LATE_STAGE, "late_stage", 0.30),
+        (CompanyStage.GROWTH, "growth", 0.50),
+        (CompanyStage.EARLY, "early", 0.70),
+    ])
+    def test_stage_constants(self, stage, value, discount):
+        """Each stage has its tag, discount and a description."""
+        assert stage.value == value
+        assert STAGE_DISCOUNTS[stage] == discount
+        assert STAGE_DESCRIPTIONS.get(stage)
+
+    def test_stage_tables_cover_every_stage(self):
+        """Discount and description tables have exactly one entry per stage."""
+        assert STAGE_DISCOUNTS.keys() == STAGE_DESCRIPTIONS.keys() == set(CompanyStage)
 
 
 class TestCalculateRSUValue:
     """Tests for calculate_rsu_value function."""
 
-    def test_rsu_public_no_discount(self):
-        """Public company gets 0% discount."""
-        result = calculate_rsu_value(100000, 4, 0, True, CompanyStage.PUBLIC)
+    @pytest.mark.parametrize("stage,adjusted,discount", [
+        (CompanyStage.PUBLIC, 100000, 0),
+        (CompanyStage.PRE_IPO, 85000, 15),
+        (CompanyStage.LATE_STAGE, 70000, 30),
+        (CompanyStage.GROWTH, 50000, 50),
+        (CompanyStage.EARLY, 30000, 70),
+    ])
+    def test_rsu_discount_tier(self, stage, adjusted, discount):
+        """Each company stage applies its risk discount to the grant."""
+        result = calculate_rsu_value(100000, 4, 0, stage == CompanyStage.PUBLIC, stage)
 
         assert result["total_grant_value"] == 100000
-        assert result["adjusted_value"] == 100000
-        assert result["risk_discount"] == 0
-
-    def test_rsu_pre_ipo_15_discount(self):
-        """Pre-IPO gets 15% discount."""
-        result = calculate_rsu_value(100000, 4, 0, False, CompanyStage.PRE_IPO)
-
-        assert result["adjusted_value"] == 85000
-        assert result["risk_discount"] == 15
-
-    def test_rsu_late_stage_30_discount(self):
-        """Late stage gets 30% discount."""
-        result = calculate_rsu_value(100000, 4, 0, False, CompanyStage.LATE_STAGE)
-
-        assert result["adjusted_value"] == 70000
-        assert result["risk_discount"] == 30
-
-    def test_rsu_growth_50_discount(self):
-        """Growth stage gets 50% discount."""
-        result = calculate_rsu_value(100000, 4, 0, False, CompanyStage.GROWTH)
-
-        assert result["adjusted_value"] == 50000
-        assert result["risk_discount"] == 50
+        assert result["adjusted_value"] == pytest.approx(adjusted, rel=1e-9)
+        assert result["risk_discount"] == discount
 
-    def test_rsu_early_70_discount(self):
-        """Early stage gets 70% discount."""
-        result = calculate_rsu_value(100000, 4, 0, False, CompanyStage.EARLY)
+    def test_rsu_all_stages_batch(self):
+        """One batch call should discount a grant at every stage."""
+        stages = list(CompanyStage)
+        result = calculate_rsu_value_batch([100000] * len(stages), [4] * len(stages), [stage.index for stage in stages])
 
-        assert result["adjusted_value"] == pytest.approx(30000, rel=0.01)
-        assert result["risk_discount"] == 70
+        np.testing.assert_allclose(result.adjusted_value, [100000 * (1 - STAGE_DISCOUNTS[stage]) for stage in stages])
+        np.testing.assert_allclose(result.risk_discount, [STAGE_DISCOUNTS[stage] * 100 for stage in stages])
 
     def test_rsu_zero_grant(self):
         """Zero grant should return zeros."""
@@ -101,7 +101,7 @@ class TestCalculateRSUValue:
         """Monthly value should be annualized / 12."""
         result = calculate_rsu_value(100000, 4, 0, True, CompanyStage.PUBLIC)
 
-        assert result["monthly_value"] == pytest.approx(25000 / 12, rel=0.01)
+        assert math.isclose(result["monthly_value"], 25000 / 12, rel_tol=1e-9)
 
     def test_rsu_custom_vesting_years(self):
         """Different vesting periods should work."""
@@ -149,13 +149,26 @@ class TestCalculateRSUValue:
 
         assert result["company_stage"] == "late_stage"
 
+    def test_rsu_batch_matches_scalar(self):
+        """Batch RSU values should equal the scalar calculation per grant."""
+        grants = [100000, 250000, 0, -5000] + [80000] * len(CompanyStage)
+        years = [4, 3, 4, 4] + [4] * len(CompanyStage)
+        stages = [CompanyStage.PUBLIC, CompanyStage.EARLY, CompanyStage.GROWTH, CompanyStage.PUBLIC] + list(CompanyStage)
+
+        batch = calculate_rsu_value_batch(grants, years, [stage.index for stage in stages])
+
+        for i, (grant, vesting_years, stage) in enumerate(zip(grants, years, stages)):
+            expected = calculate_rsu_value(grant, vesting_years, 0, True, stage)
+            for field in batch:
+                assert batch[field][i] == expected[field]
+
 
 class TestCalculateVestingSchedule:
     """Tests for calculate_vesting_schedule function."""
 
-    def test_vesting_schedule_4yr_standard(self):
+    def test_vesting_schedule_4yr_standard(self, vesting_100k_4yr):
         """Standard 4-year vesting with 1-year cliff."""
-        schedule = calculate_vesting_schedule(100000, 4, 12, True)
+        schedule = vesting_100k_4yr
 
         assert len(schedule) == 4
 
@@ -174,23 +187,32 @@ class TestCalculateVestingSchedule:
         # 50% discount = $50k adjusted
         assert schedule[4]["cumulative_vested"] == pytest.approx(50000, rel=0.01)
 
-    def test_vesting_schedule_cumulative_increases(self):
-        """Cumulative should increase each year."""
-        schedule = calculate_vesting_schedule(100000, 4, 12, True)
-
-        prev_cumulative = 0
-        for year in range(1, 5):
-            assert schedule[year]["cumulative_vested"] > prev_cumulative
-            prev_cumulative = schedule[year]["cumulative_vested"]
-
-    def test_vesting_schedule_remaining_decreases(self):
-        """Remaining unvested should decrease each year."""
-        schedule = calculate_vesting_schedule(100000, 4, 12, True)
-
-        prev_remaining = 100000
-        for year in range(1, 5):
-            assert schedule[year]["remaining_unvested"] < prev_remaining
-            prev_remaining = schedule[year]["remaining_unvested"]
+    def test_vesting_schedule_monotonic(self, vesting_100k_4yr):
+        """Cumulative should increase and remaining decrease each year."""
+        schedule = vesting_100k_4yr
+        cumulative = np.array([schedule[year]["cumulative_vested"] for year in range(1, 5)])
+        remaining = np.array([schedule[year]["remaining_unvested"] for year in range(1, 5)])
+
+        assert cumulative[0] > 0
+        assert np.all(np.diff(cumulative) > 0)
+        assert remaining[0] < 100000
+        assert np.all(np.diff(remaining) < 0)
+
+    @pytest.mark.parametrize("grant,years,cliff,stage", [
+        (100000, 4, 12, CompanyStage.PUBLIC),
+        (100000, 4, 6, CompanyStage.GROWTH),
+        (90000, 3, 12, CompanyStage.EARLY),
+        (0, 4, 12, CompanyStage.PUBLIC),
+    ])
+    def test_vesting_schedule_array_matches_dict(self, grant, years, cliff, stage):
+        """Array schedule should equal the dict schedule year by year."""
+        schedule = calculate_vesting_schedule(grant, years, cliff, False, stage)
+        arrays = calculate_vesting_schedule_array(grant, years, cliff, False, stage)
+
+        for field in arrays:
+            assert len(arrays[field]) == years
+            for year in range(1, years + 1):
+                assert arrays[field][year - 1] == schedule[year][field]
 
     def test_vesting_schedule_3_year(self):
         """3-year vesting schedule."""
@@ -201,64 +223,69 @@ class TestCalculateVestingSchedule:
         assert schedule[3]["cumulative_vested"] == pytest.approx(90000, rel=0.01)
 
 
+# (offer_a, offer_b, expected winner)
+COMPARE_CASES = [
+    pytest.param(OFFER_100K_4YR_PUBLIC, OFFER_80K_4YR_PUBLIC, "Offer A", id="public-vs-public"),
+    # Public: $100k, Private: $150k * 50% = $75k adjusted
+    pytest.param(OFFER_100K_4YR_PUBLIC, OFFER_150K_4YR_PRIVATE, "Offer A", id="public-vs-private"),
+    # Both have $50k adjusted value
+    pytest.param(OFFER_50K_4YR_PUBLIC, OFFER_100K_4YR_PRIVATE, "Tie", id="same-value"),
+    # A: $85k adjusted, B: $30k adjusted
+    pytest.param(OFFER_100K_4YR_PRE_IPO, OFFER_100K_4YR_EARLY, "Offer A", id="company-stage"),
+    # 3yr: $30k/year = $2.5k/month, 4yr: $25k/year = $2.08k/month
+    pytest.param(OFFER_90K_3YR_PUBLIC, OFFER_100K_4YR_PUBLIC, "Offer A", id="different-vesting"),
+    pytest.param(OFFER_NO_GRANT, OFFER_10K_4YR_GROWTH, "Offer B", id="no-grant"),
+]
+
+
 class TestCompareEquityOffers:
     """Tests for compare_equity_offers function."""
 
-    def test_compare_public_vs_public(self):
-        """Compare two public company offers."""
-        offer_a = {"total_grant": 100000, "vesting_years": 4, "is_public": True}
-        offer_b = {"total_grant": 80000, "vesting_years": 4, "is_public": True}
-
+    @pytest.mark.parametrize("offer_a,offer_b,winner", COMPARE_CASES)
+    def test_compare_cases(self, offer_a, offer_b, winner):
+        """The offer with the higher adjusted monthly value wins."""
         result = compare_equity_offers(offer_a, offer_b)
 
-        assert result["winner"] == "Offer A"
-        assert result["offer_a_monthly"] > result["offer_b_monthly"]
-
-    def test_compare_public_vs_private(self):
-        """Public offer may beat larger private offer due to discount."""
-        offer_public = {"total_grant": 100000, "vesting_years": 4, "is_public": True}
-        offer_private = {"total_grant": 150000, "vesting_years": 4, "is_public": False}
-
-        result = compare_equity_offers(offer_public, offer_private)
+        assert result["winner"] == winner
+        assert result["monthly_difference"] == abs(result["offer_a_monthly"] - result["offer_b_monthly"])
 
-        # Public: $100k, Private: $150k * 50% = $75k adjusted
-        assert result["winner"] == "Offer A"
+    @pytest.mark.parametrize("stage", ["Growth", "seriesb"])
+    def test_unknown_stage_tag_raises(self, stage):
+        """Unrecognized stage tags are rejected rather than valued as public stock."""
+        offer = {"total_grant": 100000, "vesting_years": 4, "company_stage": stage}
+        with pytest.raises(ValueError):
+            compare_equity_offers(offer, OFFER_100K_4YR_PUBLIC)
 
-    def test_compare_same_value(self):
-        """Equal adjusted values should tie."""
-        offer_a = {"total_grant": 50000, "vesting_years": 4, "is_public": True}
-        offer_b = {"total_grant": 100000, "vesting_years": 4, "is_public": False}
+    def test_offer_and_dict_agree(self):
+        """An Offer and the equivalent legacy dict compare identically."""
+        offer_dict = {"total_grant": 150000, "vesting_years": 4, "is_public": False}
 
-        result = compare_equity_offers(offer_a, offer_b)
+        assert Offer.from_dict(offer_dict) == OFFER_150K_4YR_PRIVATE
+        assert (
+            compare_equity_offers(OFFER_100K_4YR_PUBLIC, offer_dict)
+            == compare_equity_offers(OFFER_100K_4YR_PUBLIC, OFFER_150K_4YR_PRIVATE)
+        )
 
-        # Both have $50k adjusted value
-        assert result["winner"] == "Tie"
-
-    def test_compare_with_company_stage(self):
-        """Compare using explicit company stages."""
-        offer_a = {
-            "total_grant": 100000,
-            "vesting_years": 4,
-            "company_stage": "pre_ipo"  # 15% discount
-        }
-        offer_b = {
-            "total_grant": 100000,
-            "vesting_years": 4,
-            "company_stage": "early"  # 70% discount
-        }
+    def test_compare_batch_matches_scalar(self):
+        """Batch comparison should equal the scalar comparison per pair."""
+        offers_a = [case.values[0] for case in COMPARE_CASES]
+        offers_b = [case.values[1] for case in COMPARE_CASES]
 
-        result = compare_equity_offers(offer_a, offer_b)
+        batch = compare_equity_offers_batch(offers_a, offers_b)
 
-        # A: $85k adjusted, B: $30k adjusted
-        assert result["winner"] == "Offer A"
+        for i, (offer_a, offer_b) in enumerate(zip(offers_a, offers_b)):
+            expected = compare_equity_offers(offer_a, offer_b)
+            for field in batch:
+                assert batch[field][i] == expected[field]
 
-    def test_compare_different_vesting(self):
-        """Different vesting periods affect monthly value."""
-        offer_3yr = {"total_grant": 90000, "vesting_years": 3, "is_public": True}
-        offer_4yr = {"total_grant": 100000, "vesting_years": 4, "is_public": True}
+    def test_compare_batch_nan_grant_is_tie(self):
+        """A NaN grant value ties in the batch comparison, as it does per pair."""
+        nan_offer = Offer(total_grant=float("nan"), vesting_years=4)
+        offers_a = [nan_offer, OFFER_100K_4YR_PUBLIC]
+        offers_b = [OFFER_100K_4YR_PUBLIC, nan_offer]
 
-        result = compare_equity_offers(offer_3yr, offer_4yr)
+        batch = compare_equity_offers_batch(offers_a, offers_b)
 
-        # 3yr: $30k/year = $2.5k/month
-        # 4yr: $25k/year = $2.08k/month
-        assert result["winner"] == "Offer A"
+        for i, (offer_a, offer_b) in enumerate(zip(offers_a, offers_b)):
+            assert batch.winner[i] == compare_equity_offers(offer_a, offer_b)["winner"] == "Tie"
+            assert np.isnan(batch.monthly_difference[i])
@@ -1,6 +1,8 @@
 """
 Unit tests for Utility Formatters (formatters.py)
 """
+import math
+import numpy as np
 import pytest
 from utils.formatters import (
     format_currency,
@@ -14,74 +16,69 @@ from utils.formatters import (
 class TestFormatCurrency:
     """Tests for format_currency function."""
 
-    def test_format_currency_basic(self):
-        """Basic currency formatting."""
-        assert format_currency(1000) == "$1,000"
-        assert format_currency(50000) == "$50,000"
-        assert format_currency(1234567) == "$1,234,567"
-
-    def test_format_currency_with_cents(self):
-        """Currency with cents enabled."""
-        assert format_currency(1000.50, show_cents=True) == "$1,000.50"
-        assert format_currency(1234.99, show_cents=True) == "$1,234.99"
-
-    def test_format_currency_rounds_without_cents(self):
-        """Without cents, should round to whole number."""
-        assert format_currency(1000.75) == "$1,001"
-        assert format_currency(1000.25) == "$1,000"
-
-    def test_format_currency_zero(self):
-        """Zero should format correctly."""
-        assert format_currency(0) == "$0"
-
-    def test_format_currency_negative(self):
-        """Negative values should show minus sign."""
-        result = format_currency(-1000)
-        assert "-" in result or "(" in result
+    @pytest.mark.parametrize("value,show_cents,expected", [
+        pytest.param(1000, False, "$1,000", id="1k"),
+        pytest.param(50000, False, "$50,000", id="50k"),
+        pytest.param(1234567, False, "$1,234,567", id="millions"),
+        pytest.param(1000.50, True, "$1,000.50", id="1k-cents"),
+        pytest.param(1234.99, True, "$1,234.99", id="cents"),
+        pytest.param(1000.75, False, "$1,001", id="rounds-up"),
+        pytest.param(1000.25, False, "$1,000", id="rounds-down"),
+        pytest.param(0, False, "$0", id="zero"),
+    ])
+    def test_format_currency(self, value, show_cents, expected):
+        """Golden table of currency strings."""
+        assert format_currency(value, show_cents=show_cents) == expected
+
+
+    @pytest.mark.parametrize("show_cents", [
+        pytest.param(2, id="int"),
+        pytest.param(np.bool_(True), id="numpy-bool"),
+    ])
+    def test_truthy_show_cents(self, show_cents):
+        """Any truthy show_cents flag should show cents, as a plain True does."""
+        assert format_currency(1234.5, show_cents=show_cents) == "$1,234.50"
+        assert format_delta(np.float64(1234.5), show_cents=show_cents) == "+$1,234.50"
 
 
 class TestFormatPercentage:
     """Tests for format_percentage function."""
 
-    def test_format_percentage_basic(self):
-        """Basic percentage formatting."""
-        assert format_percentage(15.5) == "15.5%"
-        assert format_percentage(100) == "100.0%"
-
-    def test_format_percentage_custom_decimals(self):
-        """Custom decimal places."""
-        # Note: 15.555 is represented as ~15.5549999... in floating point
-        assert format_percentage(15.556, decimals=2) == "15.56%"
-        assert format_percentage(15.555, decimals=0) == "16%"
-
-    def test_format_percentage_zero(self):
-        """Zero percentage."""
-        assert format_percentage(0) == "0.0%"
+    # Note: 15.555 is represented as ~15.5549999... in floating point
+    @pytest.mark.parametrize("value,decimals,expected", [
+        pytest.param(15.5, 1, "15.5%", id="basic"),
+        pytest.param(100, 1, "100.0%", id="whole"),
+        pytest.param(15.556, 2, "15.56%", id="2-decimals"),
+        pytest.param(15.555, 0, "16%", id="0-decimals"),
+        pytest.param(0, 1, "0.0%", id="zero"),
+    ])
+    def test_format_percentage(self, value, decimals, expected):
+        """Golden table of percentage strings."""
+        assert format_percentage(value, decimals=decimals) == expected
 
 
 class TestFormatDelta:
     """Tests for format_delta function."""
 
-    def test_format_delta_positive(self):
-        """Positive delta should have plus sign."""
-        result = format_delta(1000)
-        assert result == "+$1,000"
+    @pytest.mark.parametrize("value,show_cents,expected", [
+        pytest.param(1000, False, "+$1,000", id="positive"),
+        pytest.param(1000.50, True, "+$1,000.50", id="positive-cents"),
+        pytest.param(0, False, "$0", id="zero"),
+    ])
+    def test_format_delta(self, value, show_cents, expected):
+        """Golden table of delta strings; only gains carry a plus sign."""
+        assert format_delta(value, show_cents=show_cents) == expected
 
-    def test_format_delta_negative(self):
-        """Negative delta should have minus sign."""
-        result = format_delta(-1000)
-        assert "-" in result
-        assert "1,000" in result
 
-    def test_format_delta_zero(self):
-        """Zero delta."""
-        result = format_delta(0)
-        assert "$0" in result
+class TestNegativeAmounts:
+    """Tests for negative values across the currency formatters."""
 
-    def test_format_delta_with_cents(self):
-        """Delta with cents."""
-        result = format_delta(1000.50, show_cents=True)
-        assert "+$1,000.50" == result
+    @pytest.mark.parametrize("formatter", [format_currency, format_delta])
+    def test_negative_values_show_sign(self, formatter):
+        """Negative amounts should show a minus sign or parentheses."""
+        result = formatter(-1000)
+        assert any(c in result for c in "-(")
+        assert "1,000" in result
 
 
 class TestAnnualMonthlyConversion:
@@ -102,4 +99,10 @@ class TestAnnualMonthlyConversion:
         original = 123456
         monthly = annual_to_monthly(original)
         back_to_annual = monthly_to_annual(monthly)
-        assert back_to_annual == pytest.approx(original, rel=0.001)
+        assert math.isclose(back_to_annual, original, rel_tol=1e-9)
+
+    def test_round_trip_conversion_batch(self):
+        """Conversions should broadcast over arrays and round-trip them."""
+        rng = np.random.default_rng(42)
+        values = rng.uniform(1, 1e8, size=10_000)
+        np.testing.assert_allclose(monthly_to_annual(annual_to_monthly(values)), values, rtol=1e-10)
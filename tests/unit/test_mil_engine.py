@@ -1,6 +1,8 @@
 """
 Unit tests for Military Compensation Engine (mil_engine.py)
 """
+import json
+import math
 import pytest
 from engines.mil_engine import (
     get_marginal_tax_rate,
@@ -8,64 +10,55 @@ from engines.mil_engine import (
     get_bas_rate,
     calculate_tax_advantage,
     calculate_rmc,
-    FEDERAL_TAX_BRACKETS
+    calculate_rmc_batch,
+    clear_caches,
+    SINGLE,
+    MARRIED
 )
 
 
+RMC_FIELDS = frozenset({
+    "base_pay_monthly",
+    "bah_monthly",
+    "bas_monthly",
+    "tax_advantage_monthly",
+    "total_monthly",
+    "taxable_monthly",
+    "nontaxable_monthly",
+    "bah_source"
+})
+
+
 class TestMarginalTaxRate:
     """Tests for get_marginal_tax_rate function."""
 
-    def test_marginal_rate_10_percent_single(self):
-        """Lowest bracket - income under $11,925."""
-        rate = get_marginal_tax_rate(10000, "single")
-        assert rate == 0.10
-
-    def test_marginal_rate_12_percent_single(self):
-        """Second bracket - $11,925 to $48,475."""
-        rate = get_marginal_tax_rate(30000, "single")
-        assert rate == 0.12
-
-    def test_marginal_rate_22_percent_single(self):
-        """Third bracket - $48,475 to $103,350."""
-        rate = get_marginal_tax_rate(80000, "single")
-        assert rate == 0.22
-
-    def test_marginal_rate_24_percent_single(self):
-        """Fourth bracket - $103,350 to $197,300."""
-        rate = get_marginal_tax_rate(150000, "single")
-        assert rate == 0.24
-
-    def test_marginal_rate_32_percent_single(self):
-        """Fifth bracket - $197,300 to $250,525."""
-        rate = get_marginal_tax_rate(220000, "single")
-        assert rate == 0.32
-
-    def test_marginal_rate_35_percent_single(self):
-        """Sixth bracket - $250,525 to $626,350."""
-        rate = get_marginal_tax_rate(500000, "single")
-        assert rate == 0.35
-
-    def test_marginal_rate_37_percent_single(self):
-        """Top bracket - over $626,350."""
-        rate = get_marginal_tax_rate(700000, "single")
-        assert rate == 0.37
-
-    def test_marginal_rate_married_12_percent(self):
-        """Married bracket - $23,850 to $96,950."""
-        rate = get_marginal_tax_rate(50000, "married")
-        assert rate == 0.12
-
-    def test_marginal_rate_married_22_percent(self):
-        """Married bracket - $96,950 to $206,700."""
-        rate = get_marginal_tax_rate(150000, "married")
-        assert rate == 0.22
-
-    def test_marginal_rate_case_insensitive(self):
-        """Filing status should be case insensitive."""
-        rate1 = get_marginal_tax_rate(50000, "SINGLE")
-        rate2 = get_marginal_tax_rate(50000, "single")
-        rate3 = get_marginal_tax_rate(50000, "Single")
-        assert rate1 == rate2 == rate3
+    @pytest.mark.parametrize("income,filing_status,expected", [
+        (10000, "single", 0.10),    # Lowest bracket - income under $11,925
+        (30000, "single", 0.12),    # $11,925 to $48,475
+        (80000, "single", 0.22),    # $48,475 to $103,350
+        (150000, "single", 0.24),   # $103,350 to $197,300
+        (220000, "single", 0.32),   # $197,300 to $250,525
+        (500000, "single", 0.35),   # $250,525 to $626,350
+        (700000, "single", 0.37),   # Top bracket - over $626,350
+        (50000, "married", 0.12),   # Married $23,850 to $96,950
+        (150000, "married", 0.22),  # Married $96,950 to $206,700
+        (0, "single", 0.10),        # Zero income is in the lowest bracket
+        (11925, "single", 0.10),    # Exactly at a bracket boundary stays in it
+        (50000, "single", 0.22),
+        (50000, "SINGLE", 0.22),    # Filing status is case insensitive
+        (50000, "Single", 0.22),
+    ])
+    def test_marginal_rate(self, income, filing_status, expected):
+        """Marginal rate should match the 2025 bracket for the income."""
+        assert get_marginal_tax_rate(income, filing_status) == expected
+
+    @pytest.mark.parametrize("status", [SINGLE, MARRIED])
+    def test_marginal_rate_at_every_limit(self, federal_brackets, status):
+        """Income at a bracket limit keeps that rate; a cent more moves up."""
+        rows = federal_brackets[status]
+        for (limit, rate), (_, next_rate) in zip(rows, rows[1:]):
+            assert get_marginal_tax_rate(limit, status) == rate
+            assert get_marginal_tax_rate(limit + 0.01, status) == next_rate
 
     def test_marginal_rate_invalid_status_defaults_single(self):
         """Invalid filing status should default to single brackets."""
@@ -73,17 +66,6 @@ class TestMarginalTaxRate:
         expected = get_marginal_tax_rate(50000, "single")
         assert rate == expected
 
-    def test_marginal_rate_zero_income(self):
-        """Zero income should return 10% (lowest bracket)."""
-        rate = get_marginal_tax_rate(0, "single")
-        assert rate == 0.10
-
-    def test_marginal_rate_boundary_exactly_at_bracket(self):
-        """Test exact bracket boundary."""
-        # At exactly $11,925, should still be in 10% bracket
-        rate = get_marginal_tax_rate(11925, "single")
-        assert rate == 0.10
-
 
 class TestBasePay:
     """Tests for get_base_pay function."""
@@ -136,6 +118,17 @@ class TestBasePay:
         # Just verify no crash
         assert pay_upper >= 0
 
+    def test_base_pay_is_memoized(self):
+        """Repeated lookups should hit the cache until caches are cleared."""
+        clear_caches()
+        first = get_base_pay("E-4", 3)
+        assert get_base_pay("E-4", 3) == first
+        assert get_base_pay.cache_info().hits == 1
+
+        clear_caches()
+        assert get_base_pay.cache_info().currsize == 0
+        assert get_base_pay("E-4", 3) == first
+
 
 class TestBASRate:
     """Tests for get_bas_rate function."""
@@ -150,15 +143,15 @@ class TestBASRate:
         bas = get_bas_rate("O-3")
         assert bas == 320.78
 
-    def test_bas_all_enlisted_ranks(self):
+    @pytest.mark.parametrize("rank", ["E-1", "E-2", "E-3", "E-4", "E-5", "E-6", "E-7", "E-8", "E-9"])
+    def test_bas_all_enlisted_ranks(self, rank):
         """All enlisted ranks get same BAS."""
-        for rank in ["E-1", "E-2", "E-3", "E-4", "E-5", "E-6", "E-7", "E-8", "E-9"]:
-            assert get_bas_rate(rank) == 465.77
+        assert get_bas_rate(rank) == 465.77
 
-    def test_bas_all_officer_ranks(self):
+    @pytest.mark.parametrize("rank", ["O-1", "O-2", "O-3", "O-4", "O-5", "O-6"])
+    def test_bas_all_officer_ranks(self, rank):
         """All officer ranks get same BAS."""
-        for rank in ["O-1", "O-2", "O-3", "O-4", "O-5", "O-6"]:
-            assert get_bas_rate(rank) == 320.78
+        assert get_bas_rate(rank) == 320.78
 
     def test_bas_case_insensitive(self):
         """BAS lookup should be case insensitive."""
@@ -202,61 +195,61 @@ class TestTaxAdvantage:
 class TestCalculateRMC:
     """Tests for calculate_rmc function (integration)."""
 
-    def test_rmc_returns_all_fields(self):
+    def test_rmc_returns_all_fields(self, e6_norfolk_rmc):
         """RMC should return all expected fields."""
-        result = calculate_rmc(
-            rank="E-6",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single"
-        )
+        result = e6_norfolk_rmc
+
+        missing = RMC_FIELDS - result.keys()
+        assert not missing, f"Missing fields: {missing}"
+
+    def test_rmc_attribute_and_key_access_agree(self, e6_norfolk_rmc):
+        """RMCResult fields should read the same as attributes and keys."""
+        result = e6_norfolk_rmc
+
+        assert result.as_dict() == dict(result)
+        assert result.total_monthly == result["total_monthly"]
+        with pytest.raises(KeyError):
+            result["fed_tax"]
+
+    def test_rmc_compares_equal_to_dict(self, e6_norfolk_rmc):
+        """RMCResult should compare equal to a dict with the same items, both ways."""
+        result = e6_norfolk_rmc
+        as_dict = result.as_dict()
+
+        assert result == as_dict
+        assert as_dict == result
+        assert result != {**as_dict, "total_monthly": -1}
+        assert json.loads(json.dumps(as_dict)) == result
+
+    def test_rmc_is_memoized(self):
+        """Repeated calls should share one result until caches are cleared."""
+        args = ("E-5", 4, "SAN DIEGO, CA", False, "single", 1800)
+        first = calculate_rmc(*args)
+        assert calculate_rmc(*args) is first
+
+        clear_caches()
+        assert calculate_rmc(*args) == first
 
-        expected_fields = [
-            "base_pay_monthly",
-            "bah_monthly",
-            "bas_monthly",
-            "tax_advantage_monthly",
-            "total_monthly",
-            "taxable_monthly",
-            "nontaxable_monthly",
-            "bah_source"
-        ]
-
-        for field in expected_fields:
-            assert field in result, f"Missing field: {field}"
-
-    def test_rmc_total_equals_sum(self):
+    def test_rmc_total_equals_sum(self, e6_norfolk_rmc):
         """Total monthly should equal sum of components."""
-        result = calculate_rmc(
-            rank="E-6",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single"
-        )
+        result = e6_norfolk_rmc
 
         expected_total = (
             result["base_pay_monthly"] +
             result["bah_monthly"] +
             result["bas_monthly"]
         )
-        assert result["total_monthly"] == pytest.approx(expected_total, rel=0.01)
+        assert math.isclose(result["total_monthly"], expected_total, rel_tol=1e-9)
 
-    def test_rmc_taxable_nontaxable_split(self):
+    def test_rmc_taxable_nontaxable_split(self, e6_norfolk_rmc):
         """Taxable + nontaxable should account for total (minus tax advantage)."""
-        result = calculate_rmc(
-            rank="E-6",
-            years_of_service=6,
-            location="NORFOLK/PORTSMOUTH, VA",
-            has_dependents=False,
-            filing_status="single"
-        )
+        result = e6_norfolk_rmc
 
         assert result["taxable_monthly"] == result["base_pay_monthly"]
-        assert result["nontaxable_monthly"] == pytest.approx(
+        assert math.isclose(
+            result["nontaxable_monthly"],
             result["bah_monthly"] + result["bas_monthly"],
-            rel=0.01
+            rel_tol=1e-9
         )
 
     def test_rmc_manual_bah_override(self):
@@ -273,9 +266,34 @@ class TestCalculateRMC:
         assert result["bah_monthly"] == 3000
         assert result["bah_source"] == "manual"
 
-    def test_rmc_officer_vs_enlisted(self):
+    def test_rmc_officer_vs_enlisted(self, e6_norfolk_rmc):
         """Officers should generally have higher RMC."""
-        enlisted = calculate_rmc("E-6", 6, "NORFOLK/PORTSMOUTH, VA", False, "single")
+        enlisted = e6_norfolk_rmc
         officer = calculate_rmc("O-4", 6, "NORFOLK/PORTSMOUTH, VA", False, "single")
 
         assert officer["base_pay_monthly"] > enlisted["base_pay_monthly"]
+
+
+class TestCalculateRMCBatch:
+    """Tests for calculate_rmc_batch (vectorized RMC)."""
+
+    def test_batch_matches_scalar_tax_advantage(self):
+        """Each batch row should match the scalar tax advantage."""
+        base = [3000, 4000, 8000, 5000, 12000]
+        bah = [1800, 2000, 2000, 2500, 3500]
+        bas = [465.77, 465.77, 320.78, 465.77, 320.78]
+        statuses = ["single", "single", "single", "married", "married"]
+
+        result = calculate_rmc_batch(base, bah, bas, statuses)
+
+        for i in range(len(base)):
+            expected = calculate_tax_advantage(base[i], bah[i], bas[i], statuses[i])
+            assert result["tax_advantage_monthly"][i] == pytest.approx(expected)
+
+    def test_batch_totals(self):
+        """Totals should split into taxable base pay and nontaxable allowances."""
+        result = calculate_rmc_batch([4000, 6000], [2000, 2500], [465.77, 320.78], ["single", "married"])
+
+        assert list(result["taxable_monthly"]) == [4000, 6000]
+        assert list(result["nontaxable_monthly"]) == pytest.approx([2465.77, 2820.78])
+        assert list(result["total_monthly"]) == pytest.approx([6465.77, 8820.78])
@@ -1,8 +1,13 @@
 """
 Unit tests for Offer Letter Parser (parser.py)
 """
+import re
+
 import pytest
-from ai.parser import parse_offer_text, _mock_parse
+from ai.parser import parse_offer_text, parse_offer_texts, _mock_parse, _FIELD_PATTERNS, _EQUITY_SHARES_PATTERNS
+
+
+MOCK_PATTERNS = [pattern for patterns in _FIELD_PATTERNS.values() for pattern in patterns] + list(_EQUITY_SHARES_PATTERNS)
 
 
 class TestMockParser:
@@ -147,6 +152,17 @@ class TestMockParser:
         result = _mock_parse("Base salary: $100,000")
         assert result["parse_method"] == "mock"
 
+    def test_parse_results_are_independent_copies(self):
+        """Mutating one parse result should not leak into the next parse."""
+        text = "Base Salary: $100,000"
+        first = _mock_parse(text)
+        first["base_salary"] = 1
+        first["extracted_fields"].append("bogus")
+
+        second = _mock_parse(text)
+        assert second["base_salary"] == 100000
+        assert second["extracted_fields"] == ["base_salary"]
+
 
 class TestParseOfferText:
     """Tests for main parse_offer_text function."""
@@ -181,6 +197,13 @@ class TestParseOfferText:
         assert result["sign_on_bonus"] == 25000
         assert result["annual_bonus_percent"] == 20
 
+    def test_parse_many_matches_single(self, sample_offer_letter_basic, sample_offer_letter_full):
+        """Batch parsing should equal parsing each letter on its own, in order."""
+        texts = [sample_offer_letter_full, "Base salary: $100,000", sample_offer_letter_basic, sample_offer_letter_full]
+        results = parse_offer_texts(texts)
+
+        assert results == [parse_offer_text(text) for text in texts]
+
 
 class TestParseEdgeCases:
     """Edge case tests for parser."""
@@ -217,3 +240,25 @@ class TestParseEdgeCases:
         text = "Base salary: $1,500,000"
         result = _mock_parse(text)
         assert result["base_salary"] == 1500000
+
+    @pytest.mark.parametrize("pattern", MOCK_PATTERNS, ids=lambda p: p.pattern)
+    def test_pattern_has_no_wildcard_or_nested_repeat(self, pattern):
+        """Patterns should avoid .* / .+ and repeated groups, the usual backtracking traps."""
+        source = pattern.pattern
+        assert '.*' not in source and '.+' not in source
+        assert not re.search(r'\)[*+]', source), "repeated group"
+
+    @pytest.mark.parametrize("pattern", MOCK_PATTERNS, ids=lambda p: p.pattern)
+    def test_pattern_start_is_anchored(self, pattern):
+        """
+        A pattern should start with a literal or a negative lookbehind, so a
+        long run that almost matches is scanned once rather than once per
+        start position (quadratic).
+        """
+        source = pattern.pattern
+        assert source[0].isalpha() or source.startswith('(?<!')
+
+    def test_parse_long_digit_run(self):
+        """A long digit run still yields its share count from the start of the run."""
+        result = _mock_parse("1," * 1000 + "0 rsus")
+        assert result["equity_shares"] == int("1" * 1000 + "0")
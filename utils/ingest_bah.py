@@ -3,10 +3,31 @@ BAH Data Ingestion Script
 Reads 2026 BAH Rate Excel files and generates bah_2026_real.json
 """
 import pandas as pd
+import argparse
+import hashlib
 import json
-import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# pandas reads through python-calamine (Rust) when it is installed and pandas
+# is 2.2 or newer (the first release with engine="calamine"), and through
+# its default openpyxl engine (read-only, values only) otherwise
+try:
+    import python_calamine  # noqa: F401
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+_EXCEL_ENGINE = "calamine" if _HAS_CALAMINE and _PANDAS_VERSION >= (2, 2) else "openpyxl"
+
 
 def normalize_rank(raw_rank: str) -> str:
     """
@@ -20,35 +41,138 @@ def normalize_rank(raw_rank: str) -> str:
     if raw_rank == 'MHA_NAME':
         return None
     
-    # Extract letter prefix (E, W, O)
-    match = re.match(r'^([EWO])(\d+)([A-Z]*)$', raw_rank)
-    if match:
-        prefix = match.group(1)
-        number = match.group(2).lstrip('0')  # Remove leading zeros
-        suffix = match.group(3)
-        return f"{prefix}-{number}{suffix}"
+    # Pay-grade letter (E, W, O), zero-padded digits, optional uppercase
+    # suffix. A single trailing newline is allowed and dropped.
+    prefix = raw_rank[0]
+    if prefix not in ('E', 'W', 'O'):
+        return raw_rank
     
-    return raw_rank
+    end = len(raw_rank) - raw_rank.endswith('\n')
+    i = 1
+    while i < end and raw_rank[i].isdecimal():
+        i += 1
+    
+    suffix = raw_rank[i:end]
+    if i == 1 or (suffix and not (suffix.isascii() and suffix.isalpha() and suffix.isupper())):
+        return raw_rank
+    
+    number = raw_rank[1:i].lstrip('0')  # Remove leading zeros
+    return f"{prefix}-{number}{suffix}"
+
+
+def _read_sheet(path: Path) -> pd.DataFrame:
+    """Reads a BAH rates workbook, using its second row as the header."""
+    return pd.read_excel(path, header=1, engine=_EXCEL_ENGINE)  # Skip first row, use row 2 as header
+
+
+def _read_sheets(*paths: Path) -> list:
+    """
+    Reads the workbooks. Under calamine, which parses in native code, each
+    workbook gets its own thread so the reads can overlap. openpyxl is
+    pure Python and would only contend for the GIL, so with it the
+    workbooks are read one after the other. Progress is printed
+    afterwards so it stays in path order.
+    """
+    if _EXCEL_ENGINE == "calamine":
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            frames = list(pool.map(_read_sheet, paths))
+    else:
+        frames = [_read_sheet(path) for path in paths]
+
+    for path, df in zip(paths, frames):
+        print(f"📂 Read: {path.name} ({_EXCEL_ENGINE})")
+        print(f"   Columns: {list(df.columns[:5])}...")  # Show first 5 columns
+        print(f"   Shape: {df.shape}")
+    return frames
+
+
+def _add_rates(locations: dict, df: pd.DataFrame, key: str) -> None:
+    """
+    Adds one sheet's rates to the nested locations dict under key
+    ("with_dep" or "no_dep").
+    The sheet is melted to one (location, rank, rate) row per non-blank
+    cell, so the Python loop only visits real rates. Rows stay in sheet
+    order and columns in header order, as in a row-by-row walk.
+    """
+    # Blank name cells read as NaN; they are skipped like empty names
+    names = df['MHA_NAME'].fillna('').str.strip()
+    df = df.assign(MHA_NAME=names)[~names.isin(('', 'MHA_NAME'))]
+
+    # Every location gets an entry, even a row with no rates
+    for location in df['MHA_NAME']:
+        locations.setdefault(location, {})
+
+    # Headers are normalized once per sheet rather than once per cell, and
+    # normalize_rank's None drops the MHA columns. Interning gives every
+    # cell of a rank the same key object instead of one string per cell.
+    col_to_rank = {col: sys.intern(rank) for col in df.columns if (rank := normalize_rank(col))}
+    long = (
+        df.melt(id_vars='MHA_NAME', value_vars=list(col_to_rank), var_name='rank_raw', value_name='rate', ignore_index=False)
+        .dropna(subset=['rate'])
+        .sort_index(kind='stable')
+    )
+    long['rank'] = long['rank_raw'].map(col_to_rank)
+    long['rate'] = long['rate'].astype('int32')
+
+    for location, rank, rate in long[['MHA_NAME', 'rank', 'rate']].itertuples(index=False, name=None):
+        locations[location].setdefault(rank, {})[key] = rate
+
+
+def _source_hash(*paths: Path) -> str:
+    """SHA-256 over the bytes of the source workbooks, in order."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _existing_build(output_path: Path) -> tuple:
+    """(source_hash, compact) recorded in a previous output, or Nones."""
+    try:
+        with open(output_path, 'r') as f:
+            existing = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None, None
+    return existing.get("source_hash"), existing.get("compact")
 
 
-def ingest_bah_data():
+def _write_json(data: dict, path: Path, compact: bool) -> None:
+    """
+    Writes data as JSON, through orjson when it is installed. Output is
+    indented for reading unless compact is set.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2))
+        return
+
+    with open(path, 'w') as f:
+        if compact:
+            json.dump(data, f, separators=(',', ':'))
+        else:
+            json.dump(data, f, indent=2)
+
+
+def ingest_bah_data(force: bool = False, compact: bool = False):
     """
     Main ingestion function.
     Reads both Excel files and creates master JSON.
+    Skips the rebuild when the output already records the same source
+    hash and compact setting, unless force is set; compact drops the
+    JSON indentation.
     """
     project_root = Path(__file__).parent.parent
     with_file = project_root / "2026 BAH Rates - With.xlsx"
     without_file = project_root / "2026 BAH Rates - Without.xlsx"
+    output_path = project_root / "src" / "data" / "bah_2026_real.json"
     
-    print(f"📂 Reading: {with_file.name}")
-    df_with = pd.read_excel(with_file, header=1)  # Skip first row, use row 2 as header
-    print(f"   Columns: {list(df_with.columns[:5])}...")  # Show first 5 columns
-    print(f"   Shape: {df_with.shape}")
+    source_hash = _source_hash(with_file, without_file)
+    if not force and _existing_build(output_path) == (source_hash, compact):
+        print(f"✅ {output_path.name} is up to date with the source workbooks - nothing to do")
+        return
     
-    print(f"📂 Reading: {without_file.name}")
-    df_without = pd.read_excel(without_file, header=1)  # Skip first row, use row 2 as header
-    print(f"   Columns: {list(df_without.columns[:5])}...")
-    print(f"   Shape: {df_without.shape}")
+    df_with, df_without = _read_sheets(with_file, without_file)
     
     # Master dictionary
     bah_data = {
@@ -56,67 +180,21 @@ def ingest_bah_data():
         "year": 2026,
         "data_source": "Official DoD 2026 BAH Rates (DFAS)",
         "note": "Complete dataset - all duty stations, all ranks",
+        "source_hash": source_hash,
+        "compact": compact,
         "locations": {}
     }
     
     print(f"\n🔄 Processing {len(df_with)} locations...")
     
-    # Process WITH dependents
-    for idx, row in df_with.iterrows():
-        location = row.get('MHA_NAME', '').strip()
-        if not location or location == 'MHA_NAME':
-            continue
-        
-        if location not in bah_data["locations"]:
-            bah_data["locations"][location] = {}
-        
-        # Process all rank columns
-        for col in df_with.columns:
-            if col == 'MHA' or col == 'MHA_NAME':
-                continue
-            
-            normalized_rank = normalize_rank(col)
-            if not normalized_rank:
-                continue
-            
-            rate = row.get(col)
-            if pd.notna(rate):
-                if normalized_rank not in bah_data["locations"][location]:
-                    bah_data["locations"][location][normalized_rank] = {}
-                
-                bah_data["locations"][location][normalized_rank]["with_dep"] = int(rate)
-    
-    # Process WITHOUT dependents
-    for idx, row in df_without.iterrows():
-        location = row.get('MHA_NAME', '').strip()
-        if not location or location == 'MHA_NAME':
-            continue
-        
-        if location not in bah_data["locations"]:
-            bah_data["locations"][location] = {}
-        
-        # Process all rank columns
-        for col in df_without.columns:
-            if col == 'MHA' or col == 'MHA_NAME':
-                continue
-            
-            normalized_rank = normalize_rank(col)
-            if not normalized_rank:
-                continue
-            
-            rate = row.get(col)
-            if pd.notna(rate):
-                if normalized_rank not in bah_data["locations"][location]:
-                    bah_data["locations"][location][normalized_rank] = {}
-                
-                bah_data["locations"][location][normalized_rank]["no_dep"] = int(rate)
+    # Process WITH dependents, then WITHOUT
+    _add_rates(bah_data["locations"], df_with, "with_dep")
+    _add_rates(bah_data["locations"], df_without, "no_dep")
     
     # Save to JSON
-    output_path = project_root / "src" / "data" / "bah_2026_real.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(bah_data, f, indent=2)
+    _write_json(bah_data, output_path, compact)
     
     print(f"\n✅ SUCCESS!")
     print(f"📊 Locations processed: {len(bah_data['locations'])}")
@@ -132,4 +210,8 @@ def ingest_bah_data():
 
 
 if __name__ == "__main__":
-    ingest_bah_data()
+    parser = argparse.ArgumentParser(description="Build bah_2026_real.json from the 2026 BAH rate workbooks.")
+    parser.add_argument("--compact", action="store_true", help="write JSON without indentation")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the workbooks are unchanged")
+    args = parser.parse_args()
+    ingest_bah_data(force=args.force, compact=args.compact)